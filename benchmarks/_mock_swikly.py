@@ -0,0 +1,65 @@
+"""In-process stand-in for the ``/accounts/{id}/requests`` family of the Swikly API.
+
+Response bodies are serialised once up front, so benchmarks measure the SDK and
+not the mock.
+"""
+from __future__ import annotations
+
+import json
+import re
+from typing import Dict, Tuple
+
+import httpx
+
+from _payloads import request, requests_page_bytes
+
+_LIST = re.compile(r"^/v1/accounts/[^/]+/requests/?$")
+_ONE = re.compile(r"^/v1/accounts/[^/]+/requests/([^/]+)(/[a-z_]+)?$")
+
+
+class MockSwikly:
+    """``transport`` serves ``pages`` pages of ``per_page`` requests plus get/create/actions.
+
+    Set ``throttle`` to answer that many gets of request ``throttled`` with a 429.
+    """
+
+    def __init__(self, *, pages: int = 10, per_page: int = 100) -> None:
+        self.pages = pages
+        self.per_page = per_page
+        self.calls = 0
+        self.throttle = 0
+        self._pages: Dict[int, bytes] = {
+            p: requests_page_bytes(page=p, per_page=per_page, last_page=pages) for p in range(1, pages + 1)
+        }
+        self._one = json.dumps({"request": request(1)}).encode()
+        self.transport = httpx.MockTransport(self._handle)
+
+    def _handle(self, req: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        path = req.url.path
+        if _LIST.match(path):
+            if req.method == "POST":
+                return _json(self._one)
+            page = int(req.url.params.get("page", "1"))
+            return _json(self._pages.get(page, self._pages[self.pages]))
+        one = _ONE.match(path)
+        if one:
+            if one.group(1) == "throttled" and self.throttle > 0:
+                self.throttle -= 1
+                return httpx.Response(429, headers={"Retry-After": "1"}, json={"message": "Too Many Attempts."})
+            return _json(self._one)
+        return httpx.Response(404, json={"message": "Not found"})
+
+
+def _json(body: bytes) -> httpx.Response:
+    return httpx.Response(200, content=body, headers={"Content-Type": "application/json"})
+
+
+def signed_delivery(secret: str, i: int, ts: int, body_size: int = 0) -> Tuple[str, bytes]:
+    """A signed webhook delivery, its body padded with spaces to ``body_size`` bytes."""
+    import hashlib
+    import hmac
+
+    body = json.dumps({"event": "requestSecured", "request": request(i)}).encode().ljust(body_size)
+    sig = hmac.new(secret.encode(), f"{ts}.".encode() + body, hashlib.sha256).hexdigest()
+    return f"t={ts},sha256={sig}", body
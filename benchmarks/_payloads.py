@@ -0,0 +1,86 @@
+"""Realistic Swikly response bodies shared by the benchmarks."""
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List
+
+_REFUNDS = {"refundableAmount": 0, "pendingRefundAmount": 0, "refundedAmount": 0}
+_RECLAIMS = {
+    "reclaimableAmount": 12000,
+    "plannedRequestedAmount": 0,
+    "maximumReclaimCreationDate": "2026-07-12",
+    "pendingRequestedAmount": 0,
+    "pendingReclaimedAmount": 0,
+    "reclaimedAmount": 0,
+    "estimatedFinishDate": None,
+    "cancelableAmount": 0,
+    "irrecoverableAmount": 0,
+    "irrecoverabilityCertificates": [],
+}
+
+
+def request(i: int) -> Dict[str, Any]:
+    rid = f"9b1c3f4e-{i:04d}-4c1a-9a7e-2f1d3c4b5a6e"
+    return {
+        "id": rid,
+        "accountId": "acc-1",
+        "link": f"https://swik.link/{i}",
+        "description": f"Booking #{i}",
+        "createdAt": "2026-06-01T10:00:00+00:00",
+        "customId": f"booking-{i}",
+        "firstName": "John",
+        "lastName": "Doe",
+        "email": f"john{i}@example.com",
+        "phoneNumber": "+33600000000",
+        "releasable": True,
+        "cancelable": False,
+        "deposit": {
+            "id": f"dep-{i}",
+            "requestId": rid,
+            "amount": 12000,
+            "amountToBeSecured": 12000,
+            "securedAmount": 12000,
+            "status": "Secured",
+            "startDate": "2026-06-10",
+            "endDate": "2026-06-12",
+            "expirationDate": "2026-07-12",
+            "acceptedAt": "2026-06-02T10:00:00+00:00",
+            "createdAt": "2026-06-01T10:00:00+00:00",
+            "reclaimSummary": dict(_RECLAIMS),
+            "refundSummary": dict(_REFUNDS),
+        },
+        "noShow": {
+            "id": f"ns-{i}",
+            "requestId": rid,
+            "reservationDate": "2026-06-10",
+            "amount": 5000,
+            "amountToBeSecured": 5000,
+            "securedAmount": 5000,
+            "status": "Secured",
+            "createdAt": "2026-06-01T10:00:00+00:00",
+            "reclaimSummary": dict(_RECLAIMS),
+            "refundSummary": dict(_REFUNDS),
+        },
+        "payment": {
+            "id": f"pay-{i}",
+            "requestId": rid,
+            "amount": 3000,
+            "amountToBePaid": 0,
+            "amountPaid": 3000,
+            "status": "Succeeded",
+            "succeededAt": "2026-06-02T10:00:00+00:00",
+            "createdAt": "2026-06-01T10:00:00+00:00",
+            "refundSummary": dict(_REFUNDS),
+        },
+    }
+
+
+def requests_page(page: int = 1, per_page: int = 100, last_page: int = 1) -> Dict[str, Any]:
+    start = (page - 1) * per_page
+    items: List[Dict[str, Any]] = [request(start + i) for i in range(per_page)]
+    meta = {"currentPage": page, "lastPage": last_page, "perPage": per_page, "path": "/requests", "total": last_page * per_page}
+    return {"requests": items, "meta": meta}
+
+
+def requests_page_bytes(page: int = 1, per_page: int = 100, last_page: int = 1) -> bytes:
+    return json.dumps(requests_page(page, per_page, last_page)).encode()
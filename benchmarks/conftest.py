@@ -0,0 +1,32 @@
+"""Shared fixtures for ``pytest benchmarks``; skipped when pytest-benchmark is missing."""
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from _mock_swikly import MockSwikly  # noqa: E402
+
+from swikly import AsyncSwiklyClient, SwiklyClient  # noqa: E402
+
+
+@pytest.fixture
+def mock_swikly() -> MockSwikly:
+    return MockSwikly()
+
+
+@pytest.fixture
+def client(mock_swikly: MockSwikly):
+    client = SwiklyClient(token="bench", transport=mock_swikly.transport)
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def async_client_factory(mock_swikly: MockSwikly):
+    return lambda **kwargs: AsyncSwiklyClient(token="bench", transport=mock_swikly.transport, **kwargs)
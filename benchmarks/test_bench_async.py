@@ -0,0 +1,69 @@
+"""Async fan-out scaling and prefetching pagination."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+CALLS = 200
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.mark.parametrize("concurrency", [1, 10, 50])
+def test_fan_out_gets(benchmark, loop, async_client_factory, concurrency):
+    client = async_client_factory()
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> None:
+        async with sem:
+            await client.requests.aget(account_id="acc-1", request_id=f"r{i}")
+
+    async def fan_out() -> None:
+        await asyncio.gather(*(one(i) for i in range(CALLS)))
+
+    benchmark.extra_info["calls"] = CALLS
+    benchmark(lambda: loop.run_until_complete(fan_out()))
+    loop.run_until_complete(client.aclose())
+
+
+@pytest.mark.parametrize("backing_off", [False, True], ids=["baseline", "backing-off"])
+def test_fan_out_while_one_call_backs_off(benchmark, loop, async_client_factory, mock_swikly, backing_off):
+    # A call sleeping out a 429's Retry-After must not hold up the others.
+    client = async_client_factory()
+    sem = asyncio.Semaphore(50)
+
+    async def one(i: int) -> None:
+        async with sem:
+            await client.requests.aget(account_id="acc-1", request_id=f"r{i}")
+
+    async def fan_out() -> None:
+        throttled = None
+        if backing_off:
+            mock_swikly.throttle = 1
+            throttled = asyncio.ensure_future(client.requests.aget(account_id="acc-1", request_id="throttled"))
+            await asyncio.sleep(0)
+        await asyncio.gather(*(one(i) for i in range(CALLS)))
+        if throttled is not None:
+            throttled.cancel()
+            await asyncio.gather(throttled, return_exceptions=True)
+
+    benchmark.extra_info["calls"] = CALLS
+    benchmark(lambda: loop.run_until_complete(fan_out()))
+    loop.run_until_complete(client.aclose())
+
+
+@pytest.mark.parametrize("prefetch", [0, 4])
+def test_aiter_all_pages(benchmark, loop, async_client_factory, mock_swikly, prefetch):
+    client = async_client_factory()
+
+    async def walk() -> int:
+        return len([r async for r in client.requests.aiter_all(account_id="acc-1", prefetch=prefetch)])
+
+    assert benchmark(lambda: loop.run_until_complete(walk())) == mock_swikly.pages * mock_swikly.per_page
+    loop.run_until_complete(client.aclose())
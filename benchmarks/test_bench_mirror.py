@@ -0,0 +1,28 @@
+"""Local reads from a synced request mirror."""
+from __future__ import annotations
+
+import pytest
+from _payloads import request
+
+from swikly.mirror import RequestMirror, _request_rows
+
+ROWS = 5000
+
+
+@pytest.fixture(scope="module")
+def mirror():
+    mirror = RequestMirror(None)
+    mirror.store.upsert([row for i in range(ROWS) for row in _request_rows(request(i))])
+    yield mirror
+    mirror.close()
+
+
+@pytest.mark.parametrize("decode", ["json", "raw"])
+def test_get_request(benchmark, mirror, decode):
+    mirror.decode = decode
+    benchmark(mirror.get_request, request(ROWS // 2)["id"])
+
+
+def test_get_request_by_custom_id(benchmark, mirror):
+    mirror.decode = "json"
+    benchmark(mirror.get_request_by_custom_id, "acc-1", f"booking-{ROWS // 2}")
@@ -0,0 +1,71 @@
+"""Request construction, decoding and pagination for the requests endpoints."""
+from __future__ import annotations
+
+import httpx
+import pytest
+from _payloads import requests_page_bytes
+
+from swikly import SwiklyClient
+from swikly.decoding import DECODE_MODES, decode_response
+from swikly.models import RequestsListResponse
+from swikly.resources.requests import _payload_for_create
+
+CREATE_KWARGS = {
+    "description": "Booking #42",
+    "language": "fr",
+    "custom_id": "booking-42",
+    "first_name": "John",
+    "last_name": "Doe",
+    "email": "john@example.com",
+    "deposit": {"amount": 12000, "startDate": "2026-06-10", "endDate": "2026-06-12"},
+}
+
+
+def test_payload_for_create(benchmark):
+    benchmark(_payload_for_create, CREATE_KWARGS)
+
+
+def test_auth_headers(benchmark, client):
+    benchmark(client._auth_headers)
+
+
+@pytest.mark.parametrize("overrides", [None, {"X-Trace": "1"}], ids=["plain", "override"])
+@pytest.mark.parametrize("pool", ["owned", "shared"])
+def test_request_headers(benchmark, mock_swikly, pool, overrides):
+    shared = httpx.Client(transport=mock_swikly.transport) if pool == "shared" else None
+    if shared is None:
+        client = SwiklyClient(token="bench", transport=mock_swikly.transport)
+    else:
+        client = SwiklyClient(token="bench", http_client=shared)
+    try:
+        benchmark(client._request_headers, overrides)
+    finally:
+        client.close()
+        if shared is not None:
+            shared.close()
+
+
+@pytest.mark.parametrize("mode", DECODE_MODES)
+@pytest.mark.parametrize("per_page", [100, 500])
+def test_decode_requests_page(benchmark, mode, per_page):
+    body = requests_page_bytes(per_page=per_page)
+    benchmark.extra_info["kib"] = len(body) // 1024
+    # A fresh response per round so every mode pays for parsing the body.
+    benchmark(lambda: decode_response(httpx.Response(200, content=body), RequestsListResponse, mode))
+
+
+def test_get_request_round_trip(benchmark, client):
+    benchmark(client.requests.get, account_id="acc-1", request_id="r1")
+
+
+def test_create_request_round_trip(benchmark, client):
+    benchmark(client.requests.create, account_id="acc-1", **CREATE_KWARGS)
+
+
+def test_iter_all_pages(benchmark, client, mock_swikly):
+    def walk() -> int:
+        return sum(1 for _ in client.requests.iter_all(account_id="acc-1", per_page=mock_swikly.per_page))
+
+    count = benchmark(walk)
+    assert count == mock_swikly.pages * mock_swikly.per_page
+    benchmark.extra_info["items"] = count
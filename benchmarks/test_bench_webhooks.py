@@ -0,0 +1,45 @@
+"""Webhook verification throughput (one delivery per call vs. batches)."""
+from __future__ import annotations
+
+import pytest
+from _mock_swikly import signed_delivery
+
+from swikly import WebhookProcessor
+from swikly.webhooks import verify_many, verify_swikly_signature
+
+SECRET = "whsec_benchmark"
+NOW = 1739352941
+DELIVERIES = [signed_delivery(SECRET, i, NOW - i) for i in range(200)]
+
+
+def test_verify_single(benchmark):
+    header, body = DELIVERIES[0]
+    assert benchmark(verify_swikly_signature, secret=SECRET, signature_header=header, raw_body=body, now=NOW)
+
+
+@pytest.mark.parametrize("max_workers", [0, 4])
+@pytest.mark.parametrize("body_size", [256, 64 * 1024])
+def test_verify_batch(benchmark, body_size, max_workers):
+    deliveries = [signed_delivery(SECRET, i, NOW - i, body_size) for i in range(len(DELIVERIES))]
+    benchmark.extra_info["deliveries"] = len(deliveries)
+    assert all(benchmark(lambda: list(verify_many(SECRET, deliveries, now=NOW, max_workers=max_workers))))
+
+
+@pytest.mark.parametrize("body_size", [256, 64 * 1024])
+def test_verify_batch_one_call_each(benchmark, body_size):
+    deliveries = [signed_delivery(SECRET, i, NOW - i, body_size) for i in range(len(DELIVERIES))]
+
+    def verify_each() -> bool:
+        return all(
+            verify_swikly_signature(secret=SECRET, signature_header=header, raw_body=body, now=NOW)
+            for header, body in deliveries
+        )
+
+    benchmark.extra_info["deliveries"] = len(deliveries)
+    assert benchmark(verify_each)
+
+
+def test_processor_verify_and_parse(benchmark):
+    processor = WebhookProcessor(SECRET)
+    header, body = DELIVERIES[0]
+    benchmark(processor.process, header, body, now=NOW)
@@ -1,4 +1,4 @@
-from .client import SwiklyClient, AsyncSwiklyClient
+from .client import SwiklyClient, AsyncSwiklyClient, create_async_http_client, create_http_client
 from .errors import (
     SwiklyError,
     SwiklyAPIError,
@@ -6,7 +6,25 @@ from .errors import (
     SwiklyRateLimitError,
     SwiklyValidationError,
     SwiklyNotFoundError,
+    SwiklyCircuitOpenError,
+    SwiklyDeadlineExceededError,
+    SwiklyUploadNotReplayableError,
 )
+from .batch import BatchResult
+from .circuit import CircuitBreaker
+from .columnar import ColumnarRows, RowView
+from .deadline import deadline_scope
+from .cache import CacheBackend, CacheStats, InMemoryCache, ResponseCache
+from .decoding import DecodeMode
+from .hedging import HedgePolicy, HedgeStats
+from .idempotency import IdempotencyMode
+from .index import CustomIdIndex, IndexStats
+from .instrumentation import AttemptInfo, ClientHooks, DecodeInfo, OpenTelemetryHooks, PrometheusHooks
+from .mirror import MirrorRow, MirrorStore, RequestMirror, SQLiteMirrorStore, SyncCursor
+from .pool import AsyncSwiklyClientPool, SwiklyClientPool
+from .ratelimit import RateLimiter, TokenBucketRateLimiter
+from .retry import RetryBudget, RetryPolicy
+from .singleflight import CoalesceStats, RequestCoalescer
 from .models import (
     User,
     Account,
@@ -19,17 +37,53 @@ from .models import (
     File,
     ShortLink,
     ResultsMeta,
+    WebhookEvent,
 )
+from .replay import InMemoryReplayStore, RedisReplayStore, ReplayStore
+from .webhook_processor import WebhookProcessor
 
 __all__ = [
     "SwiklyClient",
     "AsyncSwiklyClient",
+    "create_http_client",
+    "create_async_http_client",
+    "SwiklyClientPool",
+    "AsyncSwiklyClientPool",
     "SwiklyError",
     "SwiklyAPIError",
     "SwiklyAuthError",
     "SwiklyRateLimitError",
     "SwiklyValidationError",
     "SwiklyNotFoundError",
+    "SwiklyCircuitOpenError",
+    "SwiklyDeadlineExceededError",
+    "SwiklyUploadNotReplayableError",
+    "deadline_scope",
+    "RetryPolicy",
+    "RetryBudget",
+    "BatchResult",
+    "CircuitBreaker",
+    "HedgePolicy",
+    "HedgeStats",
+    "ClientHooks",
+    "AttemptInfo",
+    "DecodeInfo",
+    "OpenTelemetryHooks",
+    "PrometheusHooks",
+    "RateLimiter",
+    "TokenBucketRateLimiter",
+    "DecodeMode",
+    "ColumnarRows",
+    "RowView",
+    "IdempotencyMode",
+    "CustomIdIndex",
+    "IndexStats",
+    "ResponseCache",
+    "CacheBackend",
+    "InMemoryCache",
+    "CacheStats",
+    "RequestCoalescer",
+    "CoalesceStats",
     "User",
     "Account",
     "Request",
@@ -41,4 +95,14 @@ __all__ = [
     "File",
     "ShortLink",
     "ResultsMeta",
+    "WebhookEvent",
+    "WebhookProcessor",
+    "RequestMirror",
+    "MirrorStore",
+    "MirrorRow",
+    "SQLiteMirrorStore",
+    "SyncCursor",
+    "ReplayStore",
+    "InMemoryReplayStore",
+    "RedisReplayStore",
 ]
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import dataclasses
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Generic,
+    Iterable,
+    Iterator,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+from .errors import SwiklyRateLimitError
+from .retry import RetryPolicy, _policy_override
+from .utils import _asleep, _sleep
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Used when a 429 carries no usable Retry-After.
+_DEFAULT_PAUSE = 1.0
+
+
+@dataclass
+class BatchResult(Generic[R]):
+    """Outcome of one item of a batch; exactly one of ``result``/``error`` is set."""
+
+    index: int
+    result: Optional[R] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class _RetryAfterGate:
+    """Pause point shared by every worker of a batch.
+
+    When any call is rate limited, all workers hold off until the server's
+    Retry-After has elapsed instead of each discovering the limit on its own.
+    """
+
+    def __init__(self) -> None:
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+    def remaining(self) -> float:
+        return max(0.0, self._resume_at - time.monotonic())
+
+
+def _batch_policy(policy: RetryPolicy) -> RetryPolicy:
+    # 429s must surface to the gate rather than be slept on inside a single call.
+    return dataclasses.replace(policy, max_retry_after=0)
+
+
+def _pause_for(exc: SwiklyRateLimitError) -> float:
+    return float(exc.retry_after) if exc.retry_after else _DEFAULT_PAUSE
+
+
+def run_batch(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    policy: RetryPolicy,
+    concurrency: int = 8,
+    ordered: bool = True,
+    max_rate_limit_retries: int = 3,
+) -> Iterator[BatchResult[R]]:
+    """Run ``fn`` over ``items`` on a thread pool with at most ``concurrency`` calls in flight.
+
+    Items are pulled lazily, so only a bounded window of inputs and results is
+    held at any time. With ``ordered=False`` results are yielded as they complete.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    gate = _RetryAfterGate()
+    batch_policy = _batch_policy(policy)
+
+    def call(item: T) -> R:
+        token = _policy_override.set(batch_policy)
+        try:
+            attempts = 0
+            while True:
+                wait_for = gate.remaining()
+                if wait_for > 0:
+                    _sleep(wait_for)
+                try:
+                    return fn(item)
+                except SwiklyRateLimitError as e:
+                    if attempts >= max_rate_limit_retries:
+                        raise
+                    gate.pause(_pause_for(e))
+                    attempts += 1
+        finally:
+            _policy_override.reset(token)
+
+    def outcome(index: int, future: "Future[R]") -> BatchResult[R]:
+        exc = future.exception()
+        if exc is not None:
+            return BatchResult(index=index, error=exc)
+        return BatchResult(index=index, result=future.result())
+
+    source = enumerate(items)
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        if ordered:
+            window: Deque[Tuple[int, "Future[R]"]] = deque()
+            for index, item in source:
+                window.append((index, pool.submit(contextvars.copy_context().run, call, item)))
+                if len(window) >= concurrency * 2:
+                    yield outcome(*window.popleft())
+            while window:
+                yield outcome(*window.popleft())
+            return
+
+        in_flight: dict["Future[R]", int] = {}
+        for index, item in source:
+            in_flight[pool.submit(contextvars.copy_context().run, call, item)] = index
+            if len(in_flight) >= concurrency:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield outcome(in_flight.pop(future), future)
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield outcome(in_flight.pop(future), future)
+
+
+async def arun_batch(
+    fn: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    *,
+    policy: RetryPolicy,
+    concurrency: int = 8,
+    ordered: bool = True,
+    max_rate_limit_retries: int = 3,
+) -> AsyncIterator[BatchResult[R]]:
+    """Async counterpart of :func:`run_batch` using tasks instead of threads."""
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    gate = _RetryAfterGate()
+    batch_policy = _batch_policy(policy)
+
+    async def call(index: int, item: T) -> BatchResult[R]:
+        _policy_override.set(batch_policy)  # task-local: each task runs in its own context copy
+        attempts = 0
+        while True:
+            wait_for = gate.remaining()
+            if wait_for > 0:
+                await _asleep(wait_for)
+            try:
+                return BatchResult(index=index, result=await fn(item))
+            except SwiklyRateLimitError as e:
+                if attempts >= max_rate_limit_retries:
+                    return BatchResult(index=index, error=e)
+                gate.pause(_pause_for(e))
+                attempts += 1
+            except Exception as e:
+                return BatchResult(index=index, error=e)
+
+    source = enumerate(items)
+    if ordered:
+        window: Deque["asyncio.Task[BatchResult[R]]"] = deque()
+        sem = asyncio.Semaphore(concurrency)
+
+        async def bounded(index: int, item: T) -> BatchResult[R]:
+            async with sem:
+                return await call(index, item)
+
+        try:
+            for index, item in source:
+                window.append(asyncio.ensure_future(bounded(index, item)))
+                if len(window) >= concurrency * 2:
+                    yield await window.popleft()
+            while window:
+                yield await window.popleft()
+        finally:
+            for task in window:
+                task.cancel()
+        return
+
+    in_flight: Set["asyncio.Task[BatchResult[R]]"] = set()
+    try:
+        for index, item in source:
+            in_flight.add(asyncio.ensure_future(call(index, item)))
+            if len(in_flight) >= concurrency:
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        while in_flight:
+            done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in in_flight:
+            task.cancel()
@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Pattern, Set, Tuple
+
+import httpx
+
+from .utils import _compile_path_template
+
+# Endpoints cached when no ``ttls`` are given: users.me(), accounts.list() and requests.get().
+DEFAULT_TTLS: Dict[str, float] = {
+    "/me": 300.0,
+    "/accounts": 300.0,
+    "/accounts/{account_id}/requests/{request_id}": 30.0,
+}
+
+_ACCOUNT_PATH = re.compile(r"^/accounts/([^/?]+)")
+# The cached body is already decoded, so these no longer describe it.
+_DROPPED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+@dataclass
+class CacheEntry:
+    status_code: int
+    headers: List[Tuple[str, str]]
+    content: bytes
+    fresh_until: float  # wall clock, so entries can live in external backends
+    tags: Tuple[str, ...] = ()
+
+    @property
+    def etag(self) -> Optional[str]:
+        return _header(self.headers, "etag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return _header(self.headers, "last-modified")
+
+    def to_response(self, url: str) -> httpx.Response:
+        return httpx.Response(
+            self.status_code,
+            headers=self.headers,
+            content=self.content,
+            request=httpx.Request("GET", url),
+        )
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    revalidations: int = 0
+    evictions: int = 0
+
+
+class CacheBackend(ABC):
+    """Storage behind :class:`ResponseCache`.
+
+    Subclass to keep entries in Redis, memcached, ...; entries are plain
+    dataclasses of bytes and strings. ``evictions`` counts entries dropped to
+    honour a size bound.
+    """
+
+    evictions: int = 0
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CacheEntry]:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        ...
+
+    @abstractmethod
+    def invalidate(self, tag: str) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+
+class InMemoryCache(CacheBackend):
+    """Thread-safe LRU holding at most ``maxsize`` responses."""
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.maxsize = maxsize
+        self.evictions = 0
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._tags: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = entry
+            for tag in entry.tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.maxsize:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self.evictions += 1
+
+    def invalidate(self, tag: str) -> None:
+        with self._lock:
+            for key in self._tags.pop(tag, set()):
+                self._drop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry.tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+@dataclass
+class _Lookup:
+    key: str
+    ttl: float
+    tags: Tuple[str, ...]
+    entry: Optional[CacheEntry] = None
+    fresh: bool = False
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+        if self.entry is None:
+            return headers
+        if self.entry.etag:
+            headers["If-None-Match"] = self.entry.etag
+        if self.entry.last_modified:
+            headers["If-Modified-Since"] = self.entry.last_modified
+        return headers
+
+
+class ResponseCache:
+    """Read-through cache for GET responses, keyed per credentials, path and query.
+
+    ``ttls`` maps path templates (``{name}`` matches one segment) to seconds of
+    freshness. Stale entries carrying an ETag or Last-Modified are revalidated
+    with ``If-None-Match``/``If-Modified-Since`` and refreshed on 304.
+    Any successful mutation under ``/accounts/{id}`` drops every cached
+    response of that account, because e.g. a deposit update changes the
+    embedding request too.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None, *, ttls: Optional[Mapping[str, float]] = None) -> None:
+        self.backend = backend if backend is not None else InMemoryCache()
+        self._rules: List[Tuple[Pattern[str], float]] = [
+            (_compile_path_template(template), float(ttl)) for template, ttl in (ttls or DEFAULT_TTLS).items()
+        ]
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                revalidations=self._stats.revalidations,
+                evictions=self.backend.evictions,
+            )
+
+    def lookup(self, namespace: str, path: str, params: Optional[Mapping[str, Any]]) -> Optional[_Lookup]:
+        """Return the cache slot for a GET, or None if the endpoint is not cached."""
+        ttl = self._ttl_for(path)
+        if ttl is None:
+            return None
+        query = "&".join(f"{k}={params[k]}" for k in sorted(params)) if params else ""
+        lookup = _Lookup(key=f"{namespace}|{path}?{query}", ttl=ttl, tags=(_tag(namespace, path),))
+        lookup.entry = self.backend.get(lookup.key)
+        lookup.fresh = lookup.entry is not None and lookup.entry.fresh_until > time.time()
+        with self._lock:
+            if lookup.fresh:
+                self._stats.hits += 1
+            else:
+                self._stats.misses += 1
+        return lookup
+
+    def store(self, lookup: _Lookup, resp: httpx.Response) -> None:
+        if not 200 <= resp.status_code < 300 or "no-store" in resp.headers.get("Cache-Control", ""):
+            return
+        entry = CacheEntry(
+            status_code=resp.status_code,
+            headers=[(k, v) for k, v in resp.headers.multi_items() if k.lower() not in _DROPPED_HEADERS],
+            content=resp.content,
+            fresh_until=time.time() + lookup.ttl,
+            tags=lookup.tags,
+        )
+        self.backend.set(lookup.key, entry)
+
+    def revalidated(self, lookup: _Lookup, url: str) -> httpx.Response:
+        """Refresh ``lookup``'s entry after a 304 and return it as a response."""
+        assert lookup.entry is not None
+        lookup.entry.fresh_until = time.time() + lookup.ttl
+        self.backend.set(lookup.key, lookup.entry)
+        with self._lock:
+            self._stats.revalidations += 1
+        return lookup.entry.to_response(url)
+
+    def invalidate_path(self, namespace: str, path: str) -> None:
+        self.backend.invalidate(_tag(namespace, path))
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def _ttl_for(self, path: str) -> Optional[float]:
+        for pattern, ttl in self._rules:
+            if pattern.match(path):
+                return ttl
+        return None
+
+
+def _tag(namespace: str, path: str) -> str:
+    match = _ACCOUNT_PATH.match(path)
+    if match:
+        return f"{namespace}|account:{match.group(1)}"
+    return f"{namespace}|{path.rstrip('/')}"
+
+
+def _header(headers: List[Tuple[str, str]], name: str) -> Optional[str]:
+    for k, v in headers:
+        if k.lower() == name:
+            return v
+    return None
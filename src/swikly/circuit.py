@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Literal, Optional
+from urllib.parse import urlsplit
+
+from .errors import SwiklyCircuitOpenError
+from .utils import _path_template
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+@dataclass
+class _Circuit:
+    state: CircuitState = "closed"
+    failures: int = 0
+    opened_at: float = 0.0
+    probes: int = 0
+
+
+class CircuitBreaker:
+    """Fail fast while the API is failing, instead of waiting out timeouts and retries.
+
+    Each circuit (per host, or per ``method + path template`` with
+    ``scope="endpoint"``) opens after ``failure_threshold`` consecutive 5xx
+    responses or transport errors. While it is open, calls raise
+    :class:`SwiklyCircuitOpenError` without touching the network. After
+    ``recovery_timeout`` seconds it is half-open: up to ``half_open_max_calls``
+    probe calls go through; a success closes the circuit and a failure opens
+    it again. Share one breaker between clients to share what they learn.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        scope: Literal["host", "endpoint"] = "host",
+    ) -> None:
+        if failure_threshold < 1 or half_open_max_calls < 1:
+            raise ValueError("failure_threshold and half_open_max_calls must be >= 1")
+        if scope not in ("host", "endpoint"):
+            raise ValueError("scope must be 'host' or 'endpoint'")
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.scope = scope
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def key(self, method: str, path: str, url: str) -> str:
+        if self.scope == "host":
+            return urlsplit(url).netloc
+        return f"{method.upper()} {_path_template(path)}"
+
+    def state(self, key: str) -> CircuitState:
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                return "closed"
+            if circuit.state == "open" and time.monotonic() - circuit.opened_at >= self.recovery_timeout:
+                return "half_open"
+            return circuit.state
+
+    def acquire(self, key: str) -> None:
+        """Let one call through or raise :class:`SwiklyCircuitOpenError`."""
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            if circuit.state == "closed":
+                return
+            if circuit.state == "open":
+                remaining = self.recovery_timeout - (time.monotonic() - circuit.opened_at)
+                if remaining > 0:
+                    raise SwiklyCircuitOpenError(key, remaining)
+                circuit.state = "half_open"
+                circuit.probes = 0
+            if circuit.probes >= self.half_open_max_calls:
+                raise SwiklyCircuitOpenError(key, self.recovery_timeout)
+            circuit.probes += 1
+
+    def record(self, key: str, success: Optional[bool]) -> None:
+        """Report the outcome of an acquired call; ``None`` means it says nothing about health."""
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            if circuit.state == "half_open":
+                circuit.probes = max(0, circuit.probes - 1)
+                if success is True:
+                    circuit.state = "closed"
+                    circuit.failures = 0
+                elif success is False:
+                    self._open(circuit)
+                return
+            if circuit.state == "open" or success is None:
+                return  # a call started before the circuit opened
+            if success:
+                circuit.failures = 0
+            else:
+                circuit.failures += 1
+                if circuit.failures >= self.failure_threshold:
+                    self._open(circuit)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._circuits.clear()
+
+    @staticmethod
+    def _open(circuit: _Circuit) -> None:
+        circuit.state = "open"
+        circuit.opened_at = time.monotonic()
+        circuit.probes = 0
+
+
+def _outcome(status_code: int) -> Optional[bool]:
+    if status_code >= 500:
+        return False
+    if status_code == 429:
+        return None  # throttled, not broken
+    return True
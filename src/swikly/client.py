@@ -1,17 +1,41 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Union
+import copy
+import hashlib
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Sequence, TypeVar, Union
 
 import httpx
 
 from .errors import (
     SwiklyAPIError,
     SwiklyAuthError,
+    SwiklyDeadlineExceededError,
     SwiklyNotFoundError,
     SwiklyRateLimitError,
     SwiklyValidationError,
 )
-from .utils import _default_base_url, _parse_error_payload, _read_retry_after, _sleep
+from .cache import ResponseCache
+from .circuit import CircuitBreaker, _outcome
+from .deadline import TimeoutTypes, _attempt_timeout, _call_scope, _check_deadline, _expired, _fits, _remaining, _timeout_override
+from .decoding import DECODE_MODES, DecodeMode
+from .hedging import HedgePolicy
+from .instrumentation import AttemptInfo, ClientHooks, _begin, _emit, _finish
+from .index import CustomIdIndex
+from .idempotency import (
+    IDEMPOTENCY_MODES,
+    IdempotencyMode,
+    _KEYED_METHODS,
+    _has_key,
+    _retry_safe,
+    _with_key,
+    new_idempotency_key,
+)
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy, _policy_override
+from .singleflight import RequestCoalescer
+from .uploads import _async_body, _replayable, _sync_body
+from .utils import _asleep, _default_base_url, _parse_error_payload, _read_retry_after, _sleep
 from .resources.accounts import AccountsResource
 from .resources.users import UsersResource
 from .resources.requests import RequestsResource
@@ -26,9 +50,57 @@ from .resources.advanced import (
 )
 
 Json = Dict[str, Any]
+C = TypeVar("C", bound="_BaseClient")
+
+
+class _Credentials:
+    """A client's auth, precomputed once per token and shared with its ``with_options`` views."""
+
+    __slots__ = ("token", "legacy_api_key", "legacy_api_secret", "headers", "namespace")
+
+    def __init__(self, token: Optional[str], legacy_api_key: Optional[str], legacy_api_secret: Optional[str]) -> None:
+        self.token = token
+        self.legacy_api_key = legacy_api_key
+        self.legacy_api_secret = legacy_api_secret
+        self.headers: Mapping[str, str] = MappingProxyType({})
+        self.namespace = ""
+
+
+def create_http_client(
+    *,
+    limits: Optional[httpx.Limits] = None,
+    http2: bool = False,
+    transport: Optional[httpx.BaseTransport] = None,
+    timeout: float = 30.0,
+) -> httpx.Client:
+    """Build a connection pool to share between ``SwiklyClient`` instances via ``http_client=``."""
+    options: Dict[str, Any] = {"http2": http2, "timeout": timeout}
+    if limits is not None:
+        options["limits"] = limits
+    if transport is not None:
+        options["transport"] = transport
+    return httpx.Client(**options)
+
+
+def create_async_http_client(
+    *,
+    limits: Optional[httpx.Limits] = None,
+    http2: bool = False,
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+    timeout: float = 30.0,
+) -> httpx.AsyncClient:
+    """Async counterpart of :func:`create_http_client` for ``AsyncSwiklyClient``."""
+    options: Dict[str, Any] = {"http2": http2, "timeout": timeout}
+    if limits is not None:
+        options["limits"] = limits
+    if transport is not None:
+        options["transport"] = transport
+    return httpx.AsyncClient(**options)
 
 
 class _BaseClient:
+    _http: Union[httpx.Client, httpx.AsyncClient]  # set by the concrete client
+
     def __init__(
         self,
         *,
@@ -37,14 +109,50 @@ class _BaseClient:
         legacy_api_secret: Optional[str] = None,
         base_url: Optional[str] = None,
         environment: str = "production",
-        timeout: float = 30.0,
+        timeout: TimeoutTypes = 30.0,
+        deadline: Optional[float] = None,
         max_retries: int = 2,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        decode: DecodeMode = "validate",
+        cache: Optional[ResponseCache] = None,
+        coalesce: Optional[RequestCoalescer] = None,
+        custom_id_index: Optional[CustomIdIndex] = None,
+        idempotency: IdempotencyMode = "off",
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedge: Optional[HedgePolicy] = None,
+        hooks: Sequence[ClientHooks] = (),
         user_agent: Optional[str] = None,
         default_headers: Optional[Dict[str, str]] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        transport: Any = None,
+        http_client: Any = None,
     ) -> None:
         self.base_url = base_url or _default_base_url(environment)
+        self._base_url_prefix = self.base_url.rstrip("/")
         self.timeout = timeout
-        self.max_retries = max_retries
+        # Seconds each call may take in total, retries and backoff included.
+        self.deadline = deadline
+        # An explicit policy wins over the ``max_retries`` shorthand.
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=max_retries)
+        self.max_retries = self.retry_policy.max_retries
+        # Pass the same limiter to every client using the same token to share its budget.
+        self.rate_limiter = rate_limiter
+        if decode not in DECODE_MODES:
+            raise ValueError(f"decode must be one of {', '.join(DECODE_MODES)}")
+        self.decode = decode
+        self.cache = cache
+        self.coalesce = coalesce
+        # Maps customIds to request ids for requests.get_by_custom_id().
+        self.custom_id_index = custom_id_index if custom_id_index is not None else CustomIdIndex()
+        if idempotency not in IDEMPOTENCY_MODES:
+            raise ValueError(f"idempotency must be one of {', '.join(IDEMPOTENCY_MODES)}")
+        self.idempotency = idempotency
+        self.circuit_breaker = circuit_breaker
+        self.hedge = hedge
+        # Instrumentation stays fully dormant (no tracing, no timing) without hooks.
+        self.hooks = tuple(hooks)
 
         headers: Dict[str, str] = {"Accept": "application/json"}
         if user_agent:
@@ -55,20 +163,121 @@ class _BaseClient:
         # Auth:
         # - Spec uses Bearer token.
         # - Docs mention legacy api_key/api_secret; support both headers.
-        self._token = token
-        self._legacy_api_key = legacy_api_key
-        self._legacy_api_secret = legacy_api_secret
-        self._base_headers = headers
+        self._base_headers: Mapping[str, str] = MappingProxyType(headers)
+        self._credentials = _Credentials(token, legacy_api_key, legacy_api_secret)
+        self._refresh_credentials()
+
+        # Connection pool:
+        # - ``http_client`` lets several clients (e.g. one per account token) share
+        #   one pool; auth travels on each request, never on the shared client.
+        # - Otherwise each client owns a pool built from limits/http2/transport,
+        #   with the auth headers set on it once.
+        self._shared_http = http_client
+        self._owns_http = http_client is None
+        self._auth_on_http = http_client is None
+        self._http_options: Dict[str, Any] = {"http2": http2}
+        if limits is not None:
+            self._http_options["limits"] = limits
+        if transport is not None:
+            self._http_options["transport"] = transport
 
         # Resources (attached in subclasses after http client exists)
 
-    def _auth_headers(self) -> Dict[str, str]:
-        headers = dict(self._base_headers)
-        if self._token:
-            headers["Authorization"] = f"Bearer {self._token}"
-        if self._legacy_api_key and self._legacy_api_secret:
-            headers["API_KEY"] = self._legacy_api_key
-            headers["API_SECRET"] = self._legacy_api_secret
+    def _attach_resources(self) -> None:
+        # Resources
+        self.users = UsersResource(self)
+        self.accounts = AccountsResource(self)
+        self.requests = RequestsResource(self)
+
+        # Advanced
+        self.deposits = DepositsResource(self)
+        self.no_shows = NoShowsResource(self)
+        self.payments = PaymentsResource(self)
+        self.reclaims = ReclaimsResource(self)
+        self.refunds = RefundsResource(self)
+        self.files = FilesResource(self)
+        self.short_links = ShortLinksResource(self)
+
+    def with_options(
+        self: C,
+        *,
+        timeout: Optional[TimeoutTypes] = None,
+        deadline: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        decode: Optional[DecodeMode] = None,
+    ) -> C:
+        """A view of this client with other defaults, e.g. ``client.with_options(deadline=2).requests.get(...)``.
+
+        The view shares the connection pool, cache, limiter and breaker with
+        this client and never closes the pool itself.
+        """
+        view = copy.copy(self)
+        view._owns_http = False
+        if timeout is not None:
+            view.timeout = timeout
+        if deadline is not None:
+            view.deadline = deadline
+        if retry_policy is not None:
+            view.retry_policy = retry_policy
+            view.max_retries = retry_policy.max_retries
+        if decode is not None:
+            if decode not in DECODE_MODES:
+                raise ValueError(f"decode must be one of {', '.join(DECODE_MODES)}")
+            view.decode = decode
+        view._attach_resources()
+        return view
+
+    def _url(self, path: str) -> str:
+        # Absolute URLs keep shared http clients independent of any base_url.
+        if path.startswith("/"):
+            return self._base_url_prefix + path
+        return path
+
+    @property
+    def _cache_namespace(self) -> str:
+        # Keeps cached responses of different credentials apart in a shared cache.
+        return self._credentials.namespace
+
+    def set_token(self, token: Optional[str]) -> None:
+        """Swap the bearer token in place, e.g. after a credential refresh.
+
+        The next request of this client and of its ``with_options`` views uses
+        the new token; requests already in flight keep the one they were sent with.
+        """
+        self._credentials.token = token
+        self._refresh_credentials()
+        if self._auth_on_http:
+            self._http.headers = self._auth_headers()  # swapped, never mutated under a request
+
+    def _refresh_credentials(self) -> None:
+        creds = self._credentials
+        auth = dict(self._base_headers)
+        if creds.token:
+            auth["Authorization"] = f"Bearer {creds.token}"
+        if creds.legacy_api_key and creds.legacy_api_secret:
+            auth["API_KEY"] = creds.legacy_api_key
+            auth["API_SECRET"] = creds.legacy_api_secret
+        key = f"{creds.token}|{creds.legacy_api_key}|{creds.legacy_api_secret}|{self.base_url}"
+        creds.headers = MappingProxyType(auth)
+        creds.namespace = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+    def _auth_headers(self) -> Mapping[str, str]:
+        return self._credentials.headers
+
+    def _request_headers(self, headers: Optional[Mapping[str, str]]) -> Optional[Mapping[str, str]]:
+        # httpx merges per-request headers over the pool's own, so with auth on
+        # the pool the call's overrides go out as they are, without a copy.
+        if self._auth_on_http:
+            return headers
+        auth = self._credentials.headers
+        return {**auth, **headers} if headers else auth
+
+    def _keyed_headers(self, method: str, headers: Optional[Dict[str, str]], idempotency_key: Optional[str]) -> Optional[Dict[str, str]]:
+        # One key per logical call, resent unchanged on every attempt.
+        if idempotency_key is not None:
+            return _with_key(headers, idempotency_key)
+        if self.idempotency == "header" and method.upper() in _KEYED_METHODS and not _has_key(headers):
+            return _with_key(headers, new_idempotency_key())
         return headers
 
     def _raise_for_response(self, resp: httpx.Response) -> None:
@@ -103,24 +312,15 @@ class SwiklyClient(_BaseClient):
 
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
-        self._http = httpx.Client(base_url=self.base_url, timeout=self.timeout, headers=self._auth_headers())
-
-        # Resources
-        self.users = UsersResource(self)
-        self.accounts = AccountsResource(self)
-        self.requests = RequestsResource(self)
-
-        # Advanced
-        self.deposits = DepositsResource(self)
-        self.no_shows = NoShowsResource(self)
-        self.payments = PaymentsResource(self)
-        self.reclaims = ReclaimsResource(self)
-        self.refunds = RefundsResource(self)
-        self.files = FilesResource(self)
-        self.short_links = ShortLinksResource(self)
+        self._http: httpx.Client = self._shared_http or httpx.Client(
+            base_url=self.base_url, timeout=self.timeout, headers=self._auth_headers(), **self._http_options
+        )
+        self._attach_resources()
 
     def close(self) -> None:
-        self._http.close()
+        # A shared http client belongs to whoever created it.
+        if self._owns_http:
+            self._http.close()
 
     def request(
         self,
@@ -130,38 +330,167 @@ class SwiklyClient(_BaseClient):
         params: Optional[Dict[str, Any]] = None,
         json: Any = None,
         files: Any = None,
+        content: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        idempotency_key: Optional[str] = None,
+        timeout: Optional[TimeoutTypes] = None,
+        deadline: Optional[float] = None,
+    ) -> httpx.Response:
+        """Send a request; ``timeout`` applies per attempt, ``deadline`` (seconds) to the whole call."""
+        headers = self._keyed_headers(method, headers, idempotency_key)
+        with _call_scope(timeout, deadline if deadline is not None else self.deadline):
+            coalesce = self.coalesce
+            if coalesce is not None and json is None and files is None and content is None and coalesce.matches(method, path):
+                key = coalesce.key(self._cache_namespace, method, path, params)
+                return coalesce.do(key, lambda: self._request(method, path, params=params, headers=headers))
+            return self._request(method, path, params=params, json=json, files=files, content=content, headers=headers)
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        files: Any = None,
+        content: Any = None,
         headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        cache = self.cache
+        if cache is None:
+            return self._send(method, path, params=params, json=json, files=files, content=content, headers=headers)
+        if method != "GET":
+            resp = self._send(method, path, params=params, json=json, files=files, content=content, headers=headers)
+            cache.invalidate_path(self._cache_namespace, path)
+            return resp
+
+        lookup = cache.lookup(self._cache_namespace, path, params)
+        if lookup is None:
+            return self._send(method, path, params=params, headers=headers)
+        if lookup.fresh and lookup.entry is not None:
+            return lookup.entry.to_response(self._url(path))
+        conditional = lookup.conditional_headers()
+        if conditional:
+            headers = {**(headers or {}), **conditional}
+        resp = self._send(method, path, params=params, headers=headers, not_modified_ok=bool(conditional))
+        if resp.status_code == 304:
+            return cache.revalidated(lookup, self._url(path))
+        cache.store(lookup, resp)
+        return resp
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        files: Any = None,
+        content: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        not_modified_ok: bool = False,
     ) -> httpx.Response:
         # retry on 429/5xx + transport errors
-        attempt = 0
-        last_exc: Exception | None = None
-        merged_headers = dict(self._auth_headers())
-        if headers:
-            merged_headers.update(headers)
+        policy = _policy_override.get() or self.retry_policy
+        if policy.budget is not None:
+            policy.budget.record_request()
+        request_headers = self._request_headers(headers)
+
+        url = self._url(path)
+        limiter = self.rate_limiter
+        # A streamed body that cannot be produced twice is sent exactly once.
+        replayable = _replayable(content)
+        # 5xx and transport errors on POST/PATCH are retried only when the call carries a key.
+        retry_safe = replayable and _retry_safe(method, headers, json)
+        breaker = self.circuit_breaker
+        circuit = breaker.key(method, path, url) if breaker is not None else ""
+        hedge = self.hedge if method == "GET" and content is None else None
 
-        while attempt <= self.max_retries:
+        timeout = _timeout_override.get() or self.timeout
+        hooks = self.hooks
+
+        attempt = 0
+        while True:
+            remaining = _check_deadline("sending")
+            if breaker is not None:
+                breaker.acquire(circuit)  # raises SwiklyCircuitOpenError while open
             try:
-                resp = self._http.request(method, path, params=params, json=json, files=files, headers=merged_headers)
-                if resp.status_code == 429:
-                    retry_after = _read_retry_after(resp.headers)
-                    if retry_after is not None and attempt < self.max_retries:
-                        _sleep(retry_after)
-                        attempt += 1
-                        continue
-                if 500 <= resp.status_code < 600 and attempt < self.max_retries:
-                    attempt += 1
-                    continue
-                self._raise_for_response(resp)
+                if limiter is not None:
+                    wait = limiter.reserve()
+                    if wait > 0:
+                        if remaining is not None and wait >= remaining:
+                            raise SwiklyDeadlineExceededError("Deadline exceeded waiting for the rate limiter")
+                        _sleep(wait)
+                        remaining = _remaining()
+                attempt_timeout = _attempt_timeout(timeout, remaining)
+                info = _begin(hooks, method, path, url, attempt) if hooks else None
+            except BaseException:
+                # Nothing was sent: give back a half-open probe slot taken above.
+                if breaker is not None:
+                    breaker.record(circuit, None)
+                raise
+
+            def send(info: Optional[AttemptInfo] = info) -> httpx.Response:
+                return self._http.request(
+                    method, url, params=params, json=json, files=files, content=_sync_body(content),
+                    headers=request_headers, timeout=attempt_timeout,
+                    extensions={"trace": info.trace} if info is not None else None,
+                )
+
+            def send_hedge() -> httpx.Response:
+                # The hedge is an attempt of its own for hooks, with its own trace.
+                hedge_info = _begin(hooks, method, path, url, attempt) if hooks else None
+                try:
+                    resp = send(hedge_info)
+                except BaseException as exc:
+                    if hedge_info is not None:
+                        _finish(hooks, hedge_info, error=exc)
+                    raise
+                if hedge_info is not None:
+                    _finish(hooks, hedge_info, resp)
                 return resp
-            except (httpx.TimeoutException, httpx.NetworkError) as e:
-                last_exc = e
-                if attempt >= self.max_retries:
+
+            try:
+                resp = send() if hedge is None else hedge.send(send, send_hedge)
+            except (httpx.TimeoutException, httpx.NetworkError) as exc:
+                if breaker is not None:
+                    breaker.record(circuit, False)
+                if info is not None:
+                    _finish(hooks, info, error=exc)
+                if isinstance(exc, httpx.TimeoutException) and _expired():
+                    raise SwiklyDeadlineExceededError("Deadline exceeded while waiting for the response") from exc
+                delay = _fits(policy.delay_for_error(attempt)) if retry_safe else None
+                if delay is None:
                     raise
+                if info is not None:
+                    _emit(hooks, "on_retry", info, delay)
+                _sleep(delay)
                 attempt += 1
-        # should not happen
-        if last_exc:
-            raise last_exc
-        raise RuntimeError("Unexpected request loop termination")
+                continue
+            except BaseException as exc:
+                if breaker is not None:
+                    breaker.record(circuit, None)
+                if info is not None:
+                    _finish(hooks, info, error=exc)
+                raise
+            if breaker is not None:
+                breaker.record(circuit, _outcome(resp.status_code))
+            if limiter is not None:
+                limiter.observe(resp.status_code, resp.headers)
+            if info is not None:
+                _finish(hooks, info, resp)
+            # A 429 was not processed, so it is always safe to send again.
+            delay = _fits(policy.delay_for_response(attempt, resp)) if retry_safe or (replayable and resp.status_code == 429) else None
+            if delay is not None:
+                if info is not None:
+                    _emit(hooks, "on_retry", info, delay)
+                resp.close()
+                _sleep(delay)
+                attempt += 1
+                continue
+            if not (not_modified_ok and resp.status_code == 304):
+                self._raise_for_response(resp)
+            return resp
 
 
 class AsyncSwiklyClient(_BaseClient):
@@ -169,22 +498,14 @@ class AsyncSwiklyClient(_BaseClient):
 
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
-        self._http = httpx.AsyncClient(base_url=self.base_url, timeout=self.timeout, headers=self._auth_headers())
-
-        self.users = UsersResource(self)
-        self.accounts = AccountsResource(self)
-        self.requests = RequestsResource(self)
-
-        self.deposits = DepositsResource(self)
-        self.no_shows = NoShowsResource(self)
-        self.payments = PaymentsResource(self)
-        self.reclaims = ReclaimsResource(self)
-        self.refunds = RefundsResource(self)
-        self.files = FilesResource(self)
-        self.short_links = ShortLinksResource(self)
+        self._http: httpx.AsyncClient = self._shared_http or httpx.AsyncClient(
+            base_url=self.base_url, timeout=self.timeout, headers=self._auth_headers(), **self._http_options
+        )
+        self._attach_resources()
 
     async def aclose(self) -> None:
-        await self._http.aclose()
+        if self._owns_http:
+            await self._http.aclose()
 
     async def request(
         self,
@@ -194,29 +515,163 @@ class AsyncSwiklyClient(_BaseClient):
         params: Optional[Dict[str, Any]] = None,
         json: Any = None,
         files: Any = None,
+        content: Any = None,
         headers: Optional[Dict[str, str]] = None,
+        idempotency_key: Optional[str] = None,
+        timeout: Optional[TimeoutTypes] = None,
+        deadline: Optional[float] = None,
     ) -> httpx.Response:
-        attempt = 0
-        merged_headers = dict(self._auth_headers())
-        if headers:
-            merged_headers.update(headers)
+        headers = self._keyed_headers(method, headers, idempotency_key)
+        with _call_scope(timeout, deadline if deadline is not None else self.deadline):
+            coalesce = self.coalesce
+            if coalesce is not None and json is None and files is None and content is None and coalesce.matches(method, path):
+                key = coalesce.key(self._cache_namespace, method, path, params)
+                return await coalesce.ado(key, lambda: self._request(method, path, params=params, headers=headers))
+            return await self._request(method, path, params=params, json=json, files=files, content=content, headers=headers)
 
-        while attempt <= self.max_retries:
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        files: Any = None,
+        content: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        cache = self.cache
+        if cache is None:
+            return await self._send(method, path, params=params, json=json, files=files, content=content, headers=headers)
+        if method != "GET":
+            resp = await self._send(method, path, params=params, json=json, files=files, content=content, headers=headers)
+            cache.invalidate_path(self._cache_namespace, path)
+            return resp
+
+        lookup = cache.lookup(self._cache_namespace, path, params)
+        if lookup is None:
+            return await self._send(method, path, params=params, headers=headers)
+        if lookup.fresh and lookup.entry is not None:
+            return lookup.entry.to_response(self._url(path))
+        conditional = lookup.conditional_headers()
+        if conditional:
+            headers = {**(headers or {}), **conditional}
+        resp = await self._send(method, path, params=params, headers=headers, not_modified_ok=bool(conditional))
+        if resp.status_code == 304:
+            return cache.revalidated(lookup, self._url(path))
+        cache.store(lookup, resp)
+        return resp
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        files: Any = None,
+        content: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        not_modified_ok: bool = False,
+    ) -> httpx.Response:
+        # Same policy as the sync client, but backoff never blocks the event loop.
+        policy = _policy_override.get() or self.retry_policy
+        if policy.budget is not None:
+            policy.budget.record_request()
+        request_headers = self._request_headers(headers)
+
+        url = self._url(path)
+        limiter = self.rate_limiter
+        # A streamed body that cannot be produced twice is sent exactly once.
+        replayable = _replayable(content)
+        # 5xx and transport errors on POST/PATCH are retried only when the call carries a key.
+        retry_safe = replayable and _retry_safe(method, headers, json)
+        breaker = self.circuit_breaker
+        circuit = breaker.key(method, path, url) if breaker is not None else ""
+        hedge = self.hedge if method == "GET" and content is None else None
+
+        timeout = _timeout_override.get() or self.timeout
+        hooks = self.hooks
+
+        attempt = 0
+        while True:
+            remaining = _check_deadline("sending")
+            if breaker is not None:
+                breaker.acquire(circuit)  # raises SwiklyCircuitOpenError while open
             try:
-                resp = await self._http.request(method, path, params=params, json=json, files=files, headers=merged_headers)
-                if resp.status_code == 429:
-                    retry_after = _read_retry_after(resp.headers)
-                    if retry_after is not None and attempt < self.max_retries:
-                        _sleep(retry_after)
-                        attempt += 1
-                        continue
-                if 500 <= resp.status_code < 600 and attempt < self.max_retries:
-                    attempt += 1
-                    continue
-                self._raise_for_response(resp)
+                if limiter is not None:
+                    wait = limiter.reserve()
+                    if wait > 0:
+                        if remaining is not None and wait >= remaining:
+                            raise SwiklyDeadlineExceededError("Deadline exceeded waiting for the rate limiter")
+                        await _asleep(wait)
+                        remaining = _remaining()
+                attempt_timeout = _attempt_timeout(timeout, remaining)
+                info = _begin(hooks, method, path, url, attempt) if hooks else None
+            except BaseException:
+                # Nothing was sent: give back a half-open probe slot taken above.
+                if breaker is not None:
+                    breaker.record(circuit, None)
+                raise
+
+            async def send(info: Optional[AttemptInfo] = info) -> httpx.Response:
+                return await self._http.request(
+                    method, url, params=params, json=json, files=files, content=_async_body(content),
+                    headers=request_headers, timeout=attempt_timeout,
+                    extensions={"trace": info.atrace} if info is not None else None,
+                )
+
+            async def send_hedge() -> httpx.Response:
+                # The hedge is an attempt of its own for hooks, with its own trace.
+                hedge_info = _begin(hooks, method, path, url, attempt) if hooks else None
+                try:
+                    resp = await send(hedge_info)
+                except BaseException as exc:
+                    if hedge_info is not None:
+                        _finish(hooks, hedge_info, error=exc)
+                    raise
+                if hedge_info is not None:
+                    _finish(hooks, hedge_info, resp)
                 return resp
-            except (httpx.TimeoutException, httpx.NetworkError):
-                if attempt >= self.max_retries:
+
+            try:
+                resp = await (send() if hedge is None else hedge.asend(send, send_hedge))
+            except (httpx.TimeoutException, httpx.NetworkError) as exc:
+                if breaker is not None:
+                    breaker.record(circuit, False)
+                if info is not None:
+                    _finish(hooks, info, error=exc)
+                if isinstance(exc, httpx.TimeoutException) and _expired():
+                    raise SwiklyDeadlineExceededError("Deadline exceeded while waiting for the response") from exc
+                delay = _fits(policy.delay_for_error(attempt)) if retry_safe else None
+                if delay is None:
                     raise
+                if info is not None:
+                    _emit(hooks, "on_retry", info, delay)
+                await _asleep(delay)
+                attempt += 1
+                continue
+            except BaseException as exc:
+                if breaker is not None:
+                    breaker.record(circuit, None)
+                if info is not None:
+                    _finish(hooks, info, error=exc)
+                raise
+            if breaker is not None:
+                breaker.record(circuit, _outcome(resp.status_code))
+            if limiter is not None:
+                limiter.observe(resp.status_code, resp.headers)
+            if info is not None:
+                _finish(hooks, info, resp)
+            # A 429 was not processed, so it is always safe to send again.
+            delay = _fits(policy.delay_for_response(attempt, resp)) if retry_safe or (replayable and resp.status_code == 429) else None
+            if delay is not None:
+                if info is not None:
+                    _emit(hooks, "on_retry", info, delay)
+                await resp.aclose()
+                await _asleep(delay)
                 attempt += 1
-        raise RuntimeError("Unexpected request loop termination")
+                continue
+            if not (not_modified_ok and resp.status_code == 304):
+                self._raise_for_response(resp)
+            return resp
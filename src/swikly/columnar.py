@@ -0,0 +1,345 @@
+from __future__ import annotations
+
+import typing
+from array import array
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Literal, Optional, Sequence, Tuple, Type, Union, overload
+
+import httpx
+from pydantic import BaseModel, TypeAdapter
+
+from .models import Reclaim, ReclaimsListResponse, Request, RequestsListResponse, ResultsMeta
+
+# Storage per scalar kind: typecode of the array holding it, or None for a list.
+_TYPECODES: Dict[type, Optional[str]] = {int: "q", float: "d", bool: "b", str: None}
+# String columns stop sharing equal values once they have seen this many distinct ones.
+_INTERN_LIMIT = 1024
+
+
+class _Column:
+    """One scalar field across all rows: a typed array (or list of str) plus a validity mask."""
+
+    __slots__ = ("name", "kind", "values", "valid", "_interned")
+
+    def __init__(self, name: str, kind: type, size: int) -> None:
+        self.name = name
+        self.kind = kind
+        typecode = _TYPECODES[kind]
+        self.values: Any = [None] * size if typecode is None else array(typecode, [0]) * size
+        self.valid = bytearray(size)
+        self._interned: Optional[Dict[str, str]] = {} if kind is str else None
+
+    def set(self, i: int, value: Any) -> bool:
+        """Store ``value`` in row ``i``; False if it does not have the column's type or range."""
+        kind = self.kind
+        if type(value) is not kind and not (kind is float and type(value) is int):
+            return False
+        if isinstance(value, str) and self._interned is not None:
+            value = self._interned.setdefault(value, value)
+            if len(self._interned) > _INTERN_LIMIT:
+                self._interned = None
+        try:
+            self.values[i] = value
+        except OverflowError:
+            # Ints beyond int64 (or floats beyond a double) stay with the row.
+            return False
+        self.valid[i] = 1
+        return True
+
+    def get(self, i: int) -> Any:
+        if not self.valid[i]:
+            return None
+        value = self.values[i]
+        return bool(value) if self.kind is bool else value
+
+    def extend(self, other: "_Column") -> None:
+        self.values.extend(other.values)
+        self.valid += other.valid
+
+
+class _Node:
+    """Schema of one (possibly nested) object: its scalar columns and nested objects."""
+
+    __slots__ = ("scalars", "objects")
+
+    def __init__(self) -> None:
+        self.scalars: Dict[str, Tuple[str, type]] = {}  # key -> (column name, kind)
+        self.objects: Dict[str, Tuple[str, _Node]] = {}  # key -> (presence column name, node)
+
+
+class _Plan:
+    __slots__ = ("root", "kinds", "build")
+
+    def __init__(self, root: _Node, build: Callable[[Dict[str, Any]], Any]) -> None:
+        self.root = root
+        self.build = build  # row dict -> full model
+        self.kinds: Dict[str, type] = {}
+        self._collect(root)
+
+    def _collect(self, node: _Node) -> None:
+        for name, kind in node.scalars.values():
+            self.kinds[name] = kind
+        for name, child in node.objects.values():
+            self.kinds[name] = bool
+            self._collect(child)
+
+
+def _scalar_kind(annotation: Any) -> Any:
+    """The scalar type, nested model or None (kept as is) for a field annotation."""
+    origin = typing.get_origin(annotation)
+    if origin is Union:
+        members = [a for a in typing.get_args(annotation) if a is not type(None)]
+        return _scalar_kind(members[0]) if len(members) == 1 else None
+    if origin is Literal:
+        values = typing.get_args(annotation)
+        return str if all(isinstance(v, str) for v in values) else None
+    if annotation in _TYPECODES:
+        return annotation
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    return None
+
+
+def _node(models: Sequence[Type[BaseModel]], prefix: str, ancestors: Tuple[type, ...]) -> _Node:
+    node = _Node()
+    for model in models:
+        hints = typing.get_type_hints(model)
+        for name, field in model.model_fields.items():
+            key = field.alias or name
+            if key in node.scalars or key in node.objects:
+                continue
+            kind = _scalar_kind(hints.get(name, field.annotation))
+            column = f"{prefix}{key}"
+            if kind in _TYPECODES:
+                node.scalars[key] = (column, kind)
+            elif isinstance(kind, type) and kind not in ancestors:
+                # Back references (e.g. Deposit.request) stay as they came.
+                node.objects[key] = (column, _node([kind], column + ".", ancestors + (kind,)))
+    return node
+
+
+@lru_cache(maxsize=None)
+def _plan(item: Any) -> _Plan:
+    if typing.get_origin(item) is Union:
+        models = tuple(typing.get_args(item))
+        adapter: TypeAdapter[Any] = TypeAdapter(item)
+        return _Plan(_node(models, "", models), adapter.validate_python)
+    return _Plan(_node([item], "", (item,)), item.model_validate)
+
+
+class ColumnarRows(Sequence[Any]):
+    """A list endpoint's items stored column by column instead of as one model per row.
+
+    Scalar fields of the items and of their nested objects (``deposit.status``,
+    ``deposit.reclaimSummary.reclaimedAmount``...) live in typed arrays with a
+    validity mask; anything else (lists, unknown or mistyped values) is kept
+    per row as it came. Indexing gives a :class:`RowView` that reads columns
+    directly and only builds the full model when something else is asked for.
+
+    :meth:`buffers` exposes the arrays (buffer protocol, usable with
+    ``numpy.frombuffer``), :meth:`to_pydict` plain lists for
+    ``pandas.DataFrame`` and :meth:`to_arrow` a ``pyarrow.Table``.
+    """
+
+    def __init__(self, item: Any, items: Sequence[Dict[str, Any]] = ()) -> None:
+        self._plan = _plan(item)
+        size = len(items)
+        self._item = item
+        self._columns: Dict[str, _Column] = {name: _Column(name, kind, size) for name, kind in self._plan.kinds.items()}
+        self._rest: List[Optional[Dict[str, Any]]] = [None] * size
+        bound = self._bind(self._plan.root)
+        for i, data in enumerate(items):
+            rest = self._fill(bound, data, i)
+            if rest:
+                self._rest[i] = rest
+
+    def __len__(self) -> int:
+        return len(self._rest)
+
+    @overload
+    def __getitem__(self, index: int) -> "RowView": ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List["RowView"]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [RowView(self, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("row index out of range")
+        return RowView(self, index)
+
+    def __iter__(self) -> Iterator["RowView"]:
+        return (RowView(self, i) for i in range(len(self)))
+
+    def __repr__(self) -> str:
+        return f"<ColumnarRows {getattr(self._item, '__name__', 'items')} x {len(self)}>"
+
+    @property
+    def column_names(self) -> List[str]:
+        return list(self._columns)
+
+    def column(self, name: str) -> List[Any]:
+        """The values of one column (e.g. ``"deposit.status"``) with ``None`` for missing ones."""
+        column = self._columns[name]
+        return [column.get(i) for i in range(len(self))]
+
+    def buffers(self) -> Dict[str, Tuple[Any, bytearray]]:
+        """``name -> (values, validity)``: an ``array`` (or list for text) and one 0/1 byte per row."""
+        return {name: (column.values, column.valid) for name, column in self._columns.items()}
+
+    def to_pydict(self) -> Dict[str, List[Any]]:
+        return {name: self.column(name) for name in self._columns}
+
+    def to_arrow(self) -> Any:
+        """A ``pyarrow.Table`` of the scalar columns; needs ``pip install swikly-sdk-python[arrow]``."""
+        import pyarrow as pa
+
+        types = {int: pa.int64(), float: pa.float64(), bool: pa.bool_(), str: pa.string()}
+        return pa.table({
+            name: pa.array(self.column(name), type=types[column.kind]) for name, column in self._columns.items()
+        })
+
+    def to_models(self) -> List[Any]:
+        return [self._plan.build(self._row_dict(i)) for i in range(len(self))]
+
+    def extend(self, other: "ColumnarRows") -> None:
+        """Append another page's rows, e.g. to collect a whole export in one table."""
+        if other._plan is not self._plan:
+            raise ValueError("cannot combine rows of different item types")
+        for name, column in self._columns.items():
+            column.extend(other._columns[name])
+        self._rest.extend(other._rest)
+
+    def _bind(self, node: _Node) -> Tuple[Dict[str, _Column], Dict[str, Tuple[_Column, Any]]]:
+        # The plan's column names resolved to this table's columns, so filling skips the lookups.
+        columns = self._columns
+        scalars = {key: columns[name] for key, (name, _) in node.scalars.items()}
+        objects = {key: (columns[name], self._bind(child)) for key, (name, child) in node.objects.items()}
+        return scalars, objects
+
+    def _fill(self, bound: Tuple[Dict[str, _Column], Dict[str, Tuple[_Column, Any]]], data: Dict[str, Any], i: int) -> Optional[Dict[str, Any]]:
+        scalars, objects = bound
+        rest: Optional[Dict[str, Any]] = None
+        for key, value in data.items():
+            column = scalars.get(key)
+            if column is not None:
+                if value is None or column.set(i, value):
+                    continue
+            else:
+                obj = objects.get(key)
+                if obj is not None:
+                    if value is None:
+                        continue
+                    if isinstance(value, dict):
+                        obj[0].set(i, True)
+                        nested = self._fill(obj[1], value, i)
+                        if nested:
+                            rest = rest or {}
+                            rest[key] = nested
+                        continue
+            rest = rest or {}
+            rest[key] = value
+        return rest
+
+    def _row_dict(self, i: int, node: Optional[_Node] = None, rest: Any = None) -> Dict[str, Any]:
+        if node is None:
+            node, rest = self._plan.root, self._rest[i]
+        data: Dict[str, Any] = {}
+        for key, (name, _) in node.scalars.items():
+            column = self._columns[name]
+            if column.valid[i]:
+                data[key] = column.get(i)
+        for key, (name, child) in node.objects.items():
+            if self._columns[name].valid[i]:
+                data[key] = self._row_dict(i, child, rest.get(key) if rest else None)
+        if rest:
+            for key, value in rest.items():
+                if key not in data:
+                    data[key] = value
+        return data
+
+
+class RowView:
+    """One row of :class:`ColumnarRows`, read straight from the columns.
+
+    Scalar fields and nested objects (as views) cost no model; any other
+    attribute, e.g. a list field or ``model_dump``, builds the full model once.
+    """
+
+    __slots__ = ("_rows", "_index", "_node", "_path", "_model")
+
+    def __init__(self, rows: ColumnarRows, index: int, node: Optional[_Node] = None, path: Tuple[str, ...] = ()) -> None:
+        self._rows = rows
+        self._index = index
+        self._node = node if node is not None else rows._plan.root
+        self._path = path
+        self._model: Any = None
+
+    def __getattr__(self, name: str) -> Any:
+        node = self._node
+        scalar = node.scalars.get(name)
+        if scalar is not None:
+            value = self._rows._columns[scalar[0]].get(self._index)
+            if value is not None:
+                return value
+        obj = node.objects.get(name)
+        if obj is not None and self._rows._columns[obj[0]].valid[self._index]:
+            return RowView(self._rows, self._index, obj[1], self._path + (name,))
+        rest = self._rest()
+        if scalar is None and obj is None or (rest is not None and name in rest):
+            return getattr(self.model(), name)
+        return None
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, RowView):
+            return self.to_dict() == other.to_dict()
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"RowView({self.to_dict()!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The row (or nested object) as the API sent it, less explicit nulls."""
+        return self._rows._row_dict(self._index, self._node, self._rest())
+
+    def model(self) -> Any:
+        """The full pydantic model of this row (or nested object)."""
+        if self._model is None:
+            model = self._rows._plan.build(self._rows._row_dict(self._index))
+            for key in self._path:
+                model = getattr(model, key)
+            self._model = model
+        return self._model
+
+    def _rest(self) -> Any:
+        rest: Any = self._rows._rest[self._index]
+        for key in self._path:
+            rest = rest.get(key) if isinstance(rest, dict) else None
+        return rest
+
+
+# List responses decoded into ColumnarRows, by the key holding their items.
+_COLUMNAR: Dict[type, Tuple[str, Any]] = {
+    RequestsListResponse: ("requests", Request),
+    ReclaimsListResponse: ("reclaims", Reclaim),
+}
+
+
+def decode_columnar(resp: httpx.Response, model: Type[BaseModel]) -> Any:
+    """``model`` with its items in :class:`ColumnarRows`; other models decode as in "json" mode."""
+    target = _COLUMNAR.get(model)
+    if target is None:
+        return model.model_validate_json(resp.content)
+    key, item = target
+    data = resp.json()
+    raw_meta = data.get("meta")
+    rows = ColumnarRows(item, data.get(key) or [])
+    meta = ResultsMeta.model_validate(raw_meta) if raw_meta is not None else None
+    if model is RequestsListResponse:
+        return RequestsListResponse.model_construct(requests=rows, meta=meta)
+    return ReclaimsListResponse.model_construct(reclaims=rows, meta=meta)
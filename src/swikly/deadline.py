@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional, Union
+
+import httpx
+
+from .errors import SwiklyDeadlineExceededError
+
+TimeoutTypes = Union[float, httpx.Timeout]
+
+# Absolute time.monotonic() by which the current call (and its retries) must finish.
+_deadline: ContextVar[Optional[float]] = ContextVar("swikly_deadline", default=None)
+# Per-call timeout replacing the client's for the calls made in this context.
+_timeout_override: ContextVar[Optional[TimeoutTypes]] = ContextVar("swikly_timeout", default=None)
+
+
+@contextmanager
+def deadline_scope(seconds: float) -> Iterator[None]:
+    """Make every Swikly call in this block, retries and backoff included, finish within ``seconds``.
+
+    Scopes nest; the earliest deadline wins. Works with both clients.
+    """
+    deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(deadline if current is None else min(current, deadline))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+@contextmanager
+def _call_scope(timeout: Optional[TimeoutTypes], deadline: Optional[float]) -> Iterator[None]:
+    if timeout is None and deadline is None:
+        yield
+        return
+    timeout_token = _timeout_override.set(timeout) if timeout is not None else None
+    try:
+        if deadline is None:
+            yield
+        else:
+            with deadline_scope(deadline):
+                yield
+    finally:
+        if timeout_token is not None:
+            _timeout_override.reset(timeout_token)
+
+
+def _remaining() -> Optional[float]:
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def _expired() -> bool:
+    remaining = _remaining()
+    return remaining is not None and remaining <= 0
+
+
+def _check_deadline(what: str) -> Optional[float]:
+    remaining = _remaining()
+    if remaining is not None and remaining <= 0:
+        raise SwiklyDeadlineExceededError(f"Deadline exceeded before {what}")
+    return remaining
+
+
+def _fits(delay: Optional[float]) -> Optional[float]:
+    # A retry whose backoff alone would overrun the deadline is not attempted.
+    if delay is None:
+        return None
+    remaining = _remaining()
+    if remaining is not None and delay >= remaining:
+        return None
+    return delay
+
+
+def _attempt_timeout(timeout: TimeoutTypes, remaining: Optional[float]) -> TimeoutTypes:
+    """``timeout`` with every phase (connect/read/write/pool) capped to what is left of the deadline."""
+    if remaining is None:
+        return timeout
+    if not isinstance(timeout, httpx.Timeout):
+        return min(timeout, remaining) if timeout is not None else remaining
+    return httpx.Timeout(
+        connect=_cap(timeout.connect, remaining),
+        read=_cap(timeout.read, remaining),
+        write=_cap(timeout.write, remaining),
+        pool=_cap(timeout.pool, remaining),
+    )
+
+
+def _cap(value: Optional[float], remaining: float) -> float:
+    return remaining if value is None else min(value, remaining)
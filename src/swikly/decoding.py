@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import typing
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Type, TypeVar, Union, cast
+
+import httpx
+from pydantic import BaseModel
+
+from .columnar import decode_columnar
+
+M = TypeVar("M", bound=BaseModel)
+
+# How response bodies become return values:
+# - "validate":  resp.json() then model_validate (default, historical behaviour)
+# - "json":      bytes straight to models with model_validate_json (same checks, one pass)
+# - "construct": resp.json() then a recursive model_construct, skipping validation.
+#                Tolerates schema drift (missing/odd fields never raise) but is
+#                slower than "validate" on pydantic v2: pydantic-core validates
+#                quicker than model_construct assembles instances in Python.
+# - "raw":       the parsed JSON as plain dicts/lists, no models at all
+# - "columnar":  requests and reclaims lists keep their items in ColumnarRows
+#                (typed column arrays with lazy row views); everything else as "json"
+DecodeMode = Literal["validate", "json", "construct", "raw", "columnar"]
+DECODE_MODES: Tuple[str, ...] = ("validate", "json", "construct", "raw", "columnar")
+
+_Converter = Callable[[Any], Any]
+
+
+def decode_response(resp: httpx.Response, model: Type[M], mode: str = "validate") -> M:
+    if mode == "validate":
+        return model.model_validate(resp.json())
+    if mode == "json":
+        return model.model_validate_json(resp.content)
+    if mode == "construct":
+        return construct_model(model, resp.json())
+    if mode == "raw":
+        return cast(M, resp.json())
+    if mode == "columnar":
+        return cast(M, decode_columnar(resp, model))
+    raise ValueError(f"decode must be one of {', '.join(DECODE_MODES)}")
+
+
+def construct_model(model: Type[M], data: Dict[str, Any]) -> M:
+    """``model_construct`` that also builds nested models, lists and tagged unions."""
+    values = dict(data)
+    for key, convert in _plan(model):
+        value = values.get(key)
+        if value is not None:
+            values[key] = convert(value)
+    return model.model_construct(**values)
+
+
+_PlanEntry = Tuple[str, _Converter]
+
+
+@lru_cache(maxsize=None)
+def _plan(model: Type[BaseModel]) -> Tuple[_PlanEntry, ...]:
+    # Resolved lazily per model so self-referencing models (Deposit <-> Request) don't recurse.
+    hints = typing.get_type_hints(model)
+    plan: List[_PlanEntry] = []
+    for name, field in model.model_fields.items():
+        convert = _converter(hints.get(name, field.annotation))
+        if convert is not None:
+            plan.append((field.alias or name, convert))
+    return tuple(plan)
+
+
+def _converter(annotation: Any) -> Optional[_Converter]:
+    origin = typing.get_origin(annotation)
+    if origin is Union:
+        members = [a for a in typing.get_args(annotation) if a is not type(None)]
+        if len(members) == 1:
+            return _converter(members[0])
+        models = [a for a in members if isinstance(a, type) and issubclass(a, BaseModel)]
+        return _union_converter(tuple(models)) if models else None
+    if origin in (list, List):
+        (item,) = typing.get_args(annotation) or (Any,)
+        convert_item = _converter(item)
+        if convert_item is None:
+            return None
+        return lambda value: [convert_item(v) for v in value] if isinstance(value, list) else value
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        model = annotation
+        return lambda value: construct_model(model, value) if isinstance(value, dict) else value
+    return None
+
+
+def _union_converter(models: Tuple[Type[BaseModel], ...]) -> _Converter:
+    # Tagged unions such as Reclaim are told apart by their Literal fields (e.g. status).
+    tags = [(m, _literal_fields(m)) for m in models]
+
+    def convert(value: Any) -> Any:
+        if not isinstance(value, dict):
+            return value
+        for model, literals in tags:
+            if all(value.get(name) in allowed for name, allowed in literals.items()):
+                return construct_model(model, value)
+        return construct_model(models[0], value)
+
+    return convert
+
+
+def _literal_fields(model: Type[BaseModel]) -> Dict[str, Tuple[Any, ...]]:
+    hints = typing.get_type_hints(model)
+    return {
+        name: typing.get_args(hints[name])
+        for name in model.model_fields
+        if typing.get_origin(hints.get(name)) is Literal
+    }
@@ -43,3 +43,20 @@ class SwiklyRateLimitError(SwiklyAPIError):
 
 class SwiklyValidationError(SwiklyAPIError):
     """422 with field errors."""
+
+
+class SwiklyCircuitOpenError(SwiklyError):
+    """The circuit breaker is open for this host/endpoint; the call was not sent."""
+
+    def __init__(self, key: str, retry_after: float) -> None:
+        super().__init__(f"Circuit open for {key}; retry in {retry_after:.1f}s")
+        self.key = key
+        self.retry_after = retry_after
+
+
+class SwiklyDeadlineExceededError(SwiklyError, TimeoutError):
+    """The call's deadline passed before it (or one of its retries) could complete."""
+
+
+class SwiklyUploadNotReplayableError(SwiklyError):
+    """An upload had to be sent again but its source (e.g. an async iterator) can only be read once."""
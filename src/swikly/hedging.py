@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Deque, List, Optional
+
+import httpx
+
+from .retry import RetryBudget
+
+# The hedge delay is recomputed after this many new latency samples.
+_REFRESH_EVERY = 16
+
+
+@dataclass
+class HedgeStats:
+    hedged: int = 0  # GETs that were sent a second time
+    wins: int = 0  # hedges that answered before the original
+
+
+class HedgePolicy:
+    """Send a second copy of a slow GET and keep whichever response arrives first.
+
+    The hedge fires once the original has been outstanding for ``delay``
+    seconds or, when no delay is given, for the ``quantile`` (p95 by default)
+    of the last ``window`` GET latencies, clamped to ``min_delay..max_delay``.
+    No hedges are sent until ``min_samples`` latencies have been seen. Give a
+    ``budget`` to cap hedges to a fraction of the traffic. Only GETs are hedged.
+    """
+
+    def __init__(
+        self,
+        *,
+        delay: Optional[float] = None,
+        quantile: float = 0.95,
+        min_samples: int = 20,
+        window: int = 256,
+        min_delay: float = 0.01,
+        max_delay: float = 5.0,
+        budget: Optional[RetryBudget] = None,
+        max_workers: int = 16,
+    ) -> None:
+        if not 0 < quantile < 1:
+            raise ValueError("quantile must be between 0 and 1")
+        self.delay = delay
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.max_workers = max_workers
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._unsorted = 0
+        self._cached_delay: Optional[float] = None
+        self._stats = HedgeStats()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> HedgeStats:
+        with self._lock:
+            return HedgeStats(hedged=self._stats.hedged, wins=self._stats.wins)
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+            self._unsorted += 1
+
+    def hedge_delay(self) -> Optional[float]:
+        if self.delay is not None:
+            return self.delay
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            if self._cached_delay is None or self._unsorted >= _REFRESH_EVERY:
+                ordered = sorted(self._samples)
+                value = ordered[min(len(ordered) - 1, int(self.quantile * len(ordered)))]
+                self._cached_delay = min(self.max_delay, max(self.min_delay, value))
+                self._unsorted = 0
+            return self._cached_delay
+
+    def send(
+        self, fn: Callable[[], httpx.Response], hedge_fn: Optional[Callable[[], httpx.Response]] = None
+    ) -> httpx.Response:
+        """Run ``fn`` (one HTTP attempt) on a worker thread, hedging it on another if it is slow.
+
+        ``hedge_fn`` sends the hedge (``fn`` when omitted). The first attempt
+        to succeed answers; an attempt that fails leaves the other one to
+        answer. A sync request cannot be cancelled, so the losing attempt runs
+        on in its worker and its response is closed when it arrives.
+        """
+        delay = self._start()
+        if delay is None:
+            return self._timed(fn)
+        pool = self._executor()
+        # Each attempt runs in a copy of the caller's context, so it sees its deadline and overrides.
+        primary = pool.submit(contextvars.copy_context().run, self._timed, fn)
+        futures = [primary]
+        winner: Optional["Future[httpx.Response]"] = None
+        try:
+            done, _ = wait(futures, timeout=delay)
+            if not done and self._may_hedge():
+                futures.append(pool.submit(contextvars.copy_context().run, hedge_fn or fn))
+            pending = set(futures)
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    exc = future.exception()
+                    if exc is not None:
+                        error = error or exc
+                        continue
+                    winner = future
+                    self._won(future is not primary)
+                    return future.result()
+            assert error is not None
+            raise error
+        finally:
+            for future in futures:
+                if future is not winner:
+                    future.add_done_callback(_close_response)
+
+    async def asend(
+        self,
+        fn: Callable[[], Awaitable[httpx.Response]],
+        hedge_fn: Optional[Callable[[], Awaitable[httpx.Response]]] = None,
+    ) -> httpx.Response:
+        """Async :meth:`send` returning whichever response arrives first; the losing attempt is cancelled."""
+        delay = self._start()
+        if delay is None:
+            return await self._atimed(fn)
+        primary = asyncio.ensure_future(self._atimed(fn))
+        tasks: List["asyncio.Task[httpx.Response]"] = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done or not self._may_hedge():
+                return await primary
+            hedge = asyncio.ensure_future((hedge_fn or fn)())
+            tasks.append(hedge)
+            pending = set(tasks)
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    exc = task.exception()
+                    if exc is not None:
+                        error = error or exc
+                        continue
+                    self._won(task is hedge)
+                    return task.result()
+            assert error is not None
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+
+    def _start(self) -> Optional[float]:
+        if self.budget is not None:
+            self.budget.record_request()
+        return self.hedge_delay()
+
+    def _may_hedge(self) -> bool:
+        if self.budget is not None and not self.budget.try_spend():
+            return False
+        with self._lock:
+            self._stats.hedged += 1
+        return True
+
+    def _won(self, hedge_won: bool) -> None:
+        if hedge_won:
+            with self._lock:
+                self._stats.wins += 1
+
+    def _timed(self, fn: Callable[[], httpx.Response]) -> httpx.Response:
+        started = time.monotonic()
+        try:
+            return fn()
+        finally:
+            self.observe(time.monotonic() - started)
+
+    async def _atimed(self, fn: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        started = time.monotonic()
+        try:
+            return await fn()
+        finally:
+            # A cancelled original still tells us it took at least this long.
+            self.observe(time.monotonic() - started)
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="swikly-hedge")
+            return self._pool
+
+
+def _close_response(future: "Future[httpx.Response]") -> None:
+    if future.exception() is None:
+        future.result().close()
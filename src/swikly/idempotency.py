@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import uuid
+from typing import Any, Literal, Mapping, Optional, Tuple
+
+# How POST/PATCH calls are made safe to retry:
+# - "off":       nothing is generated; POST/PATCH calls are retried only when
+#                the caller passes ``idempotency_key`` (default)
+# - "custom_id": requests.create() sends a generated ``customId`` with
+#                ``customIdMustBeUnique`` so Swikly rejects a duplicate creation,
+#                and a rejected retry returns the request the first attempt made;
+#                other POST/PATCH calls are retried only with an explicit key
+# - "header":    every POST/PATCH carries an ``Idempotency-Key`` header, generated
+#                once per call and resent unchanged on each attempt. Swikly does
+#                not document this header, so only use it once you know your
+#                endpoints deduplicate on it: otherwise a retry can repeat a refund.
+IdempotencyMode = Literal["header", "custom_id", "off"]
+IDEMPOTENCY_MODES: Tuple[str, ...] = ("header", "custom_id", "off")
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+# Methods that are not safe to repeat unless the server can deduplicate them.
+_KEYED_METHODS = frozenset({"POST", "PATCH"})
+
+
+def new_idempotency_key() -> str:
+    return uuid.uuid4().hex
+
+
+def _has_key(headers: Optional[Mapping[str, str]]) -> bool:
+    return bool(headers) and any(k.lower() == "idempotency-key" for k in headers)  # type: ignore[union-attr]
+
+
+def _with_key(headers: Optional[Mapping[str, str]], key: str) -> dict:
+    return {**(headers or {}), IDEMPOTENCY_HEADER: key}
+
+
+def _retry_safe(method: str, headers: Optional[Mapping[str, str]], json: Any) -> bool:
+    """Whether a 5xx or transport error may be retried without risking a duplicate."""
+    if method.upper() not in _KEYED_METHODS:
+        return True
+    if _has_key(headers):
+        return True
+    return isinstance(json, dict) and bool(json.get("customId")) and json.get("customIdMustBeUnique") is True
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional, Tuple
+
+
+@dataclass
+class IndexStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class CustomIdIndex:
+    """Bounded in-process map from ``(account_id, customId)`` to request id.
+
+    Clients fill it from every request returned by ``requests.create``,
+    ``get`` and ``list`` so ``requests.get_by_custom_id`` can skip the search.
+    The least recently used entries go once ``max_size`` is reached. Share one
+    index between clients to share what they have seen. When several requests
+    carry the same ``customId`` the newest one (by ``createdAt``) is kept, as
+    the search in ``get_by_custom_id`` would find it first.
+    """
+
+    def __init__(self, *, max_size: int = 10_000) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+        self.max_size = max_size
+        # (account_id, customId) -> (request id, createdAt or "")
+        self._ids: "OrderedDict[Tuple[str, str], Tuple[str, str]]" = OrderedDict()
+        self._stats = IndexStats()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def stats(self) -> IndexStats:
+        with self._lock:
+            return IndexStats(hits=self._stats.hits, misses=self._stats.misses, evictions=self._stats.evictions)
+
+    def get(self, account_id: str, custom_id: str) -> Optional[str]:
+        key = (account_id, custom_id)
+        with self._lock:
+            entry = self._ids.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            self._ids.move_to_end(key)
+            self._stats.hits += 1
+            return entry[0]
+
+    def put(self, account_id: str, custom_id: str, request_id: str) -> None:
+        with self._lock:
+            self._put(account_id, custom_id, request_id, "")
+
+    def put_many(self, account_id: str, requests: Iterable[Any]) -> None:
+        """Index requests (models or raw dicts); ones without a ``customId`` are skipped.
+
+        Lists come newest first, so for a repeated ``customId`` the first
+        occurrence wins, and an entry never gives way to an older request.
+        """
+        seen = set()
+        with self._lock:
+            for request in requests:
+                custom_id, request_id, created_at = _ids_of(request)
+                if not (custom_id and request_id) or custom_id in seen:
+                    continue
+                seen.add(custom_id)
+                current = self._ids.get((account_id, custom_id))
+                if current is not None and created_at and current[1] > created_at:
+                    continue
+                self._put(account_id, custom_id, request_id, created_at or "")
+
+    def discard(self, account_id: str, custom_id: str) -> None:
+        with self._lock:
+            self._ids.pop((account_id, custom_id), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._ids.clear()
+
+    def _put(self, account_id: str, custom_id: str, request_id: str, created_at: str) -> None:
+        key = (account_id, custom_id)
+        self._ids[key] = (request_id, created_at)
+        self._ids.move_to_end(key)
+        if len(self._ids) > self.max_size:
+            self._ids.popitem(last=False)
+            self._stats.evictions += 1
+
+
+def _ids_of(request: Any) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    # Requests are models, or plain dicts when the client decodes in "raw" mode.
+    if isinstance(request, dict):
+        return request.get("customId"), request.get("id"), request.get("createdAt")
+    return getattr(request, "customId", None), getattr(request, "id", None), getattr(request, "createdAt", None)
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Sequence
+
+import httpx
+
+from .utils import _path_template
+
+logger = logging.getLogger("swikly.instrumentation")
+
+# httpcore trace events that close each phase of an attempt, and the event that opens it.
+# DNS resolution happens inside connect_tcp, so it is part of "connect".
+_PHASES = (
+    ("connect", "connect_tcp.started", "connect_tcp.complete"),
+    ("tls", "start_tls.started", "start_tls.complete"),
+    ("send", "send_request_headers.started", "send_request_body.complete"),
+    ("server", "send_request_body.complete", "receive_response_headers.complete"),
+    ("download", "receive_response_body.started", "receive_response_body.complete"),
+)
+
+
+@dataclass
+class AttemptInfo:
+    """One HTTP attempt of a call, as seen by :class:`ClientHooks`.
+
+    ``timings`` holds seconds per phase (``connect`` including DNS, ``tls``,
+    ``send``, ``server`` i.e. time to first byte, ``download``) when the
+    transport reports them, plus ``total``. ``context`` is scratch space for
+    hooks to carry state (e.g. a span) from ``before_send`` to ``after_response``.
+    """
+
+    method: str
+    path: str
+    url: str
+    attempt: int
+    endpoint: str = ""
+    status_code: Optional[int] = None
+    request_bytes: Optional[int] = None
+    response_bytes: Optional[int] = None
+    wire_bytes: Optional[int] = None  # as downloaded, before content decoding
+    request_id: Optional[str] = None
+    error: Optional[BaseException] = None
+    timings: Dict[str, float] = field(default_factory=dict)
+    context: Dict[str, Any] = field(default_factory=dict)
+    started: float = 0.0
+    _marks: Dict[str, float] = field(default_factory=dict, repr=False)
+
+    def trace(self, event: str, info: Dict[str, Any]) -> None:
+        # httpx "trace" extension; names look like "connection.connect_tcp.started".
+        self._marks[event.split(".", 1)[1]] = time.perf_counter()
+
+    async def atrace(self, event: str, info: Dict[str, Any]) -> None:
+        self.trace(event, info)
+
+
+@dataclass
+class DecodeInfo:
+    model: str
+    mode: str
+    seconds: float
+    size: int
+
+
+class ClientHooks:
+    """Callbacks around each call of a client; override the ones you need.
+
+    Hooks run inline, so keep them cheap. An exception raised by a hook is
+    logged and never fails the call.
+    """
+
+    def before_send(self, info: AttemptInfo) -> None:
+        return None
+
+    def after_response(self, info: AttemptInfo) -> None:
+        """Called after every attempt, with ``info.error`` set on transport errors."""
+        return None
+
+    def on_retry(self, info: AttemptInfo, delay: float) -> None:
+        return None
+
+    def on_decode(self, info: DecodeInfo) -> None:
+        return None
+
+
+def _emit(hooks: Sequence[ClientHooks], name: str, *args: Any) -> None:
+    for hook in hooks:
+        try:
+            getattr(hook, name)(*args)
+        except Exception:
+            logger.exception("Swikly client hook %s.%s failed", type(hook).__name__, name)
+
+
+def _begin(hooks: Sequence[ClientHooks], method: str, path: str, url: str, attempt: int) -> AttemptInfo:
+    info = AttemptInfo(method=method, path=path, url=url, attempt=attempt, endpoint=_path_template(path))
+    info.started = time.perf_counter()
+    _emit(hooks, "before_send", info)
+    return info
+
+
+def _finish(
+    hooks: Sequence[ClientHooks],
+    info: AttemptInfo,
+    resp: Optional[httpx.Response] = None,
+    error: Optional[BaseException] = None,
+) -> None:
+    info.timings["total"] = time.perf_counter() - info.started
+    marks = info._marks
+    for phase, start, end in _PHASES:
+        if start in marks and end in marks:
+            info.timings[phase] = marks[end] - marks[start]
+    info.error = error
+    if resp is not None:
+        info.status_code = resp.status_code
+        length = resp.request.headers.get("content-length")
+        info.request_bytes = int(length) if length else None
+        info.response_bytes = len(resp.content)
+        info.wire_bytes = resp.num_bytes_downloaded
+        info.request_id = resp.headers.get("X-Request-Id") or resp.headers.get("Request-Id")
+    _emit(hooks, "after_response", info)
+
+
+class OpenTelemetryHooks(ClientHooks):
+    """One client span per attempt (plus a decode span), via ``opentelemetry-api``.
+
+    The package is only imported when this class is instantiated.
+    """
+
+    def __init__(self, tracer: Any = None) -> None:
+        from opentelemetry import trace
+
+        self._trace = trace
+        self._tracer = tracer or trace.get_tracer("swikly")
+
+    def before_send(self, info: AttemptInfo) -> None:
+        span = self._tracer.start_span(
+            f"swikly {info.method} {info.endpoint}",
+            kind=self._trace.SpanKind.CLIENT,
+            attributes={
+                "http.request.method": info.method,
+                "url.full": info.url,
+                "http.request.resend_count": info.attempt,
+            },
+        )
+        info.context["otel_span"] = span
+
+    def after_response(self, info: AttemptInfo) -> None:
+        span = info.context.pop("otel_span", None)
+        if span is None:
+            return
+        if info.status_code is not None:
+            span.set_attribute("http.response.status_code", info.status_code)
+        if info.response_bytes is not None:
+            span.set_attribute("http.response.body.size", info.response_bytes)
+        if info.request_id:
+            span.set_attribute("swikly.request_id", info.request_id)
+        for phase, seconds in info.timings.items():
+            span.set_attribute(f"swikly.timing.{phase}_ms", seconds * 1000)
+        if info.error is not None:
+            span.record_exception(info.error)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        elif info.status_code is not None and info.status_code >= 500:
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        span.end()
+
+    def on_decode(self, info: DecodeInfo) -> None:
+        end = time.time_ns()
+        span = self._tracer.start_span(
+            f"swikly decode {info.model}",
+            start_time=end - int(info.seconds * 1e9),
+            attributes={"swikly.decode.mode": info.mode, "swikly.decode.bytes": info.size},
+        )
+        span.end(end_time=end)
+
+
+class PrometheusHooks(ClientHooks):
+    """Latency, phase, size, retry and decode metrics via ``prometheus_client``.
+
+    The package is only imported when this class is instantiated.
+    """
+
+    def __init__(self, *, registry: Any = None, namespace: str = "swikly") -> None:
+        from prometheus_client import REGISTRY, Counter, Histogram
+
+        registry = registry if registry is not None else REGISTRY
+        self.request_seconds = Histogram(
+            "request_duration_seconds", "Swikly API attempt latency.",
+            ["method", "endpoint", "status"], namespace=namespace, registry=registry,
+        )
+        self.phase_seconds = Histogram(
+            "request_phase_seconds", "Swikly API attempt latency per phase.",
+            ["endpoint", "phase"], namespace=namespace, registry=registry,
+        )
+        self.response_bytes = Histogram(
+            "response_size_bytes", "Swikly API response body size.",
+            ["endpoint"], namespace=namespace, registry=registry,
+            buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304),
+        )
+        self.retries = Counter(
+            "retries_total", "Swikly API attempts that were retried.",
+            ["method", "endpoint", "reason"], namespace=namespace, registry=registry,
+        )
+        self.decode_seconds = Histogram(
+            "decode_duration_seconds", "Time spent turning response bodies into models.",
+            ["model", "mode"], namespace=namespace, registry=registry,
+        )
+
+    def after_response(self, info: AttemptInfo) -> None:
+        status = str(info.status_code) if info.status_code is not None else type(info.error).__name__
+        self.request_seconds.labels(info.method, info.endpoint, status).observe(info.timings["total"])
+        for phase, seconds in info.timings.items():
+            if phase != "total":
+                self.phase_seconds.labels(info.endpoint, phase).observe(seconds)
+        if info.response_bytes is not None:
+            self.response_bytes.labels(info.endpoint).observe(info.response_bytes)
+
+    def on_retry(self, info: AttemptInfo, delay: float) -> None:
+        reason = str(info.status_code) if info.status_code is not None else type(info.error).__name__
+        self.retries.labels(info.method, info.endpoint, reason).inc()
+
+    def on_decode(self, info: DecodeInfo) -> None:
+        self.decode_seconds.labels(info.model, info.mode).observe(info.seconds)
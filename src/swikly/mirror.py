@@ -0,0 +1,388 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, List, Literal, Optional, Sequence, Type, TypeVar, Union, cast
+
+from pydantic import BaseModel
+
+from .decoding import DECODE_MODES, DecodeMode, construct_model
+from .models import Deposit, NoShow, Payment, Request, WebhookEvent
+
+M = TypeVar("M", bound=BaseModel)
+
+MirrorKind = Literal["request", "deposit", "noShow", "payment"]
+_PRODUCTS = ("deposit", "noShow", "payment")
+# Rows are written to the store in batches of this size during a page walk.
+_BATCH = 500
+
+
+@dataclass
+class MirrorRow:
+    kind: str
+    id: str
+    data: str  # the object as JSON
+    account_id: Optional[str] = None
+    request_id: Optional[str] = None
+    custom_id: Optional[str] = None
+    status: Optional[str] = None
+    created_at: Optional[str] = None
+
+
+@dataclass
+class SyncCursor:
+    """The newest request seen by the last page walk of an account."""
+
+    created_at: str
+    id: str
+
+
+class MirrorStore(ABC):
+    """Storage behind :class:`RequestMirror`.
+
+    Rows are keyed on ``(kind, id)``; ``find`` must be served from indexes on
+    ``request_id``, ``(account_id, custom_id)`` and ``status``.
+    """
+
+    @abstractmethod
+    def upsert(self, rows: Sequence[MirrorRow]) -> None:
+        ...
+
+    @abstractmethod
+    def get(self, kind: str, id: str) -> Optional[MirrorRow]:
+        ...
+
+    @abstractmethod
+    def find(
+        self,
+        kind: str,
+        *,
+        account_id: Optional[str] = None,
+        custom_id: Optional[str] = None,
+        status: Optional[str] = None,
+        request_id: Optional[str] = None,
+    ) -> List[MirrorRow]:
+        """Rows matching every given filter, newest first."""
+
+    @abstractmethod
+    def cursor(self, account_id: str) -> Optional[SyncCursor]:
+        ...
+
+    @abstractmethod
+    def set_cursor(self, account_id: str, cursor: SyncCursor) -> None:
+        ...
+
+    def close(self) -> None:
+        return None
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    kind TEXT NOT NULL,
+    id TEXT NOT NULL,
+    account_id TEXT,
+    request_id TEXT,
+    custom_id TEXT,
+    status TEXT,
+    created_at TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (kind, id)
+);
+CREATE INDEX IF NOT EXISTS objects_custom_id ON objects (kind, account_id, custom_id);
+CREATE INDEX IF NOT EXISTS objects_status ON objects (kind, status);
+CREATE INDEX IF NOT EXISTS objects_request_id ON objects (request_id);
+CREATE TABLE IF NOT EXISTS sync_cursors (
+    account_id TEXT PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    id TEXT NOT NULL
+);
+"""
+
+_COLUMNS = ("kind", "id", "data", "account_id", "request_id", "custom_id", "status", "created_at")
+_FILTERS = ("account_id", "custom_id", "status", "request_id")
+
+
+class SQLiteMirrorStore(MirrorStore):
+    """:class:`MirrorStore` in a SQLite database (in memory unless ``path`` is given)."""
+
+    def __init__(self, path: str = ":memory:") -> None:
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._db:
+            if path != ":memory:":
+                self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.executescript(_SCHEMA)
+
+    def upsert(self, rows: Sequence[MirrorRow]) -> None:
+        if not rows:
+            return
+        values = [(r.kind, r.id, r.data, r.account_id, r.request_id, r.custom_id, r.status, r.created_at) for r in rows]
+        with self._lock, self._db:
+            self._db.executemany(
+                f"INSERT OR REPLACE INTO objects ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})",
+                values,
+            )
+
+    def get(self, kind: str, id: str) -> Optional[MirrorRow]:
+        with self._lock:
+            found = self._db.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM objects WHERE kind = ? AND id = ?", (kind, id)
+            ).fetchone()
+        return MirrorRow(*found) if found else None
+
+    def find(
+        self,
+        kind: str,
+        *,
+        account_id: Optional[str] = None,
+        custom_id: Optional[str] = None,
+        status: Optional[str] = None,
+        request_id: Optional[str] = None,
+    ) -> List[MirrorRow]:
+        given = dict(zip(_FILTERS, (account_id, custom_id, status, request_id)))
+        where = ["kind = ?"] + [f"{column} = ?" for column, value in given.items() if value is not None]
+        args = [kind] + [value for value in given.values() if value is not None]
+        with self._lock:
+            found = self._db.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM objects WHERE {' AND '.join(where)} ORDER BY created_at DESC",
+                args,
+            ).fetchall()
+        return [MirrorRow(*row) for row in found]
+
+    def cursor(self, account_id: str) -> Optional[SyncCursor]:
+        with self._lock:
+            found = self._db.execute(
+                "SELECT created_at, id FROM sync_cursors WHERE account_id = ?", (account_id,)
+            ).fetchone()
+        return SyncCursor(*found) if found else None
+
+    def set_cursor(self, account_id: str, cursor: SyncCursor) -> None:
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO sync_cursors (account_id, created_at, id) VALUES (?, ?, ?)",
+                (account_id, cursor.created_at, cursor.id),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+class RequestMirror:
+    """Local copy of an account's requests, with their deposits, no-shows and payments.
+
+    :meth:`refresh` walks the requests list newest first and stops at the
+    newest request the previous walk saw, so a sync costs one page plus the new
+    requests rather than a full listing. Changes to existing requests arrive via
+    :meth:`apply_event`, e.g. ``processor.add_handler("*", mirror.apply_event)``.
+    Reads never touch the API; results are decoded per ``decode`` (``"json"``
+    by default, ``"raw"`` for plain dicts).
+
+    ``refresh`` needs a :class:`SwiklyClient`, ``arefresh`` an
+    :class:`AsyncSwiklyClient`.
+    """
+
+    def __init__(self, client: Any, *, store: Optional[MirrorStore] = None, decode: DecodeMode = "json") -> None:
+        if decode not in DECODE_MODES:
+            raise ValueError(f"decode must be one of {', '.join(DECODE_MODES)}")
+        self._client = client
+        self.store = store if store is not None else SQLiteMirrorStore()
+        self.decode = decode
+
+    # Sync
+
+    def refresh(
+        self,
+        account_id: str,
+        *,
+        full: bool = False,
+        per_page: int = 100,
+        with_: Optional[Sequence[str] | str] = None,
+    ) -> int:
+        """Fetch requests created since the last refresh (all of them with ``full=True``); returns how many."""
+        walk = _Walk(self.store, account_id, full)
+        for item in self._client.requests.iter_all(account_id=account_id, per_page=per_page, with_=with_):
+            if not walk.add(item):
+                break
+        return walk.done()
+
+    async def arefresh(
+        self,
+        account_id: str,
+        *,
+        full: bool = False,
+        per_page: int = 100,
+        with_: Optional[Sequence[str] | str] = None,
+        prefetch: int = 0,
+    ) -> int:
+        walk = _Walk(self.store, account_id, full)
+        pages = self._client.requests.aiter_all(account_id=account_id, per_page=per_page, with_=with_, prefetch=prefetch)
+        try:
+            async for item in pages:
+                if not walk.add(item):
+                    break
+        finally:
+            await pages.aclose()
+        return walk.done()
+
+    def apply_event(self, event: Union[WebhookEvent, Dict[str, Any]], *, account_id: Optional[str] = None) -> None:
+        """Upsert the request and products carried by a webhook event.
+
+        ``account_id`` (the account whose secret signed the delivery) is stored
+        on products whose request is not mirrored yet, so they can still be
+        found per account.
+        """
+        data = _as_dict(event)
+        rows: List[MirrorRow] = []
+        request = data.get("request")
+        if isinstance(request, dict):
+            rows.extend(_request_rows(request))
+        for kind in _PRODUCTS:
+            product = data.get(kind)
+            if isinstance(product, dict):
+                rows.extend(self._product_rows(kind, product, account_id))
+        self.store.upsert(rows)
+
+    # Reads
+
+    def get_request(self, request_id: str) -> Optional[Request]:
+        return self._load(Request, self.store.get("request", request_id))
+
+    def get_request_by_custom_id(self, account_id: str, custom_id: str) -> Optional[Request]:
+        """The newest request of the account with this ``customId``."""
+        found = self.store.find("request", account_id=account_id, custom_id=custom_id)
+        return self._load(Request, found[0] if found else None)
+
+    def requests_by_status(
+        self,
+        status: str,
+        *,
+        product: Optional[str] = None,
+        account_id: Optional[str] = None,
+    ) -> List[Request]:
+        """Requests whose deposit, no-show or payment (or only ``product``) has ``status``."""
+        kinds = (product,) if product is not None else _PRODUCTS
+        seen: Dict[str, Request] = {}
+        for kind in kinds:
+            for row in self.store.find(kind, status=status, account_id=account_id):
+                if row.request_id is not None and row.request_id not in seen:
+                    request = self.get_request(row.request_id)
+                    if request is not None:
+                        seen[row.request_id] = request
+        return list(seen.values())
+
+    def get_deposit(self, deposit_id: str) -> Optional[Deposit]:
+        return self._load(Deposit, self.store.get("deposit", deposit_id))
+
+    def get_no_show(self, no_show_id: str) -> Optional[NoShow]:
+        return self._load(NoShow, self.store.get("noShow", no_show_id))
+
+    def get_payment(self, payment_id: str) -> Optional[Payment]:
+        return self._load(Payment, self.store.get("payment", payment_id))
+
+    def close(self) -> None:
+        self.store.close()
+
+    def _load(self, model: Type[M], row: Optional[MirrorRow]) -> Optional[M]:
+        if row is None:
+            return None
+        if self.decode in ("json", "columnar"):
+            return model.model_validate_json(row.data)
+        data = json.loads(row.data)
+        if self.decode == "validate":
+            return model.model_validate(data)
+        if self.decode == "construct":
+            return construct_model(model, data)
+        return cast(M, data)  # "raw": the dict stands in for the model
+
+    def _product_rows(self, kind: str, product: Dict[str, Any], account_id: Optional[str]) -> List[MirrorRow]:
+        # A product event changes the copy embedded in its request too.
+        product = dict(product)
+        embedded = product.pop("request", None)
+        if isinstance(embedded, dict):
+            return _request_rows({**embedded, kind: product})
+        parent = self.store.get("request", product.get("requestId") or "")
+        if parent is None:
+            return [_product_row(kind, product, None, account_id)]
+        request = json.loads(parent.data)
+        request[kind] = product
+        return _request_rows(request)
+
+
+class _Walk:
+    """One newest-first page walk, written to the store in batches."""
+
+    def __init__(self, store: MirrorStore, account_id: str, full: bool) -> None:
+        self.store = store
+        self.account_id = account_id
+        self.stop_at = None if full else store.cursor(account_id)
+        self.newest: Optional[SyncCursor] = None
+        self.rows: List[MirrorRow] = []
+        self.count = 0
+
+    def add(self, item: Any) -> bool:
+        """Buffer one request; False once the walk reached what the last one saw."""
+        data = _as_dict(item)
+        stop_at = self.stop_at
+        if stop_at is not None and (data["id"] == stop_at.id or data["createdAt"] < stop_at.created_at):
+            return False
+        if self.newest is None:
+            self.newest = SyncCursor(data["createdAt"], data["id"])
+        self.rows.extend(_request_rows(data))
+        self.count += 1
+        if len(self.rows) >= _BATCH:
+            self.store.upsert(self.rows)
+            self.rows = []
+        return True
+
+    def done(self) -> int:
+        self.store.upsert(self.rows)
+        # Only a completed walk moves the cursor, so an interrupted one is simply redone.
+        if self.newest is not None:
+            self.store.set_cursor(self.account_id, self.newest)
+        return self.count
+
+
+def _as_dict(item: Any) -> Dict[str, Any]:
+    # Items are models, or plain dicts when the client decodes in "raw" mode.
+    if isinstance(item, dict):
+        return item
+    return cast(Dict[str, Any], item.model_dump(mode="json", by_alias=True, exclude_unset=True))
+
+
+def _request_rows(request: Dict[str, Any]) -> List[MirrorRow]:
+    rows = [
+        MirrorRow(
+            kind="request",
+            id=request["id"],
+            data=json.dumps(request, separators=(",", ":")),
+            account_id=request.get("accountId"),
+            request_id=request["id"],
+            custom_id=request.get("customId"),
+            created_at=request.get("createdAt"),
+        )
+    ]
+    for kind in _PRODUCTS:
+        product = request.get(kind)
+        if isinstance(product, dict):
+            rows.append(_product_row(kind, product, request))
+    return rows
+
+
+def _product_row(
+    kind: str, product: Dict[str, Any], request: Optional[Dict[str, Any]], account_id: Optional[str] = None
+) -> MirrorRow:
+    parent = request or {}
+    return MirrorRow(
+        kind=kind,
+        id=product["id"],
+        data=json.dumps(product, separators=(",", ":")),
+        account_id=parent.get("accountId", account_id),
+        request_id=product.get("requestId") or parent.get("id"),
+        custom_id=parent.get("customId"),
+        status=product.get("status"),
+        created_at=product.get("createdAt"),
+    )
@@ -260,8 +260,19 @@ class ReclaimResponse(SwiklyModel):
 
 
 class FileCreateResponse(SwiklyModel):
-    file: Any
+    file: File
 
 
 class ShortLinkResponse(SwiklyModel):
     shortLink: ShortLink
+
+
+# Webhooks
+class WebhookEvent(SwiklyModel):
+    """A webhook delivery, e.g. ``{"event": "requestSecured", "request": {...}}``."""
+
+    event: str
+    request: Optional[Request] = None
+    deposit: Optional[Deposit] = None
+    noShow: Optional[NoShow] = None
+    payment: Optional[Payment] = None
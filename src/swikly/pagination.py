@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Iterator, List, Optional
+
+
+def _items(page: Any, attr: str) -> List[Any]:
+    # Pages are models, or plain dicts when the client decodes in "raw" mode.
+    if isinstance(page, dict):
+        return list(page.get(attr) or [])
+    return list(getattr(page, attr) or [])
+
+
+def _last_page(page: Any, current: int) -> int:
+    meta = page.get("meta") if isinstance(page, dict) else getattr(page, "meta", None)
+    if meta is None:
+        return current
+    if isinstance(meta, dict):
+        return int(meta.get("lastPage", current))
+    return int(meta.lastPage)
+
+
+def iter_pages(fetch_page: Callable[[int], Any], attr: str, *, start_page: int = 1) -> Iterator[Any]:
+    """Yield items from consecutive pages, fetching each page only when the previous one is drained.
+
+    Only one page is referenced at a time, so memory stays flat however many
+    pages the endpoint has.
+    """
+    page_no = start_page
+    while True:
+        page = fetch_page(page_no)
+        last_page = _last_page(page, page_no)
+        items = _items(page, attr)
+        del page
+        if not items:
+            return
+        yield from items
+        del items
+        if page_no >= last_page:
+            return
+        page_no += 1
+
+
+async def aiter_pages(
+    fetch_page: Callable[[int], Awaitable[Any]],
+    attr: str,
+    *,
+    start_page: int = 1,
+    prefetch: int = 0,
+) -> AsyncIterator[Any]:
+    """Async counterpart of :func:`iter_pages`.
+
+    With ``prefetch > 0`` up to that many following pages are requested
+    concurrently while the current page is being consumed. Pending fetches are
+    cancelled and awaited if the iteration stops early.
+    """
+    if prefetch < 0:
+        raise ValueError("prefetch must be >= 0")
+
+    page_no = start_page
+    page: Optional[Any] = await fetch_page(page_no)
+    last_page = _last_page(page, page_no)
+    next_page = page_no + 1
+    pending: Deque["asyncio.Task[Any]"] = deque()
+    try:
+        while page is not None:
+            last_page = max(last_page, _last_page(page, page_no))
+            items = _items(page, attr)
+            page = None
+            if not items:
+                return
+            while len(pending) < prefetch and next_page <= last_page:
+                pending.append(asyncio.ensure_future(fetch_page(next_page)))
+                next_page += 1
+
+            for item in items:
+                yield item
+            del items
+
+            page_no += 1
+            if pending:
+                page = await pending.popleft()
+            elif page_no <= last_page:
+                page = await fetch_page(page_no)
+                next_page = page_no + 1
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            # Let the cancelled fetches unwind (and release their connections) before returning.
+            await asyncio.gather(*pending, return_exceptions=True)
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar
+
+import httpx
+
+from .client import AsyncSwiklyClient, SwiklyClient, create_async_http_client, create_http_client
+from .ratelimit import RateLimiter
+
+# (token, legacy_api_key, legacy_api_secret)
+TenantKey = Tuple[Optional[str], Optional[str], Optional[str]]
+ClientT = TypeVar("ClientT", SwiklyClient, AsyncSwiklyClient)
+
+_POOL_OWNED = ("http_client", "transport", "limits", "http2", "rate_limiter", "token", "legacy_api_key", "legacy_api_secret")
+
+
+@dataclass
+class _Tenant(Generic[ClientT]):
+    client: ClientT
+    last_used: float
+
+
+class _BaseClientPool(ABC, Generic[ClientT]):
+    def __init__(
+        self,
+        *,
+        max_clients: int = 1000,
+        idle_timeout: Optional[float] = 600.0,
+        rate_limiter_factory: Optional[Callable[[], RateLimiter]] = None,
+        client_options: Dict[str, Any],
+    ) -> None:
+        if max_clients < 1:
+            raise ValueError("max_clients must be >= 1")
+        clashing = sorted(set(client_options) & set(_POOL_OWNED))
+        if clashing:
+            raise TypeError(f"{', '.join(clashing)} cannot be set per client in a pool")
+        self.max_clients = max_clients
+        self.idle_timeout = idle_timeout
+        self.rate_limiter_factory = rate_limiter_factory
+        self._client_options = client_options
+        # Least recently used first.
+        self._tenants: "OrderedDict[TenantKey, _Tenant[ClientT]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._tenants)
+
+    def get(
+        self,
+        token: Optional[str] = None,
+        *,
+        legacy_api_key: Optional[str] = None,
+        legacy_api_secret: Optional[str] = None,
+    ) -> ClientT:
+        """The client for these credentials, created on first use."""
+        if not token and not (legacy_api_key and legacy_api_secret):
+            raise ValueError("a token or a legacy_api_key/legacy_api_secret pair is required")
+        key: TenantKey = (token, legacy_api_key, legacy_api_secret)
+        now = time.monotonic()
+        with self._lock:
+            tenant = self._tenants.get(key)
+            if tenant is None:
+                tenant = _Tenant(self._new_client(key), now)
+                self._tenants[key] = tenant
+            else:
+                tenant.last_used = now
+                self._tenants.move_to_end(key)
+            evicted = self._evictable(now)
+        self._close_clients(evicted)
+        return tenant.client
+
+    def evict(
+        self,
+        token: Optional[str] = None,
+        *,
+        legacy_api_key: Optional[str] = None,
+        legacy_api_secret: Optional[str] = None,
+    ) -> bool:
+        """Drop the client for these credentials (e.g. after the merchant left); False if there was none."""
+        with self._lock:
+            tenant = self._tenants.pop((token, legacy_api_key, legacy_api_secret), None)
+        if tenant is None:
+            return False
+        self._close_clients([tenant.client])
+        return True
+
+    def _evictable(self, now: float) -> List[ClientT]:
+        # Called with the lock held. The most recent client is never evicted.
+        evicted: List[ClientT] = []
+        while len(self._tenants) > 1:
+            key, tenant = next(iter(self._tenants.items()))
+            idle = self.idle_timeout is not None and now - tenant.last_used >= self.idle_timeout
+            if not idle and len(self._tenants) <= self.max_clients:
+                break
+            del self._tenants[key]
+            evicted.append(tenant.client)
+        return evicted
+
+    def _take_all(self) -> List[ClientT]:
+        with self._lock:
+            clients = [tenant.client for tenant in self._tenants.values()]
+            self._tenants.clear()
+        return clients
+
+    @abstractmethod
+    def _new_client(self, key: TenantKey) -> ClientT:
+        ...
+
+    @abstractmethod
+    def _close_clients(self, clients: List[ClientT]) -> None:
+        ...
+
+
+class SwiklyClientPool(_BaseClientPool[SwiklyClient]):
+    """Lazily created :class:`SwiklyClient` per merchant token, for multi-tenant platforms.
+
+    All clients share one connection pool; each token gets its own rate
+    limiter from ``rate_limiter_factory``. At most ``max_clients`` clients are
+    kept (least recently used go first) and clients unused for
+    ``idle_timeout`` seconds are dropped, so memory follows the active
+    tenants. Other keyword arguments (``environment``, ``retry_policy``,
+    ``cache``, ``hooks``...) are passed to every client.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_clients: int = 1000,
+        idle_timeout: Optional[float] = 600.0,
+        rate_limiter_factory: Optional[Callable[[], RateLimiter]] = None,
+        http_client: Optional[httpx.Client] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        transport: Optional[httpx.BaseTransport] = None,
+        **client_options: Any,
+    ) -> None:
+        super().__init__(
+            max_clients=max_clients,
+            idle_timeout=idle_timeout,
+            rate_limiter_factory=rate_limiter_factory,
+            client_options=client_options,
+        )
+        self._owns_http = http_client is None
+        self._http = http_client or create_http_client(limits=limits, http2=http2, transport=transport)
+
+    def close(self) -> None:
+        self._close_clients(self._take_all())
+        if self._owns_http:
+            self._http.close()
+
+    def _new_client(self, key: TenantKey) -> SwiklyClient:
+        token, legacy_api_key, legacy_api_secret = key
+        limiter = self.rate_limiter_factory() if self.rate_limiter_factory is not None else None
+        return SwiklyClient(
+            token=token,
+            legacy_api_key=legacy_api_key,
+            legacy_api_secret=legacy_api_secret,
+            rate_limiter=limiter,
+            http_client=self._http,
+            **self._client_options,
+        )
+
+    def _close_clients(self, clients: List[SwiklyClient]) -> None:
+        # Clients never close the shared pool, so one still in use by another thread keeps working.
+        for client in clients:
+            client.close()
+
+
+class AsyncSwiklyClientPool(_BaseClientPool[AsyncSwiklyClient]):
+    """Async :class:`SwiklyClientPool` handing out :class:`AsyncSwiklyClient` instances."""
+
+    def __init__(
+        self,
+        *,
+        max_clients: int = 1000,
+        idle_timeout: Optional[float] = 600.0,
+        rate_limiter_factory: Optional[Callable[[], RateLimiter]] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        **client_options: Any,
+    ) -> None:
+        super().__init__(
+            max_clients=max_clients,
+            idle_timeout=idle_timeout,
+            rate_limiter_factory=rate_limiter_factory,
+            client_options=client_options,
+        )
+        self._owns_http = http_client is None
+        self._http = http_client or create_async_http_client(limits=limits, http2=http2, transport=transport)
+
+    async def aclose(self) -> None:
+        for client in self._take_all():
+            await client.aclose()
+        if self._owns_http:
+            await self._http.aclose()
+
+    def _new_client(self, key: TenantKey) -> AsyncSwiklyClient:
+        token, legacy_api_key, legacy_api_secret = key
+        limiter = self.rate_limiter_factory() if self.rate_limiter_factory is not None else None
+        return AsyncSwiklyClient(
+            token=token,
+            legacy_api_key=legacy_api_key,
+            legacy_api_secret=legacy_api_secret,
+            rate_limiter=limiter,
+            http_client=self._http,
+            **self._client_options,
+        )
+
+    def _close_clients(self, clients: List[AsyncSwiklyClient]) -> None:
+        # Clients given a pool own no sockets, so dropping them is all eviction needs.
+        return None
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from collections import namedtuple
+from functools import lru_cache
+from typing import Any, Dict, Optional, Sequence, Tuple, Type, TypeVar, cast
+
+import httpx
+from pydantic import BaseModel
+
+from .models import ResultsMeta
+
+M = TypeVar("M", bound=BaseModel)
+
+Fields = Sequence[str] | str
+
+
+class Projection:
+    """Turns a resource dict into a named tuple holding only the requested fields.
+
+    Fields use the API's camelCase names; nested objects are reached with dots,
+    e.g. ``("id", "customId", "deposit.status")`` gives rows where
+    ``row.deposit.status`` works and everything else is never materialised.
+    Missing keys project to ``None``.
+    """
+
+    __slots__ = ("_row", "_children")
+
+    def __init__(self, name: str, tree: Dict[str, Any]) -> None:
+        self._row: Any = namedtuple(name, list(tree))  # type: ignore[misc]
+        self._children: Tuple[Tuple[str, Optional[Projection]], ...] = tuple(
+            (key, Projection(f"{name}_{key}", sub) if sub else None) for key, sub in tree.items()
+        )
+
+    def __call__(self, data: Any) -> Any:
+        if not isinstance(data, dict):
+            return data
+        values = []
+        for key, child in self._children:
+            value = data.get(key)
+            if child is not None and value is not None:
+                value = [child(v) for v in value] if isinstance(value, list) else child(value)
+            values.append(value)
+        return self._row._make(values)
+
+
+@lru_cache(maxsize=256)
+def _compile(fields: Tuple[str, ...]) -> Projection:
+    tree: Dict[str, Any] = {}
+    for path in fields:
+        node = tree
+        for part in path.split("."):
+            if not part.isidentifier():
+                raise ValueError(f"Invalid field in projection: {path!r}")
+            node = node.setdefault(part, {})
+    return Projection("Projected", tree)
+
+
+def compile_projection(fields: Fields) -> Projection:
+    if isinstance(fields, str):
+        fields = [f.strip() for f in fields.split(",") if f.strip()]
+    if not fields:
+        raise ValueError("fields must name at least one attribute")
+    return _compile(tuple(fields))
+
+
+def project_response(resp: httpx.Response, model: Type[M], fields: Fields) -> M:
+    """Decode ``resp`` into ``model`` with every resource replaced by its projection.
+
+    The wrapper keeps its usual shape (``.requests``, ``.deposit``, ``.meta``...)
+    so callers and paginators work unchanged; only the resources are slimmed.
+    """
+    project = compile_projection(fields)
+    data = resp.json()
+    values: Dict[str, Any] = {}
+    for key, value in data.items():
+        if key == "meta":
+            values[key] = ResultsMeta.model_validate(value) if value is not None else None
+        elif isinstance(value, list):
+            values[key] = [project(v) for v in value]
+        else:
+            values[key] = project(value)
+    return cast(M, model.model_construct(**values))
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Optional
+
+import httpx
+
+from .utils import _read_retry_after
+
+
+class RateLimiter:
+    """Interface for client-wide rate limiters.
+
+    ``reserve`` claims a slot and returns how long the caller must wait before
+    sending; it never blocks itself, so one limiter can be shared by threads and
+    coroutines alike (the client sleeps or awaits accordingly). ``observe`` feeds
+    every response back so the limiter can learn the server's limits.
+    """
+
+    def reserve(self) -> float:
+        return 0.0
+
+    def observe(self, status_code: int, headers: httpx.Headers) -> None:
+        return None
+
+
+class TokenBucketRateLimiter(RateLimiter):
+    """Token bucket that queues callers and adapts to the server's throttling.
+
+    Requests are spaced ``1 / rate`` seconds apart once ``burst`` tokens are
+    used up. A 429 blocks the bucket for ``Retry-After`` and halves the rate;
+    every successful response then grows it back by ``recovery`` requests/s up
+    to the configured rate. ``X-RateLimit-Limit`` (over ``window`` seconds) caps
+    the rate, and ``X-RateLimit-Remaining: 0`` with ``X-RateLimit-Reset`` blocks
+    until the reset time.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float = 10.0,
+        burst: int = 10,
+        min_rate: float = 0.5,
+        recovery: float = 0.1,
+        window: float = 60.0,
+    ) -> None:
+        if rate <= 0 or burst < 1 or min_rate <= 0:
+            raise ValueError("rate and min_rate must be > 0 and burst >= 1")
+        self.max_rate = rate
+        self.burst = burst
+        self.min_rate = min(min_rate, rate)
+        self.recovery = recovery
+        self.window = window
+        self._rate = rate
+        self._tat = 0.0  # theoretical arrival time of the next request (monotonic)
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            interval = 1.0 / self._rate
+            tolerance = (self.burst - 1) * interval
+            tat = max(self._tat, now, self._blocked_until)
+            allow_at = max(tat - tolerance, self._blocked_until)
+            self._tat = tat + interval
+            return max(0.0, allow_at - now)
+
+    def observe(self, status_code: int, headers: httpx.Headers) -> None:
+        with self._lock:
+            limit = _int_header(headers, "X-RateLimit-Limit")
+            if limit is not None and limit > 0 and self.window > 0:
+                self.max_rate = max(self.min_rate, limit / self.window)
+
+            if status_code == 429:
+                retry_after = _read_retry_after(headers)
+                self._rate = max(self.min_rate, self._rate / 2)
+                self._block(float(retry_after) if retry_after is not None else 1.0 / self._rate)
+                return
+
+            remaining = _int_header(headers, "X-RateLimit-Remaining")
+            reset = _int_header(headers, "X-RateLimit-Reset")
+            if remaining == 0 and reset is not None:
+                self._block(max(0.0, reset - time.time()))
+
+            if 200 <= status_code < 500:
+                self._rate = min(self.max_rate, self._rate + self.recovery)
+            else:
+                self._rate = min(self._rate, self.max_rate)
+
+    def _block(self, seconds: float) -> None:
+        until = time.monotonic() + seconds
+        if until <= self._blocked_until:
+            return
+        self._blocked_until = until
+        # Drop the accumulated burst so waiters resume one interval apart
+        # instead of all at once when the block lifts.
+        tolerance = (self.burst - 1) / self._rate
+        self._tat = max(self._tat, until + tolerance)
+
+
+def _int_header(headers: httpx.Headers, name: str) -> Optional[int]:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, List, Optional, Set, Tuple
+
+
+class ReplayStore(ABC):
+    """Remembers webhook deliveries that were already accepted.
+
+    ``add`` atomically records ``key`` and returns False if it was already
+    present. ``timestamp`` is the delivery's signed timestamp, or its receive
+    time for keys from ``dedup_key`` (retries of an event may be re-signed),
+    which lets stores expire keys once the tolerance window has passed.
+    """
+
+    @abstractmethod
+    def add(self, key: str, timestamp: int) -> bool:
+        ...
+
+    @abstractmethod
+    def discard(self, key: str, timestamp: int) -> None:
+        ...
+
+
+class InMemoryReplayStore(ReplayStore):
+    """Time-bucketed ring of sets keyed by the delivery timestamp.
+
+    Timestamps accepted by the signature check lie within ``window_seconds``
+    of now on either side, so the ring covers twice the window split into
+    ``buckets`` slots. A key is looked up in every live slot (one set probe
+    each), so an event-id key bucketed by receive time is still found when a
+    re-signed retry arrives later. Slots are recycled as time moves on, so
+    keys expire with the window.
+    If more than ``max_entries`` keys are live, the oldest slot is dropped early.
+    ``tolerance_seconds`` is the signature check's tolerance; a shorter window
+    would forget deliveries that can still be replayed, so it is rejected.
+    """
+
+    def __init__(
+        self,
+        *,
+        window_seconds: int = 10 * 60,
+        buckets: int = 20,
+        max_entries: int = 1_000_000,
+        tolerance_seconds: int = 10 * 60,
+    ) -> None:
+        if window_seconds < 1 or buckets < 1 or max_entries < 1:
+            raise ValueError("window_seconds, buckets and max_entries must be >= 1")
+        if window_seconds < tolerance_seconds:
+            raise ValueError("window_seconds must be >= tolerance_seconds")
+        self.window_seconds = window_seconds
+        self._span = max(1, -(-2 * window_seconds // buckets))
+        self._slots: List[Tuple[int, Set[str]]] = [(-1, set()) for _ in range(buckets + 1)]
+        self.max_entries = max_entries
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, key: str, timestamp: int) -> bool:
+        epoch = timestamp // self._span
+        index = epoch % len(self._slots)
+        with self._lock:
+            slot_epoch, keys = self._slots[index]
+            if slot_epoch > epoch:
+                # Older than anything the ring still tracks; the signature
+                # check's tolerance should have rejected it already.
+                return False
+            if self._find(key, epoch) is not None:
+                return False
+            if slot_epoch != epoch:
+                self._size -= len(keys)
+                keys = set()
+                self._slots[index] = (epoch, keys)
+            keys.add(key)
+            self._size += 1
+            if self._size > self.max_entries:
+                self._evict_oldest()
+            return True
+
+    def discard(self, key: str, timestamp: int) -> None:
+        with self._lock:
+            keys = self._find(key, timestamp // self._span)
+            if keys is not None:
+                keys.discard(key)
+                self._size -= 1
+
+    def _find(self, key: str, epoch: int) -> Optional[Set[str]]:
+        # Slots more than a full ring behind ``epoch`` have expired even if not yet recycled.
+        oldest = epoch - len(self._slots)
+        for slot_epoch, keys in self._slots:
+            if slot_epoch > oldest and key in keys:
+                return keys
+        return None
+
+    def _evict_oldest(self) -> None:
+        live = [(epoch, i) for i, (epoch, keys) in enumerate(self._slots) if keys]
+        _, index = min(live)
+        self._size -= len(self._slots[index][1])
+        self._slots[index] = (-1, set())
+
+
+class RedisReplayStore(ReplayStore):
+    """Replay store shared by several processes, backed by Redis ``SET NX EX``.
+
+    ``client`` is any redis-py compatible client; keys expire after
+    ``ttl_seconds`` (twice the tolerance window by default).
+    """
+
+    def __init__(self, client: Any, *, prefix: str = "swikly:webhook:", ttl_seconds: int = 20 * 60) -> None:
+        self._client = client
+        self.prefix = prefix
+        self.ttl_seconds = ttl_seconds
+
+    def add(self, key: str, timestamp: int) -> bool:
+        return bool(self._client.set(self.prefix + key, timestamp, nx=True, ex=self.ttl_seconds))
+
+    def discard(self, key: str, timestamp: int) -> None:
+        self._client.delete(self.prefix + key)
+
+
+def _replay_key(ts_str: str, signature: str) -> str:
+    return f"{ts_str}:{signature}"
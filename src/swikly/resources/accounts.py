@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import AsyncIterator, Iterator, Optional
 
-from ..models import AccountsListResponse
+from ..models import Account, AccountsListResponse
+from ..pagination import aiter_pages, iter_pages
 from .base import ResourceBase
 
 class AccountsResource(ResourceBase):
@@ -13,7 +14,11 @@ class AccountsResource(ResourceBase):
         if per_page is not None:
             params["per_page"] = per_page
         resp = self._client.request("GET", "/accounts", params=params or None)
-        return AccountsListResponse.model_validate(resp.json())
+        return self._decode(resp, AccountsListResponse)
+
+    def iter_all(self, *, per_page: int | None = None) -> Iterator[Account]:
+        """Iterate over every account, one page at a time."""
+        return iter_pages(lambda page: self.list(page=page, per_page=per_page), "accounts")
 
     async def alist(self, *, page: int | None = None, per_page: int | None = None) -> AccountsListResponse:
         params = {}
@@ -22,4 +27,8 @@ class AccountsResource(ResourceBase):
         if per_page is not None:
             params["per_page"] = per_page
         resp = await self._client.request("GET", "/accounts", params=params or None)
-        return AccountsListResponse.model_validate(resp.json())
+        return self._decode(resp, AccountsListResponse)
+
+    def aiter_all(self, *, per_page: int | None = None, prefetch: int = 0) -> AsyncIterator[Account]:
+        """Async iterate over every account; ``prefetch`` pages are fetched ahead concurrently."""
+        return aiter_pages(lambda page: self.alist(page=page, per_page=per_page), "accounts", prefetch=prefetch)
@@ -1,92 +1,178 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Sequence
+import asyncio
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 from ..models import (
     DepositResponse,
+    FileCreateResponse,
     NoShowResponse,
     PaymentResponse,
     RefundResponse,
+    Reclaim,
     ReclaimsListResponse,
     ReclaimResponse,
     RequestsListResponse,
     RequestResponse,
     ShortLinkResponse,
 )
+from ..batch import BatchResult, arun_batch, run_batch
+from ..errors import SwiklyRateLimitError, SwiklyUploadNotReplayableError
+from ..pagination import aiter_pages, iter_pages
+from ..projection import Fields
+from ..uploads import FileSource, MultipartUpload, _BatchUpload
+from ..utils import _coerce_with_param
 from .base import ResourceBase
 
 
+def _with_params(with_: Optional[Sequence[str] | str]) -> Optional[Dict[str, Any]]:
+    w = _coerce_with_param(with_)
+    return {"with": w} if w else None
+
+
+def _status_payload(status: str | None) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {}
+    if status is not None:
+        payload["status"] = status
+    return payload
+
+
+def _deposit_update_payload(startDate: str | None, endDate: str | None, amount: int | None, status: str | None) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {}
+    if startDate is not None:
+        payload["startDate"] = startDate
+    if endDate is not None:
+        payload["endDate"] = endDate
+    if amount is not None:
+        payload["amount"] = amount
+    if status is not None:
+        payload["status"] = status
+    return payload
+
+
+def _reclaims_list_params(
+    page: int | None,
+    per_page: int | None,
+    with_: Optional[Sequence[str] | str],
+    status: str | None,
+    from_date: str | None,
+    to_date: str | None,
+) -> Optional[Dict[str, Any]]:
+    params: Dict[str, Any] = {}
+    if page is not None:
+        params["page"] = page
+    if per_page is not None:
+        params["per_page"] = per_page
+    params.update(_with_params(with_) or {})
+    if status:
+        params["status"] = status
+    if from_date:
+        params["from"] = from_date
+    if to_date:
+        params["to"] = to_date
+    return params or None
+
+
 class DepositsResource(ResourceBase):
-    def get(self, *, account_id: str, deposit_id: str, with_: Optional[Sequence[str] | str] = None) -> DepositResponse:
-        params: Dict[str, Any] = {}
-        w = self._with(with_)
-        if w:
-            params["with"] = w
-        resp = self._client.request("GET", f"/accounts/{account_id}/deposits/{deposit_id}", params=params or None)
-        return DepositResponse.model_validate(resp.json())
+    def get(self, *, account_id: str, deposit_id: str, with_: Optional[Sequence[str] | str] = None, fields: Optional[Fields] = None) -> DepositResponse:
+        resp = self._client.request("GET", f"/accounts/{account_id}/deposits/{deposit_id}", params=_with_params(with_))
+        return self._decode(resp, DepositResponse, fields)
 
     def update(self, *, account_id: str, deposit_id: str, startDate: str | None = None, endDate: str | None = None, amount: int | None = None, status: str | None = None) -> DepositResponse:
-        payload: Dict[str, Any] = {}
-        if startDate is not None:
-            payload["startDate"] = startDate
-        if endDate is not None:
-            payload["endDate"] = endDate
-        if amount is not None:
-            payload["amount"] = amount
-        if status is not None:
-            payload["status"] = status
+        payload = _deposit_update_payload(startDate, endDate, amount, status)
         resp = self._client.request("PATCH", f"/accounts/{account_id}/deposits/{deposit_id}", json=payload)
-        return DepositResponse.model_validate(resp.json())
+        return self._decode(resp, DepositResponse)
+
+    async def aget(self, *, account_id: str, deposit_id: str, with_: Optional[Sequence[str] | str] = None, fields: Optional[Fields] = None) -> DepositResponse:
+        resp = await self._client.request("GET", f"/accounts/{account_id}/deposits/{deposit_id}", params=_with_params(with_))
+        return self._decode(resp, DepositResponse, fields)
+
+    async def aupdate(self, *, account_id: str, deposit_id: str, startDate: str | None = None, endDate: str | None = None, amount: int | None = None, status: str | None = None) -> DepositResponse:
+        payload = _deposit_update_payload(startDate, endDate, amount, status)
+        resp = await self._client.request("PATCH", f"/accounts/{account_id}/deposits/{deposit_id}", json=payload)
+        return self._decode(resp, DepositResponse)
 
 
 class NoShowsResource(ResourceBase):
-    def get(self, *, account_id: str, no_show_id: str, with_: Optional[Sequence[str] | str] = None) -> NoShowResponse:
-        params: Dict[str, Any] = {}
-        w = self._with(with_)
-        if w:
-            params["with"] = w
-        resp = self._client.request("GET", f"/accounts/{account_id}/no-shows/{no_show_id}", params=params or None)
-        return NoShowResponse.model_validate(resp.json())
+    def get(self, *, account_id: str, no_show_id: str, with_: Optional[Sequence[str] | str] = None, fields: Optional[Fields] = None) -> NoShowResponse:
+        resp = self._client.request("GET", f"/accounts/{account_id}/no-shows/{no_show_id}", params=_with_params(with_))
+        return self._decode(resp, NoShowResponse, fields)
 
     def update(self, *, account_id: str, no_show_id: str, status: str | None = None) -> NoShowResponse:
-        payload: Dict[str, Any] = {}
-        if status is not None:
-            payload["status"] = status
-        resp = self._client.request("PATCH", f"/accounts/{account_id}/no-shows/{no_show_id}", json=payload)
-        return NoShowResponse.model_validate(resp.json())
+        resp = self._client.request("PATCH", f"/accounts/{account_id}/no-shows/{no_show_id}", json=_status_payload(status))
+        return self._decode(resp, NoShowResponse)
+
+    async def aget(self, *, account_id: str, no_show_id: str, with_: Optional[Sequence[str] | str] = None, fields: Optional[Fields] = None) -> NoShowResponse:
+        resp = await self._client.request("GET", f"/accounts/{account_id}/no-shows/{no_show_id}", params=_with_params(with_))
+        return self._decode(resp, NoShowResponse, fields)
+
+    async def aupdate(self, *, account_id: str, no_show_id: str, status: str | None = None) -> NoShowResponse:
+        resp = await self._client.request("PATCH", f"/accounts/{account_id}/no-shows/{no_show_id}", json=_status_payload(status))
+        return self._decode(resp, NoShowResponse)
 
 
 class PaymentsResource(ResourceBase):
-    def get(self, *, account_id: str, payment_id: str, with_: Optional[Sequence[str] | str] = None) -> PaymentResponse:
-        params: Dict[str, Any] = {}
-        w = self._with(with_)
-        if w:
-            params["with"] = w
-        resp = self._client.request("GET", f"/accounts/{account_id}/payments/{payment_id}", params=params or None)
-        return PaymentResponse.model_validate(resp.json())
+    def get(self, *, account_id: str, payment_id: str, with_: Optional[Sequence[str] | str] = None, fields: Optional[Fields] = None) -> PaymentResponse:
+        resp = self._client.request("GET", f"/accounts/{account_id}/payments/{payment_id}", params=_with_params(with_))
+        return self._decode(resp, PaymentResponse, fields)
 
     def update(self, *, account_id: str, payment_id: str, status: str | None = None) -> PaymentResponse:
-        payload: Dict[str, Any] = {}
-        if status is not None:
-            payload["status"] = status
-        resp = self._client.request("PATCH", f"/accounts/{account_id}/payments/{payment_id}", json=payload)
-        return PaymentResponse.model_validate(resp.json())
+        resp = self._client.request("PATCH", f"/accounts/{account_id}/payments/{payment_id}", json=_status_payload(status))
+        return self._decode(resp, PaymentResponse)
+
+    async def aget(self, *, account_id: str, payment_id: str, with_: Optional[Sequence[str] | str] = None, fields: Optional[Fields] = None) -> PaymentResponse:
+        resp = await self._client.request("GET", f"/accounts/{account_id}/payments/{payment_id}", params=_with_params(with_))
+        return self._decode(resp, PaymentResponse, fields)
+
+    async def aupdate(self, *, account_id: str, payment_id: str, status: str | None = None) -> PaymentResponse:
+        resp = await self._client.request("PATCH", f"/accounts/{account_id}/payments/{payment_id}", json=_status_payload(status))
+        return self._decode(resp, PaymentResponse)
 
 
 class RefundsResource(ResourceBase):
-    def get(self, *, account_id: str, refund_id: str) -> RefundResponse:
+    def get(self, *, account_id: str, refund_id: str, fields: Optional[Fields] = None) -> RefundResponse:
         resp = self._client.request("GET", f"/accounts/{account_id}/refunds/{refund_id}")
-        return RefundResponse.model_validate(resp.json())
+        return self._decode(resp, RefundResponse, fields)
+
+    def refund_payment(
+        self, *, account_id: str, payment_id: str, amount: int, reason: str, idempotency_key: str | None = None
+    ) -> RefundResponse:
+        payload = {"amount": amount, "reason": reason}
+        resp = self._client.request(
+            "POST", f"/accounts/{account_id}/payments/{payment_id}/refunds", json=payload, idempotency_key=idempotency_key
+        )
+        return self._decode(resp, RefundResponse)
+
+    def refund_reclaim(
+        self, *, account_id: str, reclaim_id: str, amount: int, reason: str, idempotency_key: str | None = None
+    ) -> RefundResponse:
+        payload = {"amount": amount, "reason": reason}
+        resp = self._client.request(
+            "POST", f"/accounts/{account_id}/reclaims/{reclaim_id}/refunds", json=payload, idempotency_key=idempotency_key
+        )
+        return self._decode(resp, RefundResponse)
 
-    def refund_payment(self, *, account_id: str, payment_id: str, amount: int, reason: str) -> RefundResponse:
+    async def aget(self, *, account_id: str, refund_id: str, fields: Optional[Fields] = None) -> RefundResponse:
+        resp = await self._client.request("GET", f"/accounts/{account_id}/refunds/{refund_id}")
+        return self._decode(resp, RefundResponse, fields)
+
+    async def arefund_payment(
+        self, *, account_id: str, payment_id: str, amount: int, reason: str, idempotency_key: str | None = None
+    ) -> RefundResponse:
         payload = {"amount": amount, "reason": reason}
-        resp = self._client.request("POST", f"/accounts/{account_id}/payments/{payment_id}/refunds", json=payload)
-        return RefundResponse.model_validate(resp.json())
+        resp = await self._client.request(
+            "POST", f"/accounts/{account_id}/payments/{payment_id}/refunds", json=payload, idempotency_key=idempotency_key
+        )
+        return self._decode(resp, RefundResponse)
 
-    def refund_reclaim(self, *, account_id: str, reclaim_id: str, amount: int, reason: str) -> RefundResponse:
+    async def arefund_reclaim(
+        self, *, account_id: str, reclaim_id: str, amount: int, reason: str, idempotency_key: str | None = None
+    ) -> RefundResponse:
         payload = {"amount": amount, "reason": reason}
-        resp = self._client.request("POST", f"/accounts/{account_id}/reclaims/{reclaim_id}/refunds", json=payload)
-        return RefundResponse.model_validate(resp.json())
+        resp = await self._client.request(
+            "POST", f"/accounts/{account_id}/reclaims/{reclaim_id}/refunds", json=payload, idempotency_key=idempotency_key
+        )
+        return self._decode(resp, RefundResponse)
 
 
 class ReclaimsResource(ResourceBase):
@@ -101,70 +187,287 @@ class ReclaimsResource(ResourceBase):
         from_date: str | None = None,
         to_date: str | None = None,
     ) -> ReclaimsListResponse:
-        params: Dict[str, Any] = {}
-        if page is not None:
-            params["page"] = page
-        if per_page is not None:
-            params["per_page"] = per_page
-        w = self._with(with_)
-        if w:
-            params["with"] = w
-        if status:
-            params["status"] = status
-        if from_date:
-            params["from"] = from_date
-        if to_date:
-            params["to"] = to_date
-        resp = self._client.request("GET", f"/accounts/{account_id}/reclaims", params=params or None)
-        return ReclaimsListResponse.model_validate(resp.json())
+        params = _reclaims_list_params(page, per_page, with_, status, from_date, to_date)
+        resp = self._client.request("GET", f"/accounts/{account_id}/reclaims", params=params)
+        return self._decode(resp, ReclaimsListResponse)
+
+    async def alist(
+        self,
+        *,
+        account_id: str,
+        page: int | None = None,
+        per_page: int | None = None,
+        with_: Optional[Sequence[str] | str] = None,
+        status: str | None = None,
+        from_date: str | None = None,
+        to_date: str | None = None,
+    ) -> ReclaimsListResponse:
+        params = _reclaims_list_params(page, per_page, with_, status, from_date, to_date)
+        resp = await self._client.request("GET", f"/accounts/{account_id}/reclaims", params=params)
+        return self._decode(resp, ReclaimsListResponse)
+
+    def iter_all(
+        self,
+        *,
+        account_id: str,
+        per_page: int | None = None,
+        with_: Optional[Sequence[str] | str] = None,
+        status: str | None = None,
+        from_date: str | None = None,
+        to_date: str | None = None,
+    ) -> Iterator[Reclaim]:
+        """Iterate over every reclaim of the account, one page at a time."""
+        return iter_pages(
+            lambda page: self.list(
+                account_id=account_id,
+                page=page,
+                per_page=per_page,
+                with_=with_,
+                status=status,
+                from_date=from_date,
+                to_date=to_date,
+            ),
+            "reclaims",
+        )
+
+    def aiter_all(
+        self,
+        *,
+        account_id: str,
+        per_page: int | None = None,
+        with_: Optional[Sequence[str] | str] = None,
+        status: str | None = None,
+        from_date: str | None = None,
+        to_date: str | None = None,
+        prefetch: int = 0,
+    ) -> AsyncIterator[Reclaim]:
+        """Async iterate over every reclaim; ``prefetch`` pages are fetched ahead concurrently."""
+        return aiter_pages(
+            lambda page: self.alist(
+                account_id=account_id,
+                page=page,
+                per_page=per_page,
+                with_=with_,
+                status=status,
+                from_date=from_date,
+                to_date=to_date,
+            ),
+            "reclaims",
+            prefetch=prefetch,
+        )
 
     def list_for_request(self, *, account_id: str, request_id: str, with_: Optional[Sequence[str] | str] = None) -> ReclaimsListResponse:
-        params: Dict[str, Any] = {}
-        w = self._with(with_)
-        if w:
-            params["with"] = w
-        resp = self._client.request("GET", f"/accounts/{account_id}/requests/{request_id}/reclaims", params=params or None)
-        return ReclaimsListResponse.model_validate(resp.json())
-
-    def get(self, *, account_id: str, reclaim_id: str, with_: Optional[Sequence[str] | str] = None) -> ReclaimResponse:
-        params: Dict[str, Any] = {}
-        w = self._with(with_)
-        if w:
-            params["with"] = w
-        resp = self._client.request("GET", f"/accounts/{account_id}/reclaims/{reclaim_id}", params=params or None)
-        return ReclaimResponse.model_validate(resp.json())
-
-    def create_from_deposit(self, *, account_id: str, deposit_id: str, amount: int, reason: str) -> ReclaimResponse:
+        resp = self._client.request("GET", f"/accounts/{account_id}/requests/{request_id}/reclaims", params=_with_params(with_))
+        return self._decode(resp, ReclaimsListResponse)
+
+    def get(self, *, account_id: str, reclaim_id: str, with_: Optional[Sequence[str] | str] = None, fields: Optional[Fields] = None) -> ReclaimResponse:
+        resp = self._client.request("GET", f"/accounts/{account_id}/reclaims/{reclaim_id}", params=_with_params(with_))
+        return self._decode(resp, ReclaimResponse, fields)
+
+    def create_from_deposit(
+        self, *, account_id: str, deposit_id: str, amount: int, reason: str, idempotency_key: str | None = None
+    ) -> ReclaimResponse:
+        payload = {"amount": amount, "reason": reason}
+        resp = self._client.request(
+            "POST", f"/accounts/{account_id}/deposits/{deposit_id}/reclaims", json=payload, idempotency_key=idempotency_key
+        )
+        return self._decode(resp, ReclaimResponse)
+
+    def create_from_no_show(
+        self, *, account_id: str, no_show_id: str, amount: int, reason: str, idempotency_key: str | None = None
+    ) -> ReclaimResponse:
+        payload = {"amount": amount, "reason": reason}
+        resp = self._client.request(
+            "POST", f"/accounts/{account_id}/no-shows/{no_show_id}/reclaims", json=payload, idempotency_key=idempotency_key
+        )
+        return self._decode(resp, ReclaimResponse)
+
+    async def alist_for_request(self, *, account_id: str, request_id: str, with_: Optional[Sequence[str] | str] = None) -> ReclaimsListResponse:
+        resp = await self._client.request("GET", f"/accounts/{account_id}/requests/{request_id}/reclaims", params=_with_params(with_))
+        return self._decode(resp, ReclaimsListResponse)
+
+    async def aget(self, *, account_id: str, reclaim_id: str, with_: Optional[Sequence[str] | str] = None, fields: Optional[Fields] = None) -> ReclaimResponse:
+        resp = await self._client.request("GET", f"/accounts/{account_id}/reclaims/{reclaim_id}", params=_with_params(with_))
+        return self._decode(resp, ReclaimResponse, fields)
+
+    async def acreate_from_deposit(
+        self, *, account_id: str, deposit_id: str, amount: int, reason: str, idempotency_key: str | None = None
+    ) -> ReclaimResponse:
         payload = {"amount": amount, "reason": reason}
-        resp = self._client.request("POST", f"/accounts/{account_id}/deposits/{deposit_id}/reclaims", json=payload)
-        return ReclaimResponse.model_validate(resp.json())
+        resp = await self._client.request(
+            "POST", f"/accounts/{account_id}/deposits/{deposit_id}/reclaims", json=payload, idempotency_key=idempotency_key
+        )
+        return self._decode(resp, ReclaimResponse)
 
-    def create_from_no_show(self, *, account_id: str, no_show_id: str, amount: int, reason: str) -> ReclaimResponse:
+    async def acreate_from_no_show(
+        self, *, account_id: str, no_show_id: str, amount: int, reason: str, idempotency_key: str | None = None
+    ) -> ReclaimResponse:
         payload = {"amount": amount, "reason": reason}
-        resp = self._client.request("POST", f"/accounts/{account_id}/no-shows/{no_show_id}/reclaims", json=payload)
-        return ReclaimResponse.model_validate(resp.json())
+        resp = await self._client.request(
+            "POST", f"/accounts/{account_id}/no-shows/{no_show_id}/reclaims", json=payload, idempotency_key=idempotency_key
+        )
+        return self._decode(resp, ReclaimResponse)
+
+
+UploadItem = Union[FileSource, Tuple[str, FileSource]]
+
+
+def _upload(file_path: Optional[str], file: Optional[FileSource], filename: Optional[str], content_type: Optional[str]) -> MultipartUpload:
+    if (file_path is None) == (file is None):
+        raise ValueError("pass exactly one of file_path or file")
+    source = file_path if file_path is not None else file
+    return MultipartUpload(source, filename=filename, content_type=content_type)  # type: ignore[arg-type]
+
+
+async def _aupload(
+    file_path: Optional[str], file: Optional[FileSource], filename: Optional[str], content_type: Optional[str]
+) -> MultipartUpload:
+    # Sizing a path or file object stats the disk; keep that off the event loop.
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, _upload, file_path, file, filename, content_type)
+
+
+def _batch_uploads(files: Iterable[UploadItem]) -> Iterator[_BatchUpload]:
+    for item in files:
+        if isinstance(item, tuple):
+            filename, source = item
+            yield _BatchUpload(source, filename)
+        else:
+            yield _BatchUpload(item, None)
+
+
+def _not_replayable() -> SwiklyUploadNotReplayableError:
+    # Raised instead of the 429 so the batch does not resend a body it can no longer produce.
+    return SwiklyUploadNotReplayableError(
+        "upload was rate limited and its source cannot be read again; pass a path, bytes or a seekable file"
+    )
 
 
 class FilesResource(ResourceBase):
-    def upload_temporary_file(self, *, account_id: str, file_path: str) -> dict:
-        with open(file_path, "rb") as f:
-            files = {"file": (file_path.split("/")[-1], f)}
-            resp = self._client.request("POST", f"/accounts/{account_id}/files", files=files)
-        return resp.json()
-
-    def attach_file_to_reclaim(self, *, account_id: str, reclaim_id: str, file_path: str) -> dict:
-        with open(file_path, "rb") as f:
-            files = {"file": (file_path.split("/")[-1], f)}
-            resp = self._client.request("POST", f"/accounts/{account_id}/reclaims/{reclaim_id}/files", files=files)
-        return resp.json()
+    """Uploads stream the file in chunks; ``file`` may be a path, binary file
+    object, ``bytes``/``memoryview`` or (async only) an async byte iterator."""
+
+    def upload_temporary_file(
+        self,
+        *,
+        account_id: str,
+        file_path: Optional[str] = None,
+        file: Optional[FileSource] = None,
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+    ) -> FileCreateResponse:
+        upload = _upload(file_path, file, filename, content_type)
+        resp = self._client.request("POST", f"/accounts/{account_id}/files", content=upload, headers=upload.headers)
+        return self._decode(resp, FileCreateResponse)
+
+    def attach_file_to_reclaim(
+        self,
+        *,
+        account_id: str,
+        reclaim_id: str,
+        file_path: Optional[str] = None,
+        file: Optional[FileSource] = None,
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+    ) -> FileCreateResponse:
+        upload = _upload(file_path, file, filename, content_type)
+        resp = self._client.request(
+            "POST", f"/accounts/{account_id}/reclaims/{reclaim_id}/files", content=upload, headers=upload.headers
+        )
+        return self._decode(resp, FileCreateResponse)
+
+    def upload_many(
+        self,
+        files: Iterable[UploadItem],
+        *,
+        account_id: str,
+        reclaim_id: Optional[str] = None,
+        concurrency: int = 4,
+    ) -> List[BatchResult[FileCreateResponse]]:
+        """Upload several files with at most ``concurrency`` uploads in flight.
+
+        Each item is a source accepted by ``file`` or a ``(filename, source)``
+        pair. With ``reclaim_id`` the files are attached to that reclaim,
+        otherwise they are uploaded as temporary files. Results come back in
+        input order and failures are reported per item.
+        """
+        def upload(item: _BatchUpload) -> FileCreateResponse:
+            try:
+                if reclaim_id is None:
+                    return self.upload_temporary_file(account_id=account_id, **item.kwargs())
+                return self.attach_file_to_reclaim(account_id=account_id, reclaim_id=reclaim_id, **item.kwargs())
+            except SwiklyRateLimitError as e:
+                if not item.replayable:
+                    raise _not_replayable() from e
+                raise
+
+        return list(run_batch(upload, _batch_uploads(files), policy=self._client.retry_policy, concurrency=concurrency))
 
     def delete_reclaim_file(self, *, account_id: str, reclaim_id: str, file_id: str) -> None:
         self._client.request("DELETE", f"/accounts/{account_id}/reclaims/{reclaim_id}/files/{file_id}")
         return None
 
+    async def aupload_temporary_file(
+        self,
+        *,
+        account_id: str,
+        file_path: Optional[str] = None,
+        file: Optional[FileSource] = None,
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+    ) -> FileCreateResponse:
+        upload = await _aupload(file_path, file, filename, content_type)
+        resp = await self._client.request("POST", f"/accounts/{account_id}/files", content=upload, headers=upload.headers)
+        return self._decode(resp, FileCreateResponse)
+
+    async def aattach_file_to_reclaim(
+        self,
+        *,
+        account_id: str,
+        reclaim_id: str,
+        file_path: Optional[str] = None,
+        file: Optional[FileSource] = None,
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+    ) -> FileCreateResponse:
+        upload = await _aupload(file_path, file, filename, content_type)
+        resp = await self._client.request(
+            "POST", f"/accounts/{account_id}/reclaims/{reclaim_id}/files", content=upload, headers=upload.headers
+        )
+        return self._decode(resp, FileCreateResponse)
+
+    async def aupload_many(
+        self,
+        files: Iterable[UploadItem],
+        *,
+        account_id: str,
+        reclaim_id: Optional[str] = None,
+        concurrency: int = 4,
+    ) -> List[BatchResult[FileCreateResponse]]:
+        async def upload(item: _BatchUpload) -> FileCreateResponse:
+            try:
+                if reclaim_id is None:
+                    return await self.aupload_temporary_file(account_id=account_id, **item.kwargs())
+                return await self.aattach_file_to_reclaim(account_id=account_id, reclaim_id=reclaim_id, **item.kwargs())
+            except SwiklyRateLimitError as e:
+                if not item.replayable:
+                    raise _not_replayable() from e
+                raise
+
+        results = arun_batch(upload, _batch_uploads(files), policy=self._client.retry_policy, concurrency=concurrency)
+        return [r async for r in results]
+
+    async def adelete_reclaim_file(self, *, account_id: str, reclaim_id: str, file_id: str) -> None:
+        await self._client.request("DELETE", f"/accounts/{account_id}/reclaims/{reclaim_id}/files/{file_id}")
+        return None
+
 
 class ShortLinksResource(ResourceBase):
     def create(self, *, link: str) -> ShortLinkResponse:
         # Can be query param or JSON; use JSON
         resp = self._client.request("POST", "/shortener/short-links", json={"link": link})
-        return ShortLinkResponse.model_validate(resp.json())
+        return self._decode(resp, ShortLinkResponse)
+
+    async def acreate(self, *, link: str) -> ShortLinkResponse:
+        resp = await self._client.request("POST", "/shortener/short-links", json={"link": link})
+        return self._decode(resp, ShortLinkResponse)
@@ -1,9 +1,18 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, Optional, Type, TypeVar
 
+import httpx
+from pydantic import BaseModel
+
+from ..decoding import decode_response
+from ..instrumentation import DecodeInfo, _emit
+from ..projection import Fields, project_response
 from ..utils import _coerce_with_param
 
+M = TypeVar("M", bound=BaseModel)
+
 class ResourceBase:
     def __init__(self, client: Any) -> None:
         self._client = client
@@ -14,3 +23,18 @@ class ResourceBase:
 
     def _with(self, with_: Optional[list[str] | tuple[str, ...] | str]) -> Optional[str]:
         return _coerce_with_param(with_)
+
+    def _decode(self, resp: httpx.Response, model: Type[M], fields: Optional[Fields] = None) -> M:
+        hooks = self._client.hooks
+        if not hooks:
+            if fields:
+                return project_response(resp, model, fields)
+            return decode_response(resp, model, self._client.decode)
+        started = time.perf_counter()
+        if fields:
+            result = project_response(resp, model, fields)
+        else:
+            result = decode_response(resp, model, self._client.decode)
+        mode = "fields" if fields else self._client.decode
+        _emit(hooks, "on_decode", DecodeInfo(model.__name__, mode, time.perf_counter() - started, len(resp.content)))
+        return result
@@ -1,10 +1,19 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Sequence
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, TypeVar, cast
 
-from ..models import RequestResponse, RequestsListResponse
+from ..batch import BatchResult, arun_batch, run_batch
+from ..errors import SwiklyAPIError, SwiklyNotFoundError
+from ..idempotency import new_idempotency_key
+from ..index import _ids_of
+from ..models import FileCreateResponse, Request, RequestResponse, RequestsListResponse
+from ..pagination import aiter_pages, iter_pages
+from ..projection import Fields
+from ..uploads import FileSource
 from .base import ResourceBase
 
+R = TypeVar("R", RequestResponse, RequestsListResponse)
+
 class RequestsResource(ResourceBase):
     # -------- Sync --------
     def list(
@@ -16,6 +25,7 @@ class RequestsResource(ResourceBase):
         with_: Optional[Sequence[str] | str] = None,
         search: str | None = None,
         include_legacy: bool | None = None,
+        fields: Optional[Fields] = None,
     ) -> RequestsListResponse:
         params: Dict[str, Any] = {}
         if page is not None:
@@ -30,7 +40,31 @@ class RequestsResource(ResourceBase):
         if include_legacy is not None:
             params["include_legacy"] = include_legacy
         resp = self._client.request("GET", f"/accounts/{account_id}/requests", params=params or None)
-        return RequestsListResponse.model_validate(resp.json())
+        return _indexed(self._client, account_id, self._decode(resp, RequestsListResponse, fields))
+
+    def iter_all(
+        self,
+        *,
+        account_id: str,
+        per_page: int | None = None,
+        with_: Optional[Sequence[str] | str] = None,
+        search: str | None = None,
+        include_legacy: bool | None = None,
+        fields: Optional[Fields] = None,
+    ) -> Iterator[Request]:
+        """Iterate over every request of the account, one page at a time."""
+        return iter_pages(
+            lambda page: self.list(
+                account_id=account_id,
+                page=page,
+                per_page=per_page,
+                with_=with_,
+                search=search,
+                include_legacy=include_legacy,
+                fields=fields,
+            ),
+            "requests",
+        )
 
     def create(
         self,
@@ -57,6 +91,7 @@ class RequestsResource(ResourceBase):
         no_show: dict | None = None,
         payment: dict | None = None,
         address: dict | None = None,
+        idempotency_key: str | None = None,
     ) -> RequestResponse:
         payload: Dict[str, Any] = {"description": description, "language": language}
         if custom_id is not None:
@@ -98,16 +133,93 @@ class RequestsResource(ResourceBase):
         if address is not None:
             payload["address"] = address
 
-        resp = self._client.request("POST", f"/accounts/{account_id}/requests", json=payload)
-        return RequestResponse.model_validate(resp.json())
+        generated = _unique_custom_id(self._client, payload)
+        try:
+            resp = self._client.request("POST", f"/accounts/{account_id}/requests", json=payload, idempotency_key=idempotency_key)
+        except SwiklyAPIError as e:
+            if generated is None or not _duplicate_custom_id(e):
+                raise
+            # An earlier attempt of this very call created the request.
+            existing = self.get_by_custom_id(account_id=account_id, custom_id=generated)
+            if existing is None:
+                raise
+            return existing
+        return _indexed(self._client, account_id, self._decode(resp, RequestResponse))
+
+    def create_many(
+        self,
+        items: Iterable[Mapping[str, Any]],
+        *,
+        account_id: str | None = None,
+        concurrency: int = 8,
+    ) -> List[BatchResult[RequestResponse]]:
+        """Create many requests with at most ``concurrency`` calls in flight.
+
+        Each item holds the keyword arguments of :meth:`create`; ``account_id``
+        is used for items that do not set their own. Results come back in input
+        order and failures are reported per item instead of aborting the batch.
+        """
+        return list(self._run_create_many(items, account_id=account_id, concurrency=concurrency, ordered=True))
+
+    def iter_create_many(
+        self,
+        items: Iterable[Mapping[str, Any]],
+        *,
+        account_id: str | None = None,
+        concurrency: int = 8,
+    ) -> Iterator[BatchResult[RequestResponse]]:
+        """Streaming variant of :meth:`create_many` yielding results as they complete."""
+        return self._run_create_many(items, account_id=account_id, concurrency=concurrency, ordered=False)
 
-    def get(self, *, account_id: str, request_id: str, with_: Optional[Sequence[str] | str] = None) -> RequestResponse:
+    def _run_create_many(
+        self,
+        items: Iterable[Mapping[str, Any]],
+        *,
+        account_id: str | None,
+        concurrency: int,
+        ordered: bool,
+    ) -> Iterator[BatchResult[RequestResponse]]:
+        defaults = {"account_id": account_id} if account_id is not None else {}
+        return run_batch(
+            lambda item: self.create(**{**defaults, **item}),
+            items,
+            policy=self._client.retry_policy,
+            concurrency=concurrency,
+            ordered=ordered,
+        )
+
+    def get(self, *, account_id: str, request_id: str, with_: Optional[Sequence[str] | str] = None, fields: Optional[Fields] = None) -> RequestResponse:
         params: Dict[str, Any] = {}
         w = self._with(with_)
         if w:
             params["with"] = w
         resp = self._client.request("GET", f"/accounts/{account_id}/requests/{request_id}", params=params or None)
-        return RequestResponse.model_validate(resp.json())
+        return _indexed(self._client, account_id, self._decode(resp, RequestResponse, fields))
+
+    def get_by_custom_id(
+        self,
+        *,
+        account_id: str,
+        custom_id: str,
+        with_: Optional[Sequence[str] | str] = None,
+        per_page: int | None = None,
+    ) -> Optional[RequestResponse]:
+        """The request created with ``custom_id`` (the newest one if several share it), or None.
+
+        One ``get`` when the client's custom id index has seen the request,
+        otherwise a ``search`` scan of the list, which fills the index.
+        """
+        index = self._client.custom_id_index
+        request_id = index.get(account_id, custom_id)
+        if request_id is not None:
+            try:
+                return self.get(account_id=account_id, request_id=request_id, with_=with_)
+            except SwiklyNotFoundError:
+                index.discard(account_id, custom_id)
+        for request in self.iter_all(account_id=account_id, search=custom_id, per_page=per_page, with_=with_):
+            if _ids_of(request)[0] == custom_id:
+                return _wrap_request(request)
+        return None
 
     def update(
         self,
@@ -126,15 +238,15 @@ class RequestsResource(ResourceBase):
         if payment is not None:
             payload["payment"] = payment
         resp = self._client.request("PATCH", f"/accounts/{account_id}/requests/{request_id}", json=payload)
-        return RequestResponse.model_validate(resp.json())
+        return self._decode(resp, RequestResponse)
 
     def cancel(self, *, account_id: str, request_id: str) -> RequestResponse:
         resp = self._client.request("POST", f"/accounts/{account_id}/requests/{request_id}/cancel")
-        return RequestResponse.model_validate(resp.json())
+        return self._decode(resp, RequestResponse)
 
     def release(self, *, account_id: str, request_id: str) -> RequestResponse:
         resp = self._client.request("POST", f"/accounts/{account_id}/requests/{request_id}/release")
-        return RequestResponse.model_validate(resp.json())
+        return self._decode(resp, RequestResponse)
 
     def create_reclaim(
         self,
@@ -145,33 +257,138 @@ class RequestsResource(ResourceBase):
         amount: int,
         reason: str,
         files: list[str] | None = None,
+        idempotency_key: str | None = None,
     ) -> RequestResponse:
         payload: Dict[str, Any] = {"target": target, "amount": amount, "reason": reason}
         if files:
             payload["files"] = files
-        resp = self._client.request("POST", f"/accounts/{account_id}/requests/{request_id}/create_reclaim", json=payload)
-        return RequestResponse.model_validate(resp.json())
+        resp = self._client.request(
+            "POST", f"/accounts/{account_id}/requests/{request_id}/create_reclaim", json=payload, idempotency_key=idempotency_key
+        )
+        return self._decode(resp, RequestResponse)
+
+    def create_reclaim_with_files(
+        self,
+        *,
+        account_id: str,
+        request_id: str,
+        target: str,
+        amount: int,
+        reason: str,
+        files: Iterable[FileSource | Tuple[str, FileSource]],
+        concurrency: int = 8,
+    ) -> RequestResponse:
+        """Upload ``files`` concurrently, then create the reclaim with their ids.
+
+        The uploads overlap, so the whole call takes about as long as the
+        slowest upload plus the reclaim creation. If any upload fails, its
+        error is raised and no reclaim is created.
+        """
+        results = self._client.files.upload_many(files, account_id=account_id, concurrency=concurrency)
+        return self.create_reclaim(
+            account_id=account_id,
+            request_id=request_id,
+            target=target,
+            amount=amount,
+            reason=reason,
+            files=_uploaded_file_ids(results),
+        )
 
     def cancel_reclaim(self, *, account_id: str, request_id: str, target: str) -> RequestResponse:
         payload = {"target": target}
         resp = self._client.request("POST", f"/accounts/{account_id}/requests/{request_id}/cancel_reclaim", json=payload)
-        return RequestResponse.model_validate(resp.json())
+        return self._decode(resp, RequestResponse)
 
-    def create_refund(self, *, account_id: str, request_id: str, target: str, amount: int, reason: str) -> RequestResponse:
+    def create_refund(
+        self, *, account_id: str, request_id: str, target: str, amount: int, reason: str, idempotency_key: str | None = None
+    ) -> RequestResponse:
         payload = {"target": target, "amount": amount, "reason": reason}
-        resp = self._client.request("POST", f"/accounts/{account_id}/requests/{request_id}/create_refund", json=payload)
-        return RequestResponse.model_validate(resp.json())
+        resp = self._client.request(
+            "POST", f"/accounts/{account_id}/requests/{request_id}/create_refund", json=payload, idempotency_key=idempotency_key
+        )
+        return self._decode(resp, RequestResponse)
 
     # -------- Async --------
     async def alist(self, **kwargs: Any) -> RequestsListResponse:
         resp = await self._client.request("GET", f"/accounts/{kwargs['account_id']}/requests", params=_params_for_list(kwargs))
-        return RequestsListResponse.model_validate(resp.json())
+        return _indexed(self._client, kwargs["account_id"], self._decode(resp, RequestsListResponse, kwargs.get("fields")))
+
+    def aiter_all(
+        self,
+        *,
+        account_id: str,
+        per_page: int | None = None,
+        with_: Optional[Sequence[str] | str] = None,
+        search: str | None = None,
+        include_legacy: bool | None = None,
+        fields: Optional[Fields] = None,
+        prefetch: int = 0,
+    ) -> AsyncIterator[Request]:
+        """Async iterate over every request; ``prefetch`` pages are fetched ahead concurrently."""
+        return aiter_pages(
+            lambda page: self.alist(
+                account_id=account_id,
+                page=page,
+                per_page=per_page,
+                with_=with_,
+                search=search,
+                include_legacy=include_legacy,
+                fields=fields,
+            ),
+            "requests",
+            prefetch=prefetch,
+        )
 
     async def acreate(self, **kwargs: Any) -> RequestResponse:
         account_id = kwargs.pop("account_id")
+        idempotency_key = kwargs.pop("idempotency_key", None)
         payload = _payload_for_create(kwargs)
-        resp = await self._client.request("POST", f"/accounts/{account_id}/requests", json=payload)
-        return RequestResponse.model_validate(resp.json())
+        generated = _unique_custom_id(self._client, payload)
+        try:
+            resp = await self._client.request("POST", f"/accounts/{account_id}/requests", json=payload, idempotency_key=idempotency_key)
+        except SwiklyAPIError as e:
+            if generated is None or not _duplicate_custom_id(e):
+                raise
+            # An earlier attempt of this very call created the request.
+            existing = await self.aget_by_custom_id(account_id=account_id, custom_id=generated)
+            if existing is None:
+                raise
+            return existing
+        return _indexed(self._client, account_id, self._decode(resp, RequestResponse))
+
+    async def acreate_many(
+        self,
+        items: Iterable[Mapping[str, Any]],
+        *,
+        account_id: str | None = None,
+        concurrency: int = 8,
+    ) -> List[BatchResult[RequestResponse]]:
+        """Async :meth:`create_many`: at most ``concurrency`` creates in flight, results in input order."""
+        defaults = {"account_id": account_id} if account_id is not None else {}
+        results = arun_batch(
+            lambda item: self.acreate(**{**defaults, **item}),
+            items,
+            policy=self._client.retry_policy,
+            concurrency=concurrency,
+        )
+        return [r async for r in results]
+
+    def aiter_create_many(
+        self,
+        items: Iterable[Mapping[str, Any]],
+        *,
+        account_id: str | None = None,
+        concurrency: int = 8,
+    ) -> AsyncIterator[BatchResult[RequestResponse]]:
+        """Streaming variant of :meth:`acreate_many` yielding results as they complete."""
+        defaults = {"account_id": account_id} if account_id is not None else {}
+        return arun_batch(
+            lambda item: self.acreate(**{**defaults, **item}),
+            items,
+            policy=self._client.retry_policy,
+            concurrency=concurrency,
+            ordered=False,
+        )
 
     async def aget(self, **kwargs: Any) -> RequestResponse:
         account_id = kwargs["account_id"]
@@ -181,7 +398,31 @@ class RequestsResource(ResourceBase):
         if w:
             params["with"] = w
         resp = await self._client.request("GET", f"/accounts/{account_id}/requests/{request_id}", params=params or None)
-        return RequestResponse.model_validate(resp.json())
+        return _indexed(self._client, account_id, self._decode(resp, RequestResponse, kwargs.get("fields")))
+
+    async def aget_by_custom_id(
+        self,
+        *,
+        account_id: str,
+        custom_id: str,
+        with_: Optional[Sequence[str] | str] = None,
+        per_page: int | None = None,
+    ) -> Optional[RequestResponse]:
+        index = self._client.custom_id_index
+        request_id = index.get(account_id, custom_id)
+        if request_id is not None:
+            try:
+                return await self.aget(account_id=account_id, request_id=request_id, with_=with_)
+            except SwiklyNotFoundError:
+                index.discard(account_id, custom_id)
+        pages = self.aiter_all(account_id=account_id, search=custom_id, per_page=per_page, with_=with_)
+        try:
+            async for request in pages:
+                if _ids_of(request)[0] == custom_id:
+                    return _wrap_request(request)
+        finally:
+            await pages.aclose()  # type: ignore[attr-defined]
+        return None
 
     async def aupdate(self, **kwargs: Any) -> RequestResponse:
         account_id = kwargs["account_id"]
@@ -194,32 +435,115 @@ class RequestsResource(ResourceBase):
         if kwargs.get("payment") is not None:
             payload["payment"] = kwargs["payment"]
         resp = await self._client.request("PATCH", f"/accounts/{account_id}/requests/{request_id}", json=payload)
-        return RequestResponse.model_validate(resp.json())
+        return self._decode(resp, RequestResponse)
 
     async def acancel(self, *, account_id: str, request_id: str) -> RequestResponse:
         resp = await self._client.request("POST", f"/accounts/{account_id}/requests/{request_id}/cancel")
-        return RequestResponse.model_validate(resp.json())
+        return self._decode(resp, RequestResponse)
 
     async def arelease(self, *, account_id: str, request_id: str) -> RequestResponse:
         resp = await self._client.request("POST", f"/accounts/{account_id}/requests/{request_id}/release")
-        return RequestResponse.model_validate(resp.json())
+        return self._decode(resp, RequestResponse)
 
-    async def acreate_reclaim(self, *, account_id: str, request_id: str, target: str, amount: int, reason: str, files: list[str] | None = None) -> RequestResponse:
+    async def acreate_reclaim(
+        self,
+        *,
+        account_id: str,
+        request_id: str,
+        target: str,
+        amount: int,
+        reason: str,
+        files: list[str] | None = None,
+        idempotency_key: str | None = None,
+    ) -> RequestResponse:
         payload: Dict[str, Any] = {"target": target, "amount": amount, "reason": reason}
         if files:
             payload["files"] = files
-        resp = await self._client.request("POST", f"/accounts/{account_id}/requests/{request_id}/create_reclaim", json=payload)
-        return RequestResponse.model_validate(resp.json())
+        resp = await self._client.request(
+            "POST", f"/accounts/{account_id}/requests/{request_id}/create_reclaim", json=payload, idempotency_key=idempotency_key
+        )
+        return self._decode(resp, RequestResponse)
+
+    async def acreate_reclaim_with_files(
+        self,
+        *,
+        account_id: str,
+        request_id: str,
+        target: str,
+        amount: int,
+        reason: str,
+        files: Iterable[FileSource | Tuple[str, FileSource]],
+        concurrency: int = 8,
+    ) -> RequestResponse:
+        results = await self._client.files.aupload_many(files, account_id=account_id, concurrency=concurrency)
+        return await self.acreate_reclaim(
+            account_id=account_id,
+            request_id=request_id,
+            target=target,
+            amount=amount,
+            reason=reason,
+            files=_uploaded_file_ids(results),
+        )
 
     async def acancel_reclaim(self, *, account_id: str, request_id: str, target: str) -> RequestResponse:
         payload = {"target": target}
         resp = await self._client.request("POST", f"/accounts/{account_id}/requests/{request_id}/cancel_reclaim", json=payload)
-        return RequestResponse.model_validate(resp.json())
+        return self._decode(resp, RequestResponse)
 
-    async def acreate_refund(self, *, account_id: str, request_id: str, target: str, amount: int, reason: str) -> RequestResponse:
+    async def acreate_refund(
+        self, *, account_id: str, request_id: str, target: str, amount: int, reason: str, idempotency_key: str | None = None
+    ) -> RequestResponse:
         payload = {"target": target, "amount": amount, "reason": reason}
-        resp = await self._client.request("POST", f"/accounts/{account_id}/requests/{request_id}/create_refund", json=payload)
-        return RequestResponse.model_validate(resp.json())
+        resp = await self._client.request(
+            "POST", f"/accounts/{account_id}/requests/{request_id}/create_refund", json=payload, idempotency_key=idempotency_key
+        )
+        return self._decode(resp, RequestResponse)
+
+
+def _indexed(client: Any, account_id: str, response: R) -> R:
+    # Every request passing through feeds get_by_custom_id's index.
+    if isinstance(response, dict):
+        found = response.get("requests") or [response.get("request")]
+    else:
+        found = getattr(response, "requests", None) or [getattr(response, "request", None)]
+    client.custom_id_index.put_many(account_id, (r for r in found if r is not None))
+    return response
+
+
+def _wrap_request(request: Any) -> RequestResponse:
+    # A list item found by the scan, shaped like a ``get`` response.
+    if isinstance(request, dict):
+        return cast(RequestResponse, {"request": request})  # "raw" mode
+    return RequestResponse.model_construct(request=request)
+
+
+def _unique_custom_id(client: Any, payload: Dict[str, Any]) -> Optional[str]:
+    # idempotency="custom_id": let Swikly reject a duplicate if a retried create already went through.
+    if client.idempotency != "custom_id" or "customId" in payload:
+        return None
+    custom_id = payload["customId"] = new_idempotency_key()
+    payload["customIdMustBeUnique"] = True
+    return custom_id
+
+
+def _duplicate_custom_id(error: SwiklyAPIError) -> bool:
+    # Swikly reports a taken unique customId as a 409/422 naming the field.
+    if error.status_code not in (409, 422):
+        return False
+    if isinstance(error.errors, dict) and "customId" in error.errors:
+        return True
+    return "customid" in error.message.lower().replace("_", "").replace(" ", "")
+
+
+def _uploaded_file_ids(results: List[BatchResult[FileCreateResponse]]) -> List[str]:
+    ids = []
+    for r in results:
+        if r.error is not None:
+            raise r.error
+        uploaded: Any = r.result
+        # decode="raw" yields plain dicts
+        ids.append(uploaded["file"]["id"] if isinstance(uploaded, dict) else uploaded.file.id)
+    return ids
 
 
 def _params_for_list(kwargs: Dict[str, Any]) -> Dict[str, Any] | None:
@@ -6,8 +6,8 @@ from .base import ResourceBase
 class UsersResource(ResourceBase):
     def me(self) -> MeResponse:
         resp = self._client.request("GET", "/me")
-        return MeResponse.model_validate(resp.json())
+        return self._decode(resp, MeResponse)
 
     async def ame(self) -> MeResponse:
         resp = await self._client.request("GET", "/me")
-        return MeResponse.model_validate(resp.json())
+        return self._decode(resp, MeResponse)
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import random
+import threading
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Optional
+
+import httpx
+
+from .utils import _read_retry_after
+
+
+class RetryBudget:
+    """Caps retries to a fraction of the traffic sent through a client.
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one, so a
+    degraded API cannot multiply load by ``max_retries``. The balance starts
+    full at ``capacity`` to allow short bursts of retries.
+    """
+
+    def __init__(self, *, ratio: float = 0.2, capacity: float = 10.0) -> None:
+        if ratio < 0 or capacity < 1:
+            raise ValueError("ratio must be >= 0 and capacity >= 1")
+        self.ratio = ratio
+        self.capacity = capacity
+        self._balance = capacity
+        self._lock = threading.Lock()
+
+    def record_request(self) -> None:
+        with self._lock:
+            self._balance = min(self.capacity, self._balance + self.ratio)
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            return True
+
+    @property
+    def balance(self) -> float:
+        return self._balance
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How a client retries 429, 5xx and transport errors.
+
+    5xx and transport errors back off exponentially (``backoff_base * 2**attempt``,
+    capped at ``backoff_max``) with full jitter. 429 responses wait for
+    ``Retry-After`` and are only retried when the server sends one that does not
+    exceed ``max_retry_after``.
+    """
+
+    max_retries: int = 2
+    backoff_base: float = 0.5
+    backoff_max: float = 8.0
+    jitter: bool = True
+    max_retry_after: Optional[float] = 60.0
+    budget: Optional[RetryBudget] = field(default=None, compare=False)
+
+    def backoff(self, attempt: int) -> float:
+        delay: float = min(self.backoff_max, self.backoff_base * 2.0**attempt)
+        if self.jitter:
+            return random.uniform(0, delay)
+        return delay
+
+    def delay_for_response(self, attempt: int, resp: httpx.Response) -> Optional[float]:
+        """Seconds to wait before retrying ``resp``, or None if it must not be retried."""
+        if attempt >= self.max_retries:
+            return None
+        if resp.status_code == 429:
+            retry_after = _read_retry_after(resp.headers)
+            if retry_after is None:
+                return None
+            if self.max_retry_after is not None and retry_after > self.max_retry_after:
+                return None
+            return self._spend(float(retry_after))
+        if 500 <= resp.status_code < 600:
+            return self._spend(self.backoff(attempt))
+        return None
+
+    def delay_for_error(self, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying after a transport error, or None."""
+        if attempt >= self.max_retries:
+            return None
+        return self._spend(self.backoff(attempt))
+
+    def _spend(self, delay: float) -> Optional[float]:
+        if self.budget is not None and not self.budget.try_spend():
+            return None
+        return delay
+
+
+# Lets a caller (e.g. a batch runner) swap the policy for the calls it makes
+# without touching the client shared with everyone else.
+_policy_override: ContextVar[Optional[RetryPolicy]] = ContextVar("swikly_retry_policy", default=None)
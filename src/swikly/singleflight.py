@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional, Pattern, TypeVar
+
+from .deadline import _expired, _remaining, _timeout_override
+from .errors import SwiklyDeadlineExceededError
+from .utils import _compile_path_template
+
+T = TypeVar("T")
+
+
+@dataclass
+class CoalesceStats:
+    leaders: int = 0  # calls that went to the network
+    followers: int = 0  # calls served by another caller's in-flight request
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class RequestCoalescer:
+    """Single-flight for identical concurrent requests.
+
+    While a matching request is in flight, identical ones (same credentials,
+    method, path and query) wait for it and share its response or error
+    instead of hitting the API again. ``methods`` and ``paths`` (templates where
+    ``{name}`` matches one segment; all paths when omitted) select what is
+    coalesced. Works across threads for ``SwiklyClient`` and across tasks for
+    ``AsyncSwiklyClient``.
+
+    Calls with different per-call timeouts are never shared. A waiting call
+    gives up at its own deadline, and one whose deadline outlives the
+    request it joined sends its own when that request runs out of time.
+    """
+
+    def __init__(self, *, methods: Iterable[str] = ("GET",), paths: Optional[Iterable[str]] = None) -> None:
+        self.methods = frozenset(m.upper() for m in methods)
+        self._paths: Optional[List[Pattern[str]]] = None
+        if paths is not None:
+            self._paths = [_compile_path_template(p) for p in paths]
+        self._calls: Dict[str, _Call] = {}
+        self._tasks: Dict[str, "asyncio.Task[Any]"] = {}
+        self._stats = CoalesceStats()
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> CoalesceStats:
+        with self._lock:
+            return CoalesceStats(leaders=self._stats.leaders, followers=self._stats.followers)
+
+    def matches(self, method: str, path: str) -> bool:
+        if method.upper() not in self.methods:
+            return False
+        return self._paths is None or any(p.match(path) for p in self._paths)
+
+    @staticmethod
+    def key(namespace: str, method: str, path: str, params: Optional[Mapping[str, Any]]) -> str:
+        query = "&".join(f"{k}={params[k]}" for k in sorted(params)) if params else ""
+        key = f"{namespace}|{method.upper()} {path}?{query}"
+        timeout = _timeout_override.get()
+        return key if timeout is None else f"{key}|timeout={timeout!r}"
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+                self._stats.leaders += 1
+            else:
+                self._stats.followers += 1
+
+        if not leader:
+            if not call.done.wait(_remaining()):
+                raise SwiklyDeadlineExceededError("Deadline exceeded waiting for a coalesced request")
+            if call.error is not None:
+                if _outlived(call.error):
+                    return self.do(key, fn)
+                raise call.error
+            return call.result  # type: ignore[no-any-return]
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result  # type: ignore[no-any-return]
+
+    async def ado(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        with self._lock:
+            task = self._tasks.get(key)
+            if task is None:
+                # A separate task, so cancelling the first caller doesn't fail everyone else.
+                task = asyncio.ensure_future(fn())
+                self._tasks[key] = task
+                task.add_done_callback(lambda _t: self._forget(key, _t))
+                self._stats.leaders += 1
+            else:
+                self._stats.followers += 1
+        remaining = _remaining()
+        try:
+            if remaining is None:
+                return await asyncio.shield(task)  # type: ignore[no-any-return]
+            return await asyncio.wait_for(asyncio.shield(task), max(remaining, 0))  # type: ignore[no-any-return]
+        except SwiklyDeadlineExceededError as e:
+            if _outlived(e):
+                return await self.ado(key, fn)
+            raise
+        except asyncio.TimeoutError:
+            if task.done():
+                raise
+            raise SwiklyDeadlineExceededError("Deadline exceeded waiting for a coalesced request") from None
+
+    def _forget(self, key: str, task: "asyncio.Task[Any]") -> None:
+        with self._lock:
+            if self._tasks.get(key) is task:
+                del self._tasks[key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved when every waiter was cancelled
+
+
+def _outlived(error: BaseException) -> bool:
+    # The shared request hit the deadline of the call that started it, not ours.
+    return isinstance(error, SwiklyDeadlineExceededError) and not _expired()
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import asyncio
+import mimetypes
+import os
+import secrets
+from typing import IO, Any, AsyncIterable, AsyncIterator, Dict, Iterator, Optional, Union
+
+from .errors import SwiklyUploadNotReplayableError
+
+# Bytes read from disk (or sliced out of an in-memory buffer) per chunk.
+CHUNK_SIZE = 256 * 1024
+
+FileSource = Union[str, "os.PathLike[str]", IO[bytes], bytes, bytearray, memoryview, AsyncIterable[bytes]]
+
+
+class MultipartUpload:
+    """A ``multipart/form-data`` body with a single file field, streamed in chunks.
+
+    ``source`` may be a path, a binary file object, ``bytes``/``memoryview``
+    or an async iterator of bytes (async clients only). Files are never read
+    into memory as a whole, and in-memory buffers are sliced without copying.
+    Async iteration reads files in a worker thread so the event loop is never
+    blocked on disk I/O. ``Content-Length`` is sent whenever the size is known.
+
+    Paths, buffers and seekable files can be sent again, so the body can be
+    retried; other sources are sent once (see :attr:`replayable`).
+    """
+
+    def __init__(
+        self,
+        source: FileSource,
+        *,
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+        field: str = "file",
+    ) -> None:
+        self.source = source
+        self.filename = filename or _filename_for(source)
+        self.content_type = content_type or mimetypes.guess_type(self.filename)[0] or "application/octet-stream"
+        self.boundary = secrets.token_hex(16)
+        self._head = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{_quote(field)}"; filename="{_quote(self.filename)}"\r\n'
+            f"Content-Type: {self.content_type}\r\n\r\n"
+        ).encode("utf-8")
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode("ascii")
+        self._start: Optional[int] = None
+        if _is_seekable(source):
+            self._start = source.tell()  # type: ignore[union-attr]
+        self._length = self._size()
+        self._consumed = False
+
+    @property
+    def replayable(self) -> bool:
+        source = self.source
+        return isinstance(source, (str, os.PathLike, bytes, bytearray, memoryview)) or self._start is not None
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        headers = {"Content-Type": f"multipart/form-data; boundary={self.boundary}"}
+        if self._length is not None:
+            headers["Content-Length"] = str(len(self._head) + self._length + len(self._tail))
+        return headers
+
+    def iter_bytes(self) -> Iterator[bytes]:
+        self._begin()
+        yield self._head
+        source = self.source
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            view = memoryview(source).cast("B")
+            for offset in range(0, len(view), CHUNK_SIZE):
+                yield view[offset : offset + CHUNK_SIZE]  # type: ignore[misc]
+        elif isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as f:
+                yield from iter(lambda: f.read(CHUNK_SIZE), b"")
+        elif hasattr(source, "read"):
+            self._rewind()
+            yield from iter(lambda: source.read(CHUNK_SIZE), b"")  # type: ignore[union-attr]
+        else:
+            raise TypeError("async byte iterators can only be uploaded with AsyncSwiklyClient")
+        yield self._tail
+
+    async def aiter_bytes(self) -> AsyncIterator[bytes]:
+        self._begin()
+        yield self._head
+        source = self.source
+        loop = asyncio.get_running_loop()
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            view = memoryview(source).cast("B")
+            for offset in range(0, len(view), CHUNK_SIZE):
+                yield view[offset : offset + CHUNK_SIZE]  # type: ignore[misc]
+        elif isinstance(source, (str, os.PathLike)):
+            f = await loop.run_in_executor(None, open, source, "rb")
+            try:
+                while chunk := await loop.run_in_executor(None, f.read, CHUNK_SIZE):
+                    yield chunk
+            finally:
+                f.close()
+        elif hasattr(source, "read"):
+            await loop.run_in_executor(None, self._rewind)
+            while chunk := await loop.run_in_executor(None, source.read, CHUNK_SIZE):  # type: ignore[union-attr]
+                yield chunk
+        else:
+            async for chunk in source:  # type: ignore[union-attr]
+                yield chunk
+        yield self._tail
+
+    def _begin(self) -> None:
+        if self._consumed and not self.replayable:
+            raise SwiklyUploadNotReplayableError("upload source can only be sent once")
+        self._consumed = True
+
+    def _rewind(self) -> None:
+        if self._start is not None:
+            self.source.seek(self._start)  # type: ignore[union-attr]
+
+    def _size(self) -> Optional[int]:
+        source = self.source
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return memoryview(source).nbytes
+        if isinstance(source, (str, os.PathLike)):
+            return os.stat(source).st_size
+        if self._start is not None:
+            try:
+                return os.fstat(source.fileno()).st_size - self._start  # type: ignore[union-attr]
+            except (AttributeError, OSError, ValueError):
+                end = source.seek(0, os.SEEK_END)  # type: ignore[union-attr]
+                source.seek(self._start)  # type: ignore[union-attr]
+                return end - self._start
+        return None
+
+
+class _BatchUpload:
+    """One item of an upload batch, sent again from the same point after a 429.
+
+    The start offset of a file object is taken once, before the first attempt,
+    so a retry never starts from wherever the previous attempt stopped reading.
+    """
+
+    def __init__(self, source: FileSource, filename: Optional[str]) -> None:
+        self.source = source
+        self.filename = filename
+        self._start = source.tell() if _is_seekable(source) else None  # type: ignore[union-attr]
+        self._sent = False
+
+    @property
+    def replayable(self) -> bool:
+        return isinstance(self.source, (str, os.PathLike, bytes, bytearray, memoryview)) or self._start is not None
+
+    def kwargs(self) -> Dict[str, Any]:
+        if self._sent and self._start is not None:
+            self.source.seek(self._start)  # type: ignore[union-attr]
+        self._sent = True
+        return {"file": self.source, "filename": self.filename}
+
+
+def _filename_for(source: Any) -> str:
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.basename(os.fspath(source))
+    name = getattr(source, "name", None)
+    if isinstance(name, str):
+        return os.path.basename(name)
+    return "upload"
+
+
+def _quote(value: str) -> str:
+    # Same escaping as browsers (and httpx) use in Content-Disposition.
+    return value.replace("\\", "\\\\").replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+
+def _is_seekable(source: Any) -> bool:
+    try:
+        return hasattr(source, "read") and bool(source.seekable())
+    except (AttributeError, OSError, ValueError):
+        return False
+
+
+def _replayable(content: Any) -> bool:
+    if isinstance(content, MultipartUpload):
+        return content.replayable
+    return content is None or isinstance(content, (bytes, str))
+
+
+def _sync_body(content: Any) -> Any:
+    return content.iter_bytes() if isinstance(content, MultipartUpload) else content
+
+
+def _async_body(content: Any) -> Any:
+    return content.aiter_bytes() if isinstance(content, MultipartUpload) else content
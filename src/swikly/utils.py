@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+import re
 import time
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Optional, Pattern, Tuple
 
 import httpx
 
@@ -48,6 +50,10 @@ def _sleep(seconds: float) -> None:
     time.sleep(seconds)
 
 
+async def _asleep(seconds: float) -> None:
+    await asyncio.sleep(seconds)
+
+
 def _read_retry_after(headers: httpx.Headers) -> Optional[int]:
     ra = headers.get("Retry-After")
     if not ra:
@@ -56,3 +62,17 @@ def _read_retry_after(headers: httpx.Headers) -> Optional[int]:
         return int(ra)
     except ValueError:
         return None
+
+
+def _compile_path_template(template: str) -> Pattern[str]:
+    # "/accounts/{account_id}/requests" -> one path segment per placeholder
+    parts = re.split(r"\{[^}]+\}", template)
+    return re.compile("^" + "[^/]+".join(re.escape(p) for p in parts) + "/?$")
+
+
+def _path_template(path: str) -> str:
+    # /accounts/{id}/<collection>/{id}/<action>: every other segment is an id.
+    segments = path.split("?", 1)[0].strip("/").split("/")
+    if segments[0] != "accounts":
+        return "/" + "/".join(segments)
+    return "/" + "/".join("{id}" if i % 2 else s for i, s in enumerate(segments))
@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .models import WebhookEvent
+from .replay import ReplayStore, _replay_key
+from .webhooks import (
+    WebhookReplayError,
+    WebhookVerificationError,
+    _match_secret,
+    _parse_signature_header,
+    _parse_timestamp,
+    _signing_key,
+    _within_tolerance,
+)
+
+logger = logging.getLogger("swikly.webhooks")
+
+SIGNATURE_HEADER = "Swikly-Signature"
+
+Handler = Callable[[WebhookEvent], Union[None, Awaitable[None]]]
+ErrorHandler = Callable[[WebhookEvent, BaseException], None]
+DedupKey = Callable[[WebhookEvent], Optional[str]]
+
+_WILDCARD = "*"
+# Bad signatures, and bodies or Content-Length headers that do not parse (pydantic's
+# ValidationError is a ValueError).
+_BAD_DELIVERY = (WebhookVerificationError, ValueError)
+
+
+def _log_handler_error(event: WebhookEvent, exc: BaseException) -> None:
+    logger.error("Webhook handler failed for %s", event.event, exc_info=exc)
+
+
+class WebhookProcessor:
+    """Verify, parse and dispatch Swikly webhook deliveries.
+
+    - ``secrets`` may list several account secrets (e.g. during rotation); a
+      delivery is accepted if any of them signed it. HMAC key state is built once
+      per secret and copied per delivery.
+    - Bodies are parsed once, straight from bytes, into :class:`WebhookEvent`.
+    - Handlers registered with :meth:`on` run inline, or on a thread pool of
+      ``max_workers`` threads for :meth:`process`. :meth:`aprocess` awaits
+      coroutine handlers concurrently, at most ``max_concurrency`` at a time,
+      and runs plain functions in worker threads.
+    - With a ``replay_store``, a delivery already accepted once is rejected with
+      :class:`WebhookReplayError`. Deliveries are keyed on their signature and
+      timestamp, or on ``dedup_key(event)`` (e.g. an event id) when given.
+    - :meth:`asgi_app` / :meth:`wsgi_app` expose the processor as an endpoint.
+    """
+
+    def __init__(
+        self,
+        secrets: Union[str, Sequence[str]],
+        *,
+        tolerance_seconds: int = 10 * 60,
+        max_workers: int = 0,
+        max_concurrency: int = 100,
+        on_error: Optional[ErrorHandler] = None,
+        replay_store: Optional[ReplayStore] = None,
+        dedup_key: Optional[DedupKey] = None,
+    ) -> None:
+        secret_list = [secrets] if isinstance(secrets, str) else list(secrets)
+        if not secret_list:
+            raise ValueError("at least one webhook secret is required")
+        self._keys = [_signing_key(s) for s in secret_list]
+        self.tolerance_seconds = tolerance_seconds
+        self._handlers: Dict[str, List[Handler]] = {}
+        self._pool = ThreadPoolExecutor(max_workers=max_workers) if max_workers > 0 else None
+        self._max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._on_error = on_error or _log_handler_error
+        window = getattr(replay_store, "window_seconds", None)
+        if window is not None and window < tolerance_seconds:
+            raise ValueError("the replay store's window_seconds must be >= tolerance_seconds")
+        self.replay_store = replay_store
+        self._dedup_key = dedup_key
+
+    # -------- Registration --------
+    def on(self, event: str = _WILDCARD) -> Callable[[Handler], Handler]:
+        """Decorator registering a handler for ``event`` (``"*"`` for every event)."""
+
+        def register(handler: Handler) -> Handler:
+            self.add_handler(event, handler)
+            return handler
+
+        return register
+
+    def add_handler(self, event: str, handler: Handler) -> None:
+        self._handlers.setdefault(event, []).append(handler)
+
+    def handlers_for(self, event: str) -> List[Handler]:
+        return self._handlers.get(event, []) + self._handlers.get(_WILDCARD, [])
+
+    # -------- Verification / parsing --------
+    def verify(self, signature_header: str, raw_body: bytes, *, now: Optional[int] = None) -> int:
+        """Check the signature; return the index of the secret that matched."""
+        return self._verify(signature_header, raw_body, now)[0]
+
+    def _verify(self, signature_header: str, raw_body: bytes, now: Optional[int]) -> Tuple[int, str, int]:
+        ts_str, provided = _parse_signature_header(signature_header)
+        ts = _parse_timestamp(ts_str)
+        if not _within_tolerance(ts, self.tolerance_seconds, now):
+            raise WebhookVerificationError("Swikly-Signature timestamp outside tolerance")
+        index = _match_secret(self._keys, ts_str, raw_body, provided)
+        if index is None:
+            raise WebhookVerificationError("Swikly-Signature does not match any secret")
+        return index, _replay_key(ts_str, provided), ts
+
+    def parse(self, raw_body: bytes) -> WebhookEvent:
+        return WebhookEvent.model_validate_json(raw_body)
+
+    def _accept(self, signature_header: str, raw_body: bytes, now: Optional[int]) -> Tuple[WebhookEvent, str, int]:
+        _, key, ts = self._verify(signature_header, raw_body, now)
+        event = self.parse(raw_body)
+        if self.replay_store is not None:
+            event_key = self._dedup_key(event) if self._dedup_key is not None else None
+            if event_key:
+                # A retry may be re-signed with a new timestamp, so count from
+                # when the event arrived rather than from when it was signed.
+                key, ts = event_key, int(now if now is not None else time.time())
+            if not self.replay_store.add(key, ts):
+                raise WebhookReplayError("Swikly webhook delivery was already processed")
+        return event, key, ts
+
+    def _forget(self, key: str, ts: int) -> None:
+        # Let Swikly's retry of a delivery whose handlers failed go through.
+        if self.replay_store is not None:
+            self.replay_store.discard(key, ts)
+
+    # -------- Dispatch --------
+    def process(self, signature_header: str, raw_body: bytes, *, now: Optional[int] = None) -> WebhookEvent:
+        """Verify, parse and dispatch one delivery to the sync handlers.
+
+        Without a pool, handler errors propagate so the caller can reject the
+        delivery and let Swikly retry it; with a pool they go to ``on_error``.
+        """
+        event, key, ts = self._accept(signature_header, raw_body, now)
+        self._dispatch(event, key, ts)
+        return event
+
+    def _dispatch(self, event: WebhookEvent, key: str, ts: int) -> None:
+        try:
+            for handler in self.handlers_for(event.event):
+                if self._pool is None:
+                    handler(event)
+                else:
+                    self._pool.submit(self._run_sync, handler, event)
+        except BaseException:
+            self._forget(key, ts)
+            raise
+
+    async def aprocess(self, signature_header: str, raw_body: bytes, *, now: Optional[int] = None) -> WebhookEvent:
+        """Verify, parse and dispatch one delivery, awaiting every handler."""
+        event, key, ts = self._accept(signature_header, raw_body, now)
+        await self._adispatch(event, key, ts)
+        return event
+
+    async def _adispatch(self, event: WebhookEvent, key: str, ts: int) -> None:
+        handlers = self.handlers_for(event.event)
+        if handlers:
+            try:
+                await asyncio.gather(*(self._run_async(h, event) for h in handlers))
+            except BaseException:
+                self._forget(key, ts)
+                raise
+
+    def _run_sync(self, handler: Handler, event: WebhookEvent) -> None:
+        try:
+            handler(event)
+        except BaseException as e:
+            self._on_error(event, e)
+
+    async def _run_async(self, handler: Handler, event: WebhookEvent) -> None:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        async with self._semaphore:
+            if inspect.iscoroutinefunction(handler):
+                await handler(event)
+            else:
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(self._pool, handler, event)
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+
+    # -------- Adapters --------
+    def wsgi_app(self) -> Callable[[Dict[str, Any], Callable[..., Any]], Iterable[bytes]]:
+        """A WSGI application that answers 200 (also for replays), 400 (bad signature/body) or 500.
+
+        Only the delivery itself can earn a 400; any handler error is a 500.
+        """
+
+        def app(environ: Dict[str, Any], start_response: Callable[..., Any]) -> Iterable[bytes]:
+            if environ.get("REQUEST_METHOD") != "POST":
+                return _wsgi_reply(start_response, "405 Method Not Allowed")
+            header = environ.get("HTTP_SWIKLY_SIGNATURE", "")
+            try:
+                length = int(environ.get("CONTENT_LENGTH") or 0)
+                raw_body = environ["wsgi.input"].read(length) if length > 0 else b""
+                accepted = self._accept(header, raw_body, None)
+            except WebhookReplayError:
+                return _wsgi_reply(start_response, "200 OK")
+            except _BAD_DELIVERY:
+                return _wsgi_reply(start_response, "400 Bad Request")
+            try:
+                self._dispatch(*accepted)
+            except Exception:
+                logger.exception("Webhook processing failed")
+                return _wsgi_reply(start_response, "500 Internal Server Error")
+            return _wsgi_reply(start_response, "200 OK")
+
+        return app
+
+    def asgi_app(self) -> Callable[..., Awaitable[None]]:
+        """An ASGI (HTTP) application that answers 200 (also for replays), 400 (bad signature/body) or 500.
+
+        Only the delivery itself can earn a 400; any handler error is a 500.
+        """
+
+        async def app(scope: Dict[str, Any], receive: Callable[..., Any], send: Callable[..., Any]) -> None:
+            if scope["type"] != "http":
+                return
+            if scope.get("method") != "POST":
+                await _asgi_reply(send, 405)
+                return
+            chunks = []
+            more = True
+            while more:
+                message = await receive()
+                chunks.append(message.get("body", b""))
+                more = message.get("more_body", False)
+            header = ""
+            for name, value in scope.get("headers", []):
+                if name.lower() == b"swikly-signature":
+                    header = value.decode("latin-1")
+                    break
+            try:
+                accepted = self._accept(header, b"".join(chunks), None)
+            except WebhookReplayError:
+                await _asgi_reply(send, 200)
+                return
+            except _BAD_DELIVERY:
+                await _asgi_reply(send, 400)
+                return
+            try:
+                await self._adispatch(*accepted)
+            except Exception:
+                logger.exception("Webhook processing failed")
+                await _asgi_reply(send, 500)
+                return
+            await _asgi_reply(send, 200)
+
+        return app
+
+
+def _wsgi_reply(start_response: Callable[..., Any], status: str) -> Iterable[bytes]:
+    start_response(status, [("Content-Type", "text/plain"), ("Content-Length", "0")])
+    return [b""]
+
+
+async def _asgi_reply(send: Callable[..., Any], status: int) -> None:
+    await send({"type": "http.response.start", "status": status, "headers": [(b"content-type", b"text/plain")]})
+    await send({"type": "http.response.body", "body": b""})
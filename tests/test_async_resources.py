@@ -0,0 +1,172 @@
+import asyncio
+import json
+import re
+
+import httpx
+
+from swikly import AsyncSwiklyClient
+
+META = {"currentPage": 1, "lastPage": 1, "perPage": 20, "path": "/", "total": 1}
+REQUEST = {"id": "r1", "accountId": "a", "link": "l", "description": "d", "createdAt": "c"}
+DEPOSIT = {"id": "d1", "requestId": "r1", "amount": 100, "amountToBeSecured": 100, "securedAmount": 0,
+           "status": "Pending", "startDate": "s", "endDate": "e", "createdAt": "c"}
+NO_SHOW = {"id": "n1", "requestId": "r1", "reservationDate": "s", "amount": 100, "amountToBeSecured": 100,
+           "securedAmount": 0, "status": "Pending"}
+PAYMENT = {"id": "p1", "requestId": "r1", "amount": 100, "amountToBePaid": 100, "amountPaid": 0,
+           "status": "Pending", "createdAt": "c"}
+REFUND = {"id": "f1", "refundableType": "Payment", "refundableId": "p1", "amount": 10, "status": "Pending", "createdAt": "c"}
+RECLAIM = {"id": "c1", "amount": 10, "cashedInAmount": 0, "reason": "r", "filesValidated": False,
+           "createdAt": "c", "status": "Initialized"}
+FILE = {"id": "file1", "name": "n", "url": "u", "createdAt": "c"}
+
+# (method, path pattern under /v1, response body)
+ROUTES = [
+    ("GET", r"/me", {"user": {"id": "u1", "firstName": "f", "lastName": "l", "email": "e", "createdAt": "c"}}),
+    ("GET", r"/accounts", {"accounts": [{"id": "a", "commercialName": "n", "currency": "EUR", "createdAt": "c"}], "meta": META}),
+    ("GET", r"/accounts/a/requests", {"requests": [REQUEST], "meta": META}),
+    ("POST", r"/accounts/a/requests", {"request": REQUEST}),
+    ("GET", r"/accounts/a/requests/r1/reclaims", {"reclaims": [RECLAIM], "meta": META}),
+    ("GET|PATCH", r"/accounts/a/requests/r1", {"request": REQUEST}),
+    ("POST", r"/accounts/a/requests/r1/(cancel|release|create_reclaim|cancel_reclaim|create_refund)", {"request": REQUEST}),
+    ("GET|PATCH", r"/accounts/a/deposits/d1", {"deposit": DEPOSIT}),
+    ("GET|PATCH", r"/accounts/a/no-shows/n1", {"no-show": NO_SHOW}),
+    ("GET|PATCH", r"/accounts/a/payments/p1", {"payment": PAYMENT}),
+    ("GET", r"/accounts/a/refunds/f1", {"refund": REFUND}),
+    ("POST", r"/accounts/a/(payments/p1|reclaims/c1)/refunds", {"refund": REFUND}),
+    ("GET", r"/accounts/a/reclaims", {"reclaims": [RECLAIM], "meta": META}),
+    ("GET", r"/accounts/a/reclaims/c1", {"reclaim": RECLAIM}),
+    ("POST", r"/accounts/a/(deposits/d1|no-shows/n1)/reclaims", {"reclaim": RECLAIM}),
+    ("POST", r"/accounts/a/(files|reclaims/c1/files)", {"file": FILE}),
+    ("DELETE", r"/accounts/a/reclaims/c1/files/file1", {}),
+    ("POST", r"/shortener/short-links", {"shortLink": {"id": "s1", "link": "l", "shortLink": "s", "createdAt": "c"}}),
+]
+
+
+class _Api:
+    def __init__(self):
+        self.calls = []
+
+    def handler(self, request):
+        path = request.url.path[len("/v1"):]
+        body = json.loads(request.content) if request.headers.get("content-type") == "application/json" else None
+        self.calls.append((request.method, path, body))
+        for methods, pattern, payload in ROUTES:
+            if request.method in methods.split("|") and re.fullmatch(pattern, path):
+                return httpx.Response(200, json=payload)
+        return httpx.Response(404, json={"message": "Not found"})
+
+
+def _run(fn):
+    api = _Api()
+
+    async def main():
+        client = AsyncSwiklyClient(token="t", transport=httpx.MockTransport(api.handler))
+        try:
+            return await fn(client)
+        finally:
+            await client.aclose()
+
+    return asyncio.run(main()), api.calls
+
+
+def test_async_users_and_accounts():
+    async def calls(client):
+        me = await client.users.ame()
+        accounts = await client.accounts.alist(page=1, per_page=20)
+        every = [a async for a in client.accounts.aiter_all()]
+        return me, accounts, every
+
+    (me, accounts, every), calls = _run(calls)
+    assert me.user.id == "u1"
+    assert accounts.accounts[0].id == every[0].id == "a"
+    assert [c[:2] for c in calls] == [("GET", "/me"), ("GET", "/accounts"), ("GET", "/accounts")]
+
+
+def test_async_requests_surface():
+    async def calls(client):
+        requests = client.requests
+        return [
+            (await requests.alist(account_id="a", search="x")).requests[0].id,
+            [r.id async for r in requests.aiter_all(account_id="a")],
+            (await requests.acreate(account_id="a", description="d", language="fr")).request.id,
+            (await requests.aget(account_id="a", request_id="r1")).request.id,
+            (await requests.aupdate(account_id="a", request_id="r1", deposit={"amount": 200})).request.id,
+            (await requests.acancel(account_id="a", request_id="r1")).request.id,
+            (await requests.arelease(account_id="a", request_id="r1")).request.id,
+            (await requests.acreate_reclaim(account_id="a", request_id="r1", target="deposit", amount=5, reason="r")).request.id,
+            (await requests.acancel_reclaim(account_id="a", request_id="r1", target="deposit")).request.id,
+            (await requests.acreate_refund(account_id="a", request_id="r1", target="payment", amount=5, reason="r")).request.id,
+        ]
+
+    ids, calls = _run(calls)
+    assert ids == ["r1", ["r1"]] + ["r1"] * 8
+    assert ("POST", "/accounts/a/requests", {"description": "d", "language": "fr"}) in calls
+    assert ("PATCH", "/accounts/a/requests/r1", {"deposit": {"amount": 200}}) in calls
+    assert ("POST", "/accounts/a/requests/r1/create_refund", {"target": "payment", "amount": 5, "reason": "r"}) in calls
+
+
+def test_async_deposits_no_shows_and_payments():
+    async def calls(client):
+        return [
+            (await client.deposits.aget(account_id="a", deposit_id="d1")).deposit.id,
+            (await client.deposits.aupdate(account_id="a", deposit_id="d1", amount=200)).deposit.id,
+            (await client.no_shows.aget(account_id="a", no_show_id="n1")).no_show.id,
+            (await client.no_shows.aupdate(account_id="a", no_show_id="n1", status="Canceled")).no_show.id,
+            (await client.payments.aget(account_id="a", payment_id="p1")).payment.id,
+            (await client.payments.aupdate(account_id="a", payment_id="p1", status="Canceled")).payment.id,
+        ]
+
+    ids, calls = _run(calls)
+    assert ids == ["d1", "d1", "n1", "n1", "p1", "p1"]
+    assert [c[0] for c in calls] == ["GET", "PATCH"] * 3
+    assert calls[1][2] == {"amount": 200} and calls[3][2] == {"status": "Canceled"}
+
+
+def test_async_refunds():
+    async def calls(client):
+        return [
+            (await client.refunds.aget(account_id="a", refund_id="f1")).refund.id,
+            (await client.refunds.arefund_payment(account_id="a", payment_id="p1", amount=10, reason="r")).refund.id,
+            (await client.refunds.arefund_reclaim(account_id="a", reclaim_id="c1", amount=10, reason="r")).refund.id,
+        ]
+
+    ids, calls = _run(calls)
+    assert ids == ["f1"] * 3
+    assert [c[1] for c in calls] == ["/accounts/a/refunds/f1", "/accounts/a/payments/p1/refunds", "/accounts/a/reclaims/c1/refunds"]
+
+
+def test_async_reclaims():
+    async def calls(client):
+        reclaims = client.reclaims
+        return [
+            (await reclaims.alist(account_id="a", status="Initialized")).reclaims[0].id,
+            [r.id async for r in reclaims.aiter_all(account_id="a")],
+            (await reclaims.alist_for_request(account_id="a", request_id="r1")).reclaims[0].id,
+            (await reclaims.aget(account_id="a", reclaim_id="c1")).reclaim.id,
+            (await reclaims.acreate_from_deposit(account_id="a", deposit_id="d1", amount=10, reason="r")).reclaim.id,
+            (await reclaims.acreate_from_no_show(account_id="a", no_show_id="n1", amount=10, reason="r")).reclaim.id,
+        ]
+
+    ids, calls = _run(calls)
+    assert ids == ["c1", ["c1"], "c1", "c1", "c1", "c1"]
+    assert calls[-1] == ("POST", "/accounts/a/no-shows/n1/reclaims", {"amount": 10, "reason": "r"})
+
+
+def test_async_files_and_short_links():
+    async def calls(client):
+        return [
+            (await client.files.aupload_temporary_file(account_id="a", file=b"pdf", filename="a.pdf")).file.id,
+            (await client.files.aattach_file_to_reclaim(account_id="a", reclaim_id="c1", file=b"pdf", filename="a.pdf")).file.id,
+            await client.files.adelete_reclaim_file(account_id="a", reclaim_id="c1", file_id="file1"),
+            (await client.short_links.acreate(link="https://example.com")).shortLink.id,
+        ]
+
+    ids, calls = _run(calls)
+    assert ids == ["file1", "file1", None, "s1"]
+    assert [c[:2] for c in calls] == [
+        ("POST", "/accounts/a/files"),
+        ("POST", "/accounts/a/reclaims/c1/files"),
+        ("DELETE", "/accounts/a/reclaims/c1/files/file1"),
+        ("POST", "/shortener/short-links"),
+    ]
+    assert calls[-1][2] == {"link": "https://example.com"}
@@ -0,0 +1,99 @@
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+
+import swikly.batch as batch_mod
+from swikly import AsyncSwiklyClient, RetryPolicy, SwiklyClient, SwiklyValidationError, deadline_scope
+from swikly.deadline import _remaining
+
+
+def _request(rid):
+    return {"id": rid, "accountId": "a", "link": "l", "description": "d", "createdAt": "2026-01-01"}
+
+
+def _handler():
+    lock = threading.Lock()
+    state = {"throttled": False}
+
+    def handler(request):
+        body = json.loads(request.content)
+        if body["description"] == "bad":
+            return httpx.Response(422, json={"code": "ERR_PARAMS", "message": "invalid"})
+        with lock:
+            if body["description"] == "3" and not state["throttled"]:
+                state["throttled"] = True
+                return httpx.Response(429, headers={"Retry-After": "2"}, json={"message": "Too Many Attempts."})
+        return httpx.Response(200, json={"request": _request(body["description"])})
+
+    return handler
+
+
+ITEMS = [{"description": str(i), "language": "fr"} for i in range(10)] + [{"description": "bad", "language": "fr"}]
+
+
+def test_create_many_preserves_order_and_pauses_whole_batch(monkeypatch):
+    # Instead of sleeping, each worker tracks when it passed the gate and how long it was told to wait.
+    local = threading.local()
+    pauses = []
+    gate_pause, gate_remaining = batch_mod._RetryAfterGate.pause, batch_mod._RetryAfterGate.remaining
+
+    def pause(gate, seconds):
+        gate_pause(gate, seconds)
+        pauses.append((time.monotonic(), gate._resume_at))
+
+    def remaining(gate):
+        local.checked_at, local.waited = time.monotonic(), 0.0
+        return gate_remaining(gate)
+
+    def sleep(seconds):
+        local.waited += seconds
+
+    monkeypatch.setattr(batch_mod._RetryAfterGate, "pause", pause)
+    monkeypatch.setattr(batch_mod._RetryAfterGate, "remaining", remaining)
+    monkeypatch.setattr(batch_mod, "_sleep", sleep)
+    sent = []
+    api = _handler()
+
+    def handler(request):
+        sent.append((local.checked_at, local.checked_at + local.waited))
+        return api(request)
+
+    client = SwiklyClient(token="t")
+    client._http = httpx.Client(base_url=client.base_url, transport=httpx.MockTransport(handler))
+
+    results = client.requests.create_many(ITEMS, account_id="a", concurrency=4)
+
+    assert [r.index for r in results] == list(range(11))
+    assert [r.result.request.id for r in results[:10]] == [str(i) for i in range(10)]
+    assert isinstance(results[10].error, SwiklyValidationError)
+    assert len(pauses) == 1
+    paused_at, resume_at = pauses[0]
+    # Calls already in flight may land, but nothing that reached the gate after the 429
+    # (the throttled item's retry included) went out before Retry-After elapsed.
+    after = [sent_at for checked_at, sent_at in sent if checked_at >= paused_at]
+    assert after and all(sent_at >= resume_at - 0.01 for sent_at in after)
+
+
+def test_aiter_create_many_streams_every_item(monkeypatch):
+    monkeypatch.setattr(batch_mod, "_asleep", lambda s: asyncio.sleep(0))
+
+    async def main():
+        client = AsyncSwiklyClient(token="t")
+        client._http = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(_handler()))
+        results = [r async for r in client.requests.aiter_create_many(ITEMS, account_id="a", concurrency=3)]
+        await client.aclose()
+        return results
+
+    results = asyncio.run(main())
+    assert sorted(r.index for r in results) == list(range(11))
+    assert sum(r.ok for r in results) == 10
+
+
+def test_run_batch_workers_see_the_callers_deadline():
+    with deadline_scope(30):
+        results = list(batch_mod.run_batch(lambda _: _remaining(), range(4), policy=RetryPolicy(), concurrency=2))
+
+    assert all(r.result is not None and 0 < r.result <= 30 for r in results)
@@ -0,0 +1,66 @@
+import httpx
+import pytest
+
+from swikly import CacheBackend, InMemoryCache, ResponseCache, SwiklyClient
+
+REQUEST = {"request": {"id": "r1", "accountId": "a", "link": "l", "description": "d", "createdAt": "c"}}
+
+
+def _client(cache, handler):
+    return SwiklyClient(token="t", cache=cache, transport=httpx.MockTransport(handler))
+
+
+def test_get_is_served_from_cache_until_a_mutation():
+    calls = []
+
+    def handler(request):
+        calls.append((request.method, request.url.path))
+        return httpx.Response(200, json=REQUEST)
+
+    cache = ResponseCache()
+    client = _client(cache, handler)
+
+    client.requests.get(account_id="a", request_id="r1")
+    client.requests.get(account_id="a", request_id="r1")
+    client.requests.cancel(account_id="a", request_id="r1")
+    client.requests.get(account_id="a", request_id="r1")
+
+    assert [m for m, _ in calls] == ["GET", "POST", "GET"]
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+
+
+def test_stale_entry_is_revalidated_with_etag():
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"user": {"id": "u", "firstName": "a", "lastName": "b", "email": "e", "createdAt": "c"}}, headers={"ETag": '"v1"'})
+
+    cache = ResponseCache(ttls={"/me": 0})
+    client = _client(cache, handler)
+
+    assert client.users.me().user.id == "u"
+    assert client.users.me().user.id == "u"
+    assert seen == [None, '"v1"']
+    assert cache.stats.revalidations == 1
+
+
+def test_lru_evictions_are_counted():
+    cache = ResponseCache(InMemoryCache(maxsize=1), ttls={"/accounts/{account_id}/requests/{request_id}": 60})
+    client = _client(cache, lambda r: httpx.Response(200, json=REQUEST))
+
+    client.requests.get(account_id="a", request_id="r1")
+    client.requests.get(account_id="a", request_id="r2")
+
+    assert cache.stats.evictions == 1
+
+
+def test_cache_backends_must_implement_the_whole_interface():
+    class GetOnly(CacheBackend):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        GetOnly()
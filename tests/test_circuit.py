@@ -0,0 +1,148 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+import swikly.circuit as circuit_mod
+import swikly.client as client_mod
+from swikly import (
+    AsyncSwiklyClient,
+    CircuitBreaker,
+    ClientHooks,
+    HedgePolicy,
+    SwiklyAPIError,
+    SwiklyCircuitOpenError,
+    SwiklyClient,
+    SwiklyDeadlineExceededError,
+    TokenBucketRateLimiter,
+    deadline_scope,
+)
+from swikly.deadline import _remaining
+
+
+def test_breaker_opens_fails_fast_and_recovers_through_half_open(monkeypatch):
+    monkeypatch.setattr(client_mod, "_sleep", lambda s: None)
+    now = [1000.0]
+    monkeypatch.setattr(circuit_mod.time, "monotonic", lambda: now[0])
+    state = {"status": 503}
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(state["status"], json={"user": {}} if state["status"] == 200 else {"message": "down"})
+
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=10)
+    client = SwiklyClient(token="t", circuit_breaker=breaker, transport=httpx.MockTransport(handler))
+
+    with pytest.raises(SwiklyAPIError):
+        client.request("GET", "/me")  # 1 attempt + 2 retries = 3 failures
+    with pytest.raises(SwiklyCircuitOpenError) as info:
+        client.request("GET", "/me")
+    assert len(calls) == 3 and info.value.retry_after == 10
+
+    now[0] += 10
+    state["status"] = 200
+    assert breaker.state("api.v2.swikly.com") == "half_open"
+    client.request("GET", "/me")
+    assert breaker.state("api.v2.swikly.com") == "closed"
+
+
+def test_half_open_probe_is_given_back_when_the_deadline_expires_before_sending():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+    key = "api.v2.swikly.com"
+    breaker.acquire(key)
+    breaker.record(key, False)  # open; the next call is the half-open probe
+    limiter = TokenBucketRateLimiter(rate=1, burst=1)
+    limiter.reserve()  # the next slot is a second away
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"user": {}}))
+    client = SwiklyClient(token="t", circuit_breaker=breaker, rate_limiter=limiter, transport=transport)
+
+    with pytest.raises(SwiklyDeadlineExceededError), deadline_scope(0.2):
+        client.request("GET", "/me")
+    assert breaker.state(key) == "half_open"
+
+    SwiklyClient(token="t", circuit_breaker=breaker, transport=transport).request("GET", "/me")
+    assert breaker.state(key) == "closed"
+
+
+def test_endpoint_scope_keys_on_path_template():
+    breaker = CircuitBreaker(scope="endpoint")
+    key = breaker.key("post", "/accounts/a1/requests/r9/create_refund", "https://x/v1/accounts/a1/requests/r9/create_refund")
+    assert key == "POST /accounts/{id}/requests/{id}/create_refund"
+    assert breaker.key("GET", "/me", "https://x/v1/me") == "GET /me"
+
+
+def test_slow_get_is_hedged_and_the_first_answer_wins():
+    caller = threading.current_thread()
+    calls = []
+    released = threading.Event()
+
+    class Recorder(ClientHooks):
+        def __init__(self):
+            self.attempts = []
+
+        def after_response(self, info):
+            self.attempts.append(info)
+
+    def handler(request):
+        calls.append((threading.current_thread() is caller, _remaining() is not None))
+        if len(calls) == 1:
+            released.wait(5)  # the original stalls until the test is done
+            return httpx.Response(200, json={"user": {"id": "slow"}})
+        return httpx.Response(200, json={"user": {"id": "fast"}})
+
+    hedge = HedgePolicy(delay=0.05)
+    hooks = Recorder()
+    client = SwiklyClient(token="t", hedge=hedge, hooks=[hooks], transport=httpx.MockTransport(handler))
+    started = time.monotonic()
+    with deadline_scope(5):
+        resp = client.request("GET", "/me")
+    assert time.monotonic() - started < 1  # did not wait for the stalled original
+    released.set()
+    assert resp.json()["user"]["id"] == "fast"
+    assert hedge.stats.hedged == 1 and hedge.stats.wins == 1
+    # Both copies ran on worker threads and saw the caller's deadline.
+    assert calls == [(False, True), (False, True)]
+    assert hooks.attempts[0] is not hooks.attempts[1]
+
+    client.request("POST", "/accounts/a/requests", json={})  # never hedged
+    assert len(calls) == 3
+
+
+def test_hedge_answers_for_an_original_that_fails():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            time.sleep(0.2)
+            raise httpx.ConnectError("reset", request=request)
+        return httpx.Response(200, json={"user": {"id": "hedge"}})
+
+    hedge = HedgePolicy(delay=0.05)
+    client = SwiklyClient(token="t", hedge=hedge, transport=httpx.MockTransport(handler))
+    assert client.request("GET", "/me").json()["user"]["id"] == "hedge"
+    assert hedge.stats.wins == 1 and len(calls) == 2
+
+
+def test_async_hedge_waits_for_enough_samples_then_uses_quantile():
+    async def handler(request):
+        await asyncio.sleep(0.2 if request.url.params.get("slow") else 0)
+        return httpx.Response(200, json={"ok": request.url.params.get("slow", "fast")})
+
+    async def main():
+        hedge = HedgePolicy(min_samples=5, min_delay=0.01)
+        client = AsyncSwiklyClient(token="t", hedge=hedge, transport=httpx.MockTransport(handler))
+        for _ in range(5):
+            await client.request("GET", "/me")
+        assert hedge.hedge_delay() == 0.01
+        resp = await client.request("GET", "/me", params={"slow": "1"})
+        await client.aclose()
+        return hedge, resp
+
+    hedge, resp = asyncio.run(main())
+    # Both copies are slow here, so the original still wins, but a hedge was sent.
+    assert hedge.stats.hedged == 1
+    assert resp.json() == {"ok": "1"}
@@ -0,0 +1,61 @@
+import httpx
+
+from swikly import SwiklyClient, create_http_client
+
+
+def test_clients_share_one_pool_with_their_own_credentials():
+    seen = []
+
+    def handler(request):
+        seen.append((str(request.url), request.headers.get("Authorization")))
+        return httpx.Response(200, json={"user": {}})
+
+    pool = create_http_client(transport=httpx.MockTransport(handler))
+    first = SwiklyClient(token="one", environment="sandbox", http_client=pool)
+    second = SwiklyClient(token="two", environment="sandbox", http_client=pool)
+
+    first.request("GET", "/me")
+    second.request("GET", "/me")
+    first.close()
+
+    assert not pool.is_closed
+    assert seen == [
+        ("https://api.sandbox.swikly.com/v1/me", "Bearer one"),
+        ("https://api.sandbox.swikly.com/v1/me", "Bearer two"),
+    ]
+
+
+def test_transport_and_limits_are_forwarded():
+    client = SwiklyClient(
+        token="t",
+        limits=httpx.Limits(max_connections=3),
+        transport=httpx.MockTransport(lambda r: httpx.Response(200, json={})),
+    )
+    assert client.request("GET", "/me").status_code == 200
+    client.close()
+    assert client._http.is_closed
+
+
+def test_set_token_rotates_auth_for_owned_and_shared_pools():
+    seen = []
+
+    def handler(request):
+        seen.append((request.headers.get("Authorization"), request.headers.get("X-Trace")))
+        return httpx.Response(200, json={"user": {}})
+
+    owned = SwiklyClient(token="old", transport=httpx.MockTransport(handler))
+    view = owned.with_options(deadline=5)
+    pool = create_http_client(transport=httpx.MockTransport(handler))
+    shared = SwiklyClient(token="old", http_client=pool)
+    namespace = owned._cache_namespace
+
+    owned.request("GET", "/me", headers={"X-Trace": "1"})
+    owned.set_token("new")
+    view.request("GET", "/me")
+    shared.set_token("new")
+    shared.request("GET", "/me", headers={"X-Trace": "2"})
+    shared.request("GET", "/me")
+
+    assert seen == [("Bearer old", "1"), ("Bearer new", None), ("Bearer new", "2"), ("Bearer new", None)]
+    assert owned._cache_namespace != namespace
+    assert view._cache_namespace == owned._cache_namespace
@@ -0,0 +1,94 @@
+import httpx
+import pytest
+
+from swikly import ColumnarRows, SwiklyClient
+from swikly.decoding import decode_response
+from swikly.models import InitializedReclaim, ReclaimsListResponse, Request, RequestsListResponse
+
+
+def _request(i, **extra):
+    rid = f"r{i}"
+    return {
+        "id": rid,
+        "accountId": "a",
+        "link": "l",
+        "description": "d",
+        "createdAt": "2026-01-01",
+        "releasable": i % 2 == 0,
+        "endUser": {"kind": "person"},
+        "deposit": {
+            "id": f"d{i}", "requestId": rid, "amount": 100 * i, "amountToBeSecured": 100, "securedAmount": 0,
+            "status": "Pending", "startDate": "2026-02-01", "endDate": "2026-02-02", "createdAt": "2026-01-01",
+            "reclaimSummary": {"reclaimedAmount": 0, "irrecoverabilityCertificates": []},
+        },
+        **extra,
+    }
+
+
+def _page(items, key="requests"):
+    meta = {"currentPage": 1, "lastPage": 1, "perPage": 20, "path": "/", "total": len(items)}
+    return httpx.Response(200, json={key: items, "meta": meta})
+
+
+def test_columnar_rows_match_the_validated_models():
+    items = [_request(1), _request(2, customId="c2", extraField="kept"), _request(3, deposit=None)]
+    page = decode_response(_page(items), RequestsListResponse, "columnar")
+    rows = page.requests
+
+    assert isinstance(rows, ColumnarRows) and len(rows) == 3 and page.meta.total == 3
+    assert rows[0].deposit.amount == 100 and rows[1].releasable is True and rows[2].deposit is None
+    assert rows[-2].customId == "c2" and rows[0].customId is None
+    assert rows[1].endUser == {"kind": "person"}  # not a column: read from the full model
+    assert rows[0].deposit.reclaimSummary.irrecoverabilityCertificates == []
+    assert rows[1].model_dump()["extraField"] == "kept"
+
+    expected = RequestsListResponse.model_validate({"requests": items}).requests
+    assert rows.to_models() == expected
+    assert isinstance(rows[0].model(), Request)
+    assert rows.column("deposit.amount") == [100, 200, None]
+    values, validity = rows.buffers()["deposit.amount"]
+    assert list(values) == [100, 200, 0] and list(validity) == [1, 1, 0]
+
+    more = decode_response(_page([_request(4)]), RequestsListResponse, "columnar").requests
+    rows.extend(more)
+    assert [r.id for r in rows] == ["r1", "r2", "r3", "r4"]
+
+
+def test_mistyped_values_are_kept_per_row():
+    rows = decode_response(_page([_request(1, releasable="yes")]), RequestsListResponse, "columnar").requests
+    assert rows.column("releasable") == [None]
+    assert rows[0].to_dict()["releasable"] == "yes"
+
+
+def test_reclaims_and_client_option():
+    reclaim = {
+        "id": "rc1", "amount": 10, "cashedInAmount": 0, "reason": "damage", "filesValidated": False,
+        "createdAt": "2026-01-01", "status": "Initialized", "files": [],
+    }
+    rows = decode_response(_page([reclaim], "reclaims"), ReclaimsListResponse, "columnar").reclaims
+    assert rows[0].status == "Initialized" and isinstance(rows[0].model(), InitializedReclaim)
+
+    client = SwiklyClient(token="t", transport=httpx.MockTransport(lambda r: _page([_request(1)])))
+    with pytest.raises(ValueError):
+        client.with_options(decode="nope")
+    page = client.with_options(decode="columnar").requests.list(account_id="a")
+    assert page.requests[0].deposit.status == "Pending"
+    assert [r.id for r in client.with_options(decode="columnar").requests.iter_all(account_id="a")] == ["r1"]
+    assert client.decode == "validate"
+
+
+def test_to_arrow():
+    pytest.importorskip("pyarrow")
+    rows = decode_response(_page([_request(1), _request(2)]), RequestsListResponse, "columnar").requests
+    table = rows.to_arrow()
+    assert table.column("deposit.amount").to_pylist() == [100, 200]
+
+
+def test_ints_beyond_int64_are_kept_per_row():
+    big = 2**70
+    items = [_request(1), _request(2)]
+    items[1]["deposit"]["amount"] = big
+    rows = decode_response(_page(items), RequestsListResponse, "columnar").requests
+    assert rows.column("deposit.amount") == [100, None]
+    assert rows[1].deposit.amount == big and rows[1].to_dict()["deposit"]["amount"] == big
+    assert rows.to_models() == RequestsListResponse.model_validate({"requests": items}).requests
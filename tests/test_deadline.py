@@ -0,0 +1,85 @@
+import asyncio
+
+import httpx
+import pytest
+
+import swikly.client as client_mod
+import swikly.deadline as deadline_mod
+from swikly import (
+    AsyncSwiklyClient,
+    RetryPolicy,
+    SwiklyAPIError,
+    SwiklyClient,
+    SwiklyDeadlineExceededError,
+    deadline_scope,
+)
+
+
+def _user():
+    return {"user": {"id": "u", "email": "e", "firstName": "f", "lastName": "l", "createdAt": "2026-01-01 10:00:00"}}
+
+
+def test_per_call_timeout_is_capped_by_the_deadline():
+    seen = []
+
+    def handler(request):
+        seen.append(request.extensions["timeout"])
+        return httpx.Response(200, json=_user())
+
+    client = SwiklyClient(token="t", transport=httpx.MockTransport(handler))
+    client.request("GET", "/me", timeout=httpx.Timeout(5.0, connect=1.0))
+    client.request("GET", "/me", timeout=httpx.Timeout(5.0, connect=1.0), deadline=2.0)
+
+    assert seen[0] == {"connect": 1.0, "read": 5.0, "write": 5.0, "pool": 5.0}
+    assert seen[1]["connect"] == 1.0
+    assert 1.9 < seen[1]["read"] <= 2.0 and seen[1]["read"] == seen[1]["pool"]
+
+
+def test_deadline_covers_retries_and_backoff(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(deadline_mod.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(client_mod, "_sleep", lambda s: clock.__setitem__(0, clock[0] + s))
+    calls = []
+
+    def handler(request):
+        calls.append(clock[0])
+        return httpx.Response(503, json={"message": "down"})
+
+    policy = RetryPolicy(max_retries=5, backoff_base=0.3, jitter=False)
+    client = SwiklyClient(token="t", retry_policy=policy, transport=httpx.MockTransport(handler))
+    with pytest.raises(SwiklyAPIError):
+        client.request("GET", "/me", deadline=1.0)
+
+    # 0.3 and 0.6 fit in the second; the next 1.2s backoff would not.
+    assert calls == [100.0, 100.3, pytest.approx(100.9)]
+
+    with deadline_scope(0), pytest.raises(SwiklyDeadlineExceededError):
+        client.request("GET", "/me")
+
+
+def test_with_options_view_applies_to_resources_and_shares_the_pool():
+    seen = []
+
+    def handler(request):
+        seen.append(request.extensions["timeout"]["read"])
+        return httpx.Response(200, json=_user())
+
+    client = SwiklyClient(token="t", timeout=30.0, transport=httpx.MockTransport(handler))
+    fast = client.with_options(timeout=2.0)
+    fast.users.me()
+    client.users.me()
+    fast.close()
+
+    assert seen == [2.0, 30.0]
+    assert fast._http is client._http and not client._http.is_closed
+
+
+def test_async_deadline_scope_fails_fast():
+    async def main():
+        client = AsyncSwiklyClient(token="t", transport=httpx.MockTransport(lambda r: httpx.Response(200, json=_user())))
+        with deadline_scope(-1):
+            with pytest.raises(SwiklyDeadlineExceededError):
+                await client.users.ame()
+        await client.aclose()
+
+    asyncio.run(main())
@@ -0,0 +1,51 @@
+import json
+
+import httpx
+import pytest
+
+from swikly import SwiklyClient
+from swikly.models import FinishedReclaim, ReclaimsListResponse, RequestsListResponse
+from swikly.decoding import decode_response
+
+REQUESTS = {
+    "requests": [
+        {
+            "id": "r1",
+            "accountId": "a",
+            "link": "l",
+            "description": "d",
+            "createdAt": "2026-01-01",
+            "deposit": {
+                "id": "d1", "requestId": "r1", "amount": 1, "amountToBeSecured": 1, "securedAmount": 1,
+                "status": "Secured", "startDate": "s", "endDate": "e", "createdAt": "c",
+                "refundSummary": {"refundableAmount": 0, "pendingRefundAmount": 0, "refundedAmount": 0},
+            },
+            "unknownField": 1,
+        }
+    ],
+    "meta": {"currentPage": 1, "lastPage": 1, "perPage": 1, "path": "/", "total": 1},
+}
+
+
+@pytest.mark.parametrize("mode", ["json", "construct"])
+def test_fast_modes_match_validated_models(mode):
+    resp = httpx.Response(200, content=json.dumps(REQUESTS).encode())
+    expected = RequestsListResponse.model_validate(REQUESTS)
+
+    decoded = decode_response(resp, RequestsListResponse, mode)
+
+    assert decoded == expected
+    assert decoded.requests[0].deposit.refundSummary.refundedAmount == 0
+    assert decoded.requests[0].model_extra == {"unknownField": 1}
+
+
+def test_construct_picks_tagged_union_member():
+    body = {"reclaims": [{"id": "x", "amount": 1, "cashedInAmount": 0, "reason": "r", "filesValidated": True,
+                          "createdAt": "c", "status": "Finished", "finishedAt": "f"}]}
+    resp = httpx.Response(200, content=json.dumps(body).encode())
+    assert isinstance(decode_response(resp, ReclaimsListResponse, "construct").reclaims[0], FinishedReclaim)
+
+
+def test_raw_mode_returns_plain_dicts():
+    client = SwiklyClient(token="t", decode="raw", transport=httpx.MockTransport(lambda r: httpx.Response(200, json=REQUESTS)))
+    assert [r["id"] for r in client.requests.iter_all(account_id="a")] == ["r1"]
@@ -0,0 +1,88 @@
+import asyncio
+
+import httpx
+
+from swikly import AsyncSwiklyClient, CustomIdIndex, SwiklyClient
+
+
+def _request(rid, custom_id, created_at="2026-01-01"):
+    return {"id": rid, "accountId": "a", "link": "l", "description": "d", "createdAt": created_at, "customId": custom_id}
+
+
+class _Api:
+    def __init__(self):
+        self.calls = []
+        self.known = {"r1": _request("r1", "booking-1"), "r2": _request("r2", "booking-10")}
+
+    def handler(self, request):
+        self.calls.append((request.method, request.url.path, request.url.params.get("search")))
+        path = request.url.path.split("/")
+        if request.method == "POST":
+            return httpx.Response(201, json={"request": _request("r3", "booking-3")})
+        if path[-1] == "requests":
+            search = request.url.params.get("search", "")
+            found = [r for r in self.known.values() if search in r["customId"]]
+            meta = {"currentPage": 1, "lastPage": 1, "perPage": 20, "path": "/", "total": len(found)}
+            return httpx.Response(200, json={"requests": found, "meta": meta})
+        if path[-1] in self.known:
+            return httpx.Response(200, json={"request": self.known[path[-1]]})
+        return httpx.Response(404, json={"message": "Not found"})
+
+
+def test_get_by_custom_id_scans_once_then_uses_the_index():
+    api = _Api()
+    client = SwiklyClient(token="t", transport=httpx.MockTransport(api.handler))
+
+    # "booking-1" also matches "booking-10"; only the exact customId counts.
+    assert client.requests.get_by_custom_id(account_id="a", custom_id="booking-1").request.id == "r1"
+    assert api.calls == [("GET", "/v1/accounts/a/requests", "booking-1")]
+
+    api.calls.clear()
+    assert client.requests.get_by_custom_id(account_id="a", custom_id="booking-10").request.id == "r2"
+    assert api.calls == [("GET", "/v1/accounts/a/requests/r2", None)]
+
+    client.requests.create(account_id="a", description="d", language="fr", custom_id="booking-3")
+    assert client.custom_id_index.get("a", "booking-3") == "r3"
+
+    assert client.requests.get_by_custom_id(account_id="a", custom_id="unknown") is None
+
+
+def test_stale_entries_fall_back_to_the_scan():
+    api = _Api()
+    client = SwiklyClient(token="t", transport=httpx.MockTransport(api.handler))
+    client.custom_id_index.put("a", "booking-1", "gone")
+
+    assert client.requests.get_by_custom_id(account_id="a", custom_id="booking-1").request.id == "r1"
+    assert client.custom_id_index.get("a", "booking-1") == "r1"
+
+
+def test_index_is_bounded_and_async_lookups_share_it():
+    index = CustomIdIndex(max_size=2)
+    index.put("a", "x", "1")
+    index.put("a", "y", "2")
+    index.get("a", "x")
+    index.put("a", "z", "3")  # "y" is the least recently used
+    assert (index.get("a", "y"), len(index), index.stats.evictions) == (None, 2, 1)
+
+    api = _Api()
+
+    async def run():
+        client = AsyncSwiklyClient(token="t", transport=httpx.MockTransport(api.handler), custom_id_index=index, decode="raw")
+        first = await client.requests.aget_by_custom_id(account_id="a", custom_id="booking-10")
+        second = await client.requests.aget_by_custom_id(account_id="a", custom_id="booking-10")
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first["request"]["id"] == second["request"]["id"] == "r2"
+    assert [c[1] for c in api.calls] == ["/v1/accounts/a/requests", "/v1/accounts/a/requests/r2"]
+
+
+def test_duplicate_custom_ids_resolve_to_the_newest_request():
+    index = CustomIdIndex()
+    # A newest-first page, then an older page that repeats the customId.
+    index.put_many("a", [_request("r3", "dup", "2026-03-01 10:00:00"), _request("r1", "dup", "2026-01-01 10:00:00")])
+    index.put_many("a", [_request("r0", "dup", "2025-12-01 10:00:00")])
+    assert index.get("a", "dup") == "r3"
+
+    index.put_many("a", [_request("r4", "dup", "2026-04-01 10:00:00")])
+    assert index.get("a", "dup") == "r4"
@@ -0,0 +1,87 @@
+import http.server
+import threading
+
+import httpx
+import pytest
+
+import swikly.client as client_mod
+from swikly import ClientHooks, SwiklyClient
+
+
+class Recorder(ClientHooks):
+    def __init__(self):
+        self.events = []
+
+    def before_send(self, info):
+        self.events.append(("send", info.attempt))
+
+    def after_response(self, info):
+        self.events.append(("response", info.status_code, info.request_id, info.response_bytes))
+        self.last = info
+
+    def on_retry(self, info, delay):
+        self.events.append(("retry", info.attempt, delay))
+
+    def on_decode(self, info):
+        self.events.append(("decode", info.model, info.mode))
+
+
+class Broken(ClientHooks):
+    def before_send(self, info):
+        raise RuntimeError("hook bug")
+
+
+USER = b'{"user":{"id":"u","email":"e","firstName":"f","lastName":"l","createdAt":"2026-01-01 10:00:00"}}'
+
+
+def test_hooks_see_attempts_retries_and_decoding(monkeypatch):
+    monkeypatch.setattr(client_mod, "_sleep", lambda s: None)
+    statuses = iter([503, 200])
+
+    def handler(request):
+        return httpx.Response(next(statuses), headers={"X-Request-Id": "req-1"}, content=USER)
+
+    recorder = Recorder()
+    client = SwiklyClient(token="t", hooks=[Broken(), recorder], transport=httpx.MockTransport(handler))
+    client.users.me()
+
+    assert [e[0] for e in recorder.events] == ["send", "response", "retry", "send", "response", "decode"]
+    assert recorder.events[1] == ("response", 503, "req-1", len(USER))
+    assert recorder.events[-1] == ("decode", "MeResponse", "validate")
+    assert recorder.last.endpoint == "/me" and recorder.last.timings["total"] > 0
+
+
+def test_phase_timings_come_from_the_transport_trace():
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(USER)))
+            self.end_headers()
+            self.wfile.write(USER)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        recorder = Recorder()
+        client = SwiklyClient(token="t", base_url=f"http://127.0.0.1:{server.server_port}/v1", hooks=[recorder])
+        client.users.me()
+        client.close()
+    finally:
+        server.shutdown()
+
+    assert {"connect", "send", "server", "download", "total"} <= set(recorder.last.timings)
+
+
+def test_adapters_stay_dormant_until_created():
+    import swikly.instrumentation as instrumentation
+
+    assert "prometheus_client" not in instrumentation.__dict__
+    prometheus_client = pytest.importorskip("prometheus_client")
+    registry = prometheus_client.CollectorRegistry()
+    hooks = instrumentation.PrometheusHooks(registry=registry)
+    client = SwiklyClient(token="t", hooks=[hooks], transport=httpx.MockTransport(lambda r: httpx.Response(200, content=USER)))
+    client.users.me()
+    assert registry.get_sample_value("swikly_request_duration_seconds_count", {"method": "GET", "endpoint": "/me", "status": "200"}) == 1
@@ -0,0 +1,93 @@
+import asyncio
+
+import httpx
+
+from swikly import AsyncSwiklyClient, RequestMirror, SwiklyClient, WebhookEvent
+
+
+def _request(i, status="Pending"):
+    rid = f"r{i}"
+    return {
+        "id": rid,
+        "accountId": "a",
+        "link": "l",
+        "description": "d",
+        "createdAt": f"2026-01-01T00:{i:02d}:00+00:00",
+        "customId": f"booking-{i}",
+        "deposit": {
+            "id": f"d{i}", "requestId": rid, "amount": 100, "amountToBeSecured": 100, "securedAmount": 0,
+            "status": status, "startDate": "2026-02-01", "endDate": "2026-02-02", "createdAt": "2026-01-01",
+        },
+    }
+
+
+class _Api:
+    """Lists ``count`` requests newest first, ``per_page`` per page."""
+
+    def __init__(self, count, per_page=2):
+        self.count = count
+        self.per_page = per_page
+        self.pages = []
+
+    def handler(self, request):
+        page = int(request.url.params.get("page", 1))
+        self.pages.append(page)
+        newest_first = [_request(i) for i in range(self.count, 0, -1)]
+        start = (page - 1) * self.per_page
+        last_page = max(1, -(-self.count // self.per_page))
+        meta = {"currentPage": page, "lastPage": last_page, "perPage": self.per_page, "path": "/", "total": self.count}
+        return httpx.Response(200, json={"requests": newest_first[start:start + self.per_page], "meta": meta})
+
+
+def test_refresh_stops_at_the_last_seen_request():
+    api = _Api(count=5)
+    mirror = RequestMirror(SwiklyClient(token="t", transport=httpx.MockTransport(api.handler)))
+
+    assert mirror.refresh("a", per_page=2) == 5
+    assert api.pages == [1, 2, 3]
+
+    api.count, api.pages = 7, []
+    assert mirror.refresh("a", per_page=2) == 2
+    assert api.pages == [1, 2]  # r7, r6 on page 1; page 2 starts with the known r5
+    assert mirror.get_request("r7").deposit.id == "d7"
+    assert mirror.get_request_by_custom_id("a", "booking-3").id == "r3"
+    assert mirror.get_request("missing") is None
+
+
+def test_webhook_events_update_requests_and_products():
+    api = _Api(count=2)
+    mirror = RequestMirror(SwiklyClient(token="t", transport=httpx.MockTransport(api.handler)))
+    mirror.refresh("a")
+
+    secured = _request(1, status="Secured")["deposit"]
+    mirror.apply_event(WebhookEvent.model_validate({"event": "depositSecured", "deposit": secured}))
+
+    assert mirror.get_deposit("d1").status == "Secured"
+    assert mirror.get_request("r1").deposit.status == "Secured"
+    assert [r.id for r in mirror.requests_by_status("Secured")] == ["r1"]
+    assert [r.id for r in mirror.requests_by_status("Pending", product="deposit", account_id="a")] == ["r2"]
+    assert mirror.requests_by_status("Secured", product="payment") == []
+
+    mirror.apply_event({"event": "requestCreated", "request": _request(9)})
+    assert mirror.get_request_by_custom_id("a", "booking-9").id == "r9"
+
+    payment = {"id": "p8", "requestId": "r8", "amount": 100, "amountToBePaid": 100, "amountPaid": 0,
+               "status": "Pending", "createdAt": "c"}
+    mirror.apply_event({"event": "paymentCreated", "payment": payment}, account_id="a")  # r8 not mirrored yet
+    assert [row.id for row in mirror.store.find("payment", account_id="a")] == ["p8"]
+
+
+def test_arefresh_and_raw_reads():
+    api = _Api(count=3)
+
+    async def run():
+        client = AsyncSwiklyClient(token="t", transport=httpx.MockTransport(api.handler), decode="raw")
+        mirror = RequestMirror(client, decode="raw")
+        first = await mirror.arefresh("a", per_page=2)
+        api.count = 4
+        second = await mirror.arefresh("a", per_page=2)
+        return first, second, mirror.get_request("r4")
+
+    first, second, r4 = asyncio.run(run())
+    assert (first, second) == (3, 1)
+    assert r4["customId"] == "booking-4"
@@ -0,0 +1,70 @@
+import asyncio
+
+import httpx
+
+from swikly import AsyncSwiklyClient, SwiklyClient
+from swikly.pagination import aiter_pages
+
+
+def _page_handler(last_page, per_page=2, seen=None):
+    def handler(request):
+        page = int(request.url.params.get("page", 1))
+        if seen is not None:
+            seen.append(page)
+        requests = [
+            {"id": f"r{page}-{i}", "accountId": "a", "link": "l", "description": "d", "createdAt": "2026-01-01"}
+            for i in range(per_page)
+        ]
+        meta = {"currentPage": page, "lastPage": last_page, "perPage": per_page, "path": "/", "total": last_page * per_page}
+        return httpx.Response(200, json={"requests": requests, "meta": meta})
+
+    return handler
+
+
+def test_iter_all_walks_every_page_lazily():
+    seen = []
+    client = SwiklyClient(token="t")
+    client._http = httpx.Client(base_url=client.base_url, transport=httpx.MockTransport(_page_handler(3, seen=seen)))
+
+    it = client.requests.iter_all(account_id="a")
+    assert seen == []
+    assert next(it).id == "r1-0"
+    assert seen == [1]
+    assert [r.id for r in it] == ["r1-1", "r2-0", "r2-1", "r3-0", "r3-1"]
+    assert seen == [1, 2, 3]
+
+
+def test_aiter_all_with_prefetch_preserves_order():
+    seen = []
+
+    async def main():
+        client = AsyncSwiklyClient(token="t")
+        client._http = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(_page_handler(5, seen=seen)))
+        ids = [r.id async for r in client.requests.aiter_all(account_id="a", prefetch=2)]
+        await client.aclose()
+        return ids
+
+    ids = asyncio.run(main())
+    assert ids == [f"r{p}-{i}" for p in range(1, 6) for i in range(2)]
+    assert sorted(seen) == [1, 2, 3, 4, 5]
+
+
+def test_aiter_pages_waits_for_cancelled_prefetches_when_stopped_early():
+    unwound = []
+
+    async def fetch_page(page):
+        try:
+            if page > 1:
+                await asyncio.sleep(10)
+            return {"requests": [page], "meta": {"lastPage": 5}}
+        finally:
+            unwound.append(page)
+
+    async def main():
+        pages = aiter_pages(fetch_page, "requests", prefetch=3)
+        assert await pages.__anext__() == 1
+        await asyncio.sleep(0)  # the prefetches are now in flight
+        await pages.aclose()
+        return list(unwound)
+
+    assert sorted(asyncio.run(main())) == [1, 2, 3, 4]
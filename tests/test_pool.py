@@ -0,0 +1,82 @@
+import asyncio
+
+import httpx
+import pytest
+
+from swikly import AsyncSwiklyClientPool, SwiklyClientPool, TokenBucketRateLimiter
+
+
+def _transport(seen):
+    def handler(request):
+        seen.append(request.headers.get("Authorization") or request.headers.get("API_KEY"))
+        return httpx.Response(200, json={"user": {}})
+
+    return handler
+
+
+def test_pool_reuses_clients_and_shares_one_connection_pool():
+    seen = []
+    pool = SwiklyClientPool(
+        transport=httpx.MockTransport(_transport(seen)),
+        rate_limiter_factory=lambda: TokenBucketRateLimiter(rate=100),
+    )
+    first = pool.get("one")
+    legacy = pool.get(legacy_api_key="k", legacy_api_secret="s")
+
+    assert pool.get("one") is first
+    assert first._http is legacy._http
+    assert first.rate_limiter is not legacy.rate_limiter
+
+    first.request("GET", "/me")
+    legacy.request("GET", "/me")
+    assert seen == ["Bearer one", "k"]
+    assert len(pool) == 2
+
+    http = first._http
+    pool.close()
+    assert len(pool) == 0 and http.is_closed
+
+
+def test_pool_evicts_least_recently_used_and_idle_clients():
+    pool = SwiklyClientPool(max_clients=2, idle_timeout=None, transport=httpx.MockTransport(_transport([])))
+    a = pool.get("a")
+    pool.get("b")
+    pool.get("a")
+    pool.get("c")  # "b" is the least recently used
+    assert pool.get("a") is a
+    assert len(pool) == 2
+    assert pool.evict("c") and not pool.evict("b")
+
+    idle = SwiklyClientPool(idle_timeout=0, transport=httpx.MockTransport(_transport([])))
+    idle.get("a")
+    idle.get("b")
+    assert len(idle) == 1
+    # Evicted clients never close the shared pool.
+    assert idle.get("b").request("GET", "/me").status_code == 200
+
+
+def test_pool_rejects_per_client_transport_options():
+    with pytest.raises(TypeError):
+        SwiklyClientPool(token="t")
+    with pytest.raises(ValueError):
+        SwiklyClientPool().get()
+
+
+def test_async_pool():
+    seen = []
+
+    async def run():
+        async def handler(request):
+            seen.append(request.headers["Authorization"])
+            return httpx.Response(200, json={"user": {}})
+
+        pool = AsyncSwiklyClientPool(max_clients=1, transport=httpx.MockTransport(handler))
+        await pool.get("one").request("GET", "/me")
+        await pool.get("two").request("GET", "/me")
+        assert len(pool) == 1
+        http = pool.get("two")._http
+        await pool.aclose()
+        return http.is_closed
+
+    assert asyncio.run(run())
+    assert seen == ["Bearer one", "Bearer two"]
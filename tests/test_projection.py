@@ -0,0 +1,32 @@
+import httpx
+
+from swikly import SwiklyClient
+
+PAGE = {
+    "requests": [
+        {"id": "r1", "customId": "b-1", "link": "l", "deposit": {"id": "d1", "status": "Secured", "amount": 1}},
+        {"id": "r2", "customId": None, "link": "l"},
+    ],
+    "meta": {"currentPage": 1, "lastPage": 1, "perPage": 2, "path": "/", "total": 2},
+}
+
+
+def test_list_projects_only_requested_fields():
+    client = SwiklyClient(token="t", transport=httpx.MockTransport(lambda r: httpx.Response(200, json=PAGE)))
+
+    page = client.requests.list(account_id="a", fields=["id", "customId", "deposit.status"])
+
+    first, second = page.requests
+    assert first._fields == ("id", "customId", "deposit")
+    assert (first.id, first.customId, first.deposit.status) == ("r1", "b-1", "Secured")
+    assert second.deposit is None
+    assert page.meta.total == 2
+
+
+def test_get_with_alias_wrapper():
+    body = {"no-show": {"id": "n1", "status": "Secured", "amount": 5}}
+    client = SwiklyClient(token="t", transport=httpx.MockTransport(lambda r: httpx.Response(200, json=body)))
+
+    resp = client.no_shows.get(account_id="a", no_show_id="n1", fields="id,status")
+
+    assert tuple(resp.no_show) == ("n1", "Secured")
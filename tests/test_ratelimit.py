@@ -0,0 +1,49 @@
+import httpx
+import pytest
+
+from swikly import TokenBucketRateLimiter
+import swikly.ratelimit as ratelimit_mod
+
+
+def approx(value):
+    return pytest.approx(value, abs=1e-9)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+
+def test_bucket_allows_burst_then_queues(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(ratelimit_mod, "time", clock)
+    limiter = TokenBucketRateLimiter(rate=10, burst=3)
+
+    waits = [limiter.reserve() for _ in range(5)]
+
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert waits[3] == approx(0.1)
+    assert waits[4] == approx(0.2)
+
+
+def test_retry_after_blocks_and_slows_down(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(ratelimit_mod, "time", clock)
+    limiter = TokenBucketRateLimiter(rate=10, burst=5)
+
+    limiter.observe(429, httpx.Headers({"Retry-After": "2"}))
+
+    assert limiter.rate == 5
+    first, second = limiter.reserve(), limiter.reserve()
+    assert first == approx(2.0)
+    assert second == approx(2.2)
+
+    limiter.observe(200, httpx.Headers({"X-RateLimit-Limit": "60"}))
+    assert limiter.max_rate == 1.0
+    assert limiter.rate == 1.0
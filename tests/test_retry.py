@@ -0,0 +1,157 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+import swikly.client as client_mod
+from swikly import AsyncSwiklyClient, RetryBudget, RetryPolicy, SwiklyAPIError, SwiklyClient
+
+
+def _responder(statuses):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        status, headers = statuses[min(len(calls), len(statuses)) - 1]
+        return httpx.Response(status, headers=headers, json={"user": {}} if status == 200 else {"message": "x"})
+
+    return handler, calls
+
+
+def test_sync_backoff_grows_exponentially(monkeypatch):
+    slept = []
+    monkeypatch.setattr(client_mod, "_sleep", slept.append)
+    handler, calls = _responder([(503, {}), (502, {}), (200, {})])
+    client = SwiklyClient(token="t", retry_policy=RetryPolicy(max_retries=2, backoff_base=0.1, jitter=False))
+    client._http = httpx.Client(base_url=client.base_url, transport=httpx.MockTransport(handler))
+
+    resp = client.request("GET", "/me")
+
+    assert resp.status_code == 200
+    assert len(calls) == 3
+    assert slept == [0.1, 0.2]
+
+
+def test_retry_budget_stops_retries(monkeypatch):
+    monkeypatch.setattr(client_mod, "_sleep", lambda s: None)
+    handler, calls = _responder([(500, {})])
+    policy = RetryPolicy(max_retries=5, budget=RetryBudget(ratio=0.0, capacity=1))
+    client = SwiklyClient(token="t", retry_policy=policy)
+    client._http = httpx.Client(base_url=client.base_url, transport=httpx.MockTransport(handler))
+
+    with pytest.raises(SwiklyAPIError):
+        client.request("GET", "/me")
+    assert len(calls) == 2
+
+
+def test_async_retry_after_does_not_block_loop(monkeypatch):
+    def blocking_sleep(seconds):
+        raise AssertionError("time.sleep called from the async client")
+
+    monkeypatch.setattr(client_mod, "_sleep", blocking_sleep)
+    throttled = {"done": False}
+
+    def handler(request):
+        if request.url.path.endswith("/slow") and not throttled["done"]:
+            throttled["done"] = True
+            return httpx.Response(429, headers={"Retry-After": "1"}, json={"message": "Too Many Attempts."})
+        return httpx.Response(200, json={})
+
+    async def main():
+        client = AsyncSwiklyClient(token="t")
+        client._http = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(handler))
+        slow = asyncio.create_task(client.request("GET", "/slow"))
+        await asyncio.sleep(0)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await asyncio.gather(*(client.request("GET", "/fast") for _ in range(20)))
+        fast_elapsed = loop.time() - start
+        assert (await slow).status_code == 200
+        await client.aclose()
+        return fast_elapsed
+
+    assert asyncio.run(main()) < 0.5
+
+
+def test_post_reuses_one_idempotency_key_across_attempts(monkeypatch):
+    monkeypatch.setattr(client_mod, "_sleep", lambda s: None)
+    handler, calls = _responder([(503, {}), (200, {})])
+    client = SwiklyClient(token="t", idempotency="header", transport=httpx.MockTransport(handler))
+
+    client.request("POST", "/accounts/a/payments/p/refunds", json={"amount": 1})
+
+    keys = [c.headers["Idempotency-Key"] for c in calls]
+    assert len(keys) == 2 and keys[0] == keys[1]
+
+
+def test_reclaim_creates_send_and_retry_with_the_given_key(monkeypatch):
+    monkeypatch.setattr(client_mod, "_sleep", lambda s: None)
+
+    async def no_sleep(seconds):
+        return None
+
+    monkeypatch.setattr(client_mod, "_asleep", no_sleep)
+    handler, calls = _responder([(503, {})])
+    client = SwiklyClient(token="t", transport=httpx.MockTransport(handler))
+    with pytest.raises(SwiklyAPIError):
+        client.reclaims.create_from_deposit(account_id="a", deposit_id="d", amount=1, reason="r", idempotency_key="k1")
+
+    async def acreate():
+        aclient = AsyncSwiklyClient(token="t", transport=httpx.MockTransport(handler))
+        try:
+            await aclient.reclaims.acreate_from_no_show(account_id="a", no_show_id="n", amount=1, reason="r", idempotency_key="k2")
+        finally:
+            await aclient.aclose()
+
+    with pytest.raises(SwiklyAPIError):
+        asyncio.run(acreate())
+    assert [c.headers["Idempotency-Key"] for c in calls] == ["k1"] * 3 + ["k2"] * 3
+
+
+def test_unkeyed_post_is_not_retried_but_custom_id_create_is(monkeypatch):
+    monkeypatch.setattr(client_mod, "_sleep", lambda s: None)
+    handler, calls = _responder([(503, {})])
+    client = SwiklyClient(token="t", idempotency="off", transport=httpx.MockTransport(handler))
+    with pytest.raises(SwiklyAPIError):
+        client.refunds.refund_payment(account_id="a", payment_id="p", amount=1, reason="r")
+    assert len(calls) == 1 and "Idempotency-Key" not in calls[0].headers
+
+    handler, calls = _responder([(503, {})])
+    client = SwiklyClient(token="t", idempotency="custom_id", transport=httpx.MockTransport(handler))
+    with pytest.raises(SwiklyAPIError):
+        client.requests.create(account_id="a", description="d", language="fr")
+    bodies = [c.read() for c in calls]
+    assert len(calls) == 3 and len(set(bodies)) == 1
+    assert b'"customIdMustBeUnique":true' in bodies[0]
+
+
+def test_unkeyed_post_is_not_retried_by_default(monkeypatch):
+    monkeypatch.setattr(client_mod, "_sleep", lambda s: None)
+    handler, calls = _responder([(503, {})])
+    client = SwiklyClient(token="t", transport=httpx.MockTransport(handler))
+    with pytest.raises(SwiklyAPIError):
+        client.request("POST", "/accounts/a/payments/p/refunds", json={"amount": 1})
+    assert len(calls) == 1 and "Idempotency-Key" not in calls[0].headers
+
+
+def test_custom_id_create_returns_the_request_an_earlier_attempt_made(monkeypatch):
+    monkeypatch.setattr(client_mod, "_sleep", lambda s: None)
+    created = {}
+
+    def handler(request):
+        if request.method == "POST":
+            body = json.loads(request.content)
+            if created:
+                return httpx.Response(422, json={"code": "ERR_PARAMS", "message": "invalid",
+                                                 "errors": {"customId": ["The custom id has already been taken."]}})
+            created.update(body, id="r1", accountId="a", link="l", createdAt="2026-01-01")
+            return httpx.Response(502, json={})  # the request was made, but the reply was lost
+        if request.url.path.endswith("/requests"):
+            meta = {"currentPage": 1, "lastPage": 1, "perPage": 20, "path": "/", "total": 1}
+            return httpx.Response(200, json={"requests": [created], "meta": meta})
+        return httpx.Response(200, json={"request": created})
+
+    client = SwiklyClient(token="t", idempotency="custom_id", transport=httpx.MockTransport(handler))
+    resp = client.requests.create(account_id="a", description="d", language="fr")
+    assert resp.request.id == "r1" and resp.request.customId == created["customId"]
@@ -0,0 +1,124 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from swikly import AsyncSwiklyClient, RequestCoalescer, SwiklyClient, SwiklyDeadlineExceededError, deadline_scope
+from swikly.deadline import _call_scope
+
+REQUEST = {"request": {"id": "r1", "accountId": "a", "link": "l", "description": "d", "createdAt": "c"}}
+
+
+def test_async_identical_gets_share_one_call():
+    calls = []
+
+    async def handler(request):
+        calls.append(request.url.path)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=REQUEST)
+
+    async def main():
+        coalescer = RequestCoalescer(paths=["/accounts/{account_id}/requests/{request_id}"])
+        client = AsyncSwiklyClient(token="t", coalesce=coalescer, transport=httpx.MockTransport(handler))
+        results = await asyncio.gather(*(client.requests.aget(account_id="a", request_id="r1") for _ in range(20)))
+        await client.requests.aget(account_id="a", request_id="r2")
+        await client.aclose()
+        return results, coalescer.stats
+
+    results, stats = asyncio.run(main())
+    assert {r.request.id for r in results} == {"r1"}
+    assert calls == ["/v1/accounts/a/requests/r1", "/v1/accounts/a/requests/r2"]
+    assert (stats.leaders, stats.followers) == (2, 19)
+
+
+def test_threads_share_one_call_and_its_error():
+    calls = []
+    release = threading.Event()
+
+    def handler(request):
+        calls.append(request.url.path)
+        release.wait(1)
+        return httpx.Response(404, json={"message": "not found"})
+
+    client = SwiklyClient(token="t", coalesce=RequestCoalescer(), transport=httpx.MockTransport(handler))
+
+    def fetch():
+        try:
+            client.users.me()
+        except Exception as e:
+            return type(e).__name__
+
+    with ThreadPoolExecutor(8) as pool:
+        futures = [pool.submit(fetch) for _ in range(8)]
+        time.sleep(0.1)
+        release.set()
+        errors = [f.result() for f in futures]
+
+    assert errors == ["SwiklyNotFoundError"] * 8
+    assert len(calls) == 1
+
+
+def test_follower_gives_up_at_its_own_deadline():
+    release = threading.Event()
+
+    def handler(request):
+        release.wait(1)
+        return httpx.Response(200, json=REQUEST)
+
+    client = SwiklyClient(token="t", coalesce=RequestCoalescer(), transport=httpx.MockTransport(handler))
+    with ThreadPoolExecutor(1) as pool:
+        leader = pool.submit(client.requests.get, account_id="a", request_id="r1")
+        time.sleep(0.05)
+        started = time.monotonic()
+        with deadline_scope(0.05), pytest.raises(SwiklyDeadlineExceededError):
+            client.requests.get(account_id="a", request_id="r1")
+        waited = time.monotonic() - started
+        release.set()
+        assert leader.result().request.id == "r1"
+    assert waited < 0.5
+
+
+def test_async_deadlines_stay_with_their_own_caller():
+    calls = []
+
+    async def handler(request):
+        calls.append(request.url.path)
+        await asyncio.sleep(0.2)
+        return httpx.Response(200, json=REQUEST)
+
+    async def with_deadline(coro_fn, seconds):
+        with deadline_scope(seconds):
+            return await coro_fn()
+
+    async def main():
+        client = AsyncSwiklyClient(token="t", coalesce=RequestCoalescer(), transport=httpx.MockTransport(handler))
+        fetch = lambda: client.requests.aget(account_id="a", request_id="r1")  # noqa: E731
+        # A leader with a short deadline must not fail a follower that has none...
+        short_leader = asyncio.ensure_future(with_deadline(fetch, 0.05))
+        await asyncio.sleep(0)
+        follower = await fetch()
+        with pytest.raises(SwiklyDeadlineExceededError):
+            await short_leader
+        # ...and a follower with a short deadline does not wait for the leader.
+        leader = asyncio.ensure_future(fetch())
+        await asyncio.sleep(0)
+        with pytest.raises(SwiklyDeadlineExceededError):
+            await with_deadline(fetch, 0.05)
+        result = await leader
+        await client.aclose()
+        return follower, result
+
+    follower, result = asyncio.run(main())
+    assert follower.request.id == result.request.id == "r1"
+    assert len(calls) == 2
+
+
+def test_calls_with_different_timeouts_are_not_shared():
+    key = lambda: RequestCoalescer.key("ns", "GET", "/users/me", None)  # noqa: E731
+    plain = key()
+    with _call_scope(1.0, None):
+        assert key() != plain
+    assert key() == plain
@@ -0,0 +1,172 @@
+import asyncio
+import io
+import json
+import email.parser
+import email.policy
+
+import httpx
+import pytest
+
+import swikly.batch as batch_mod
+import swikly.client as client_mod
+from swikly import AsyncSwiklyClient, SwiklyAPIError, SwiklyClient, SwiklyUploadNotReplayableError
+from swikly.uploads import MultipartUpload
+
+
+def _parts(request):
+    # Parse the multipart body the way a server would.
+    raw = b"Content-Type: " + request.headers["Content-Type"].encode() + b"\r\n\r\n" + request.content
+    message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(raw)
+    return [(p.get_filename(), p.get_content_type(), p.get_payload(decode=True)) for p in message.iter_parts()]
+
+
+def _file(fid):
+    return {"id": fid, "name": f"{fid}.jpg", "url": f"https://files/{fid}", "createdAt": "2026-01-01 10:00:00"}
+
+
+def _recorder(status=200):
+    seen = []
+
+    def handler(request):
+        body = request.read()
+        assert int(request.headers.get("Content-Length", len(body))) == len(body)
+        seen.append((request.url.path, _parts(request)))
+        return httpx.Response(status, json={"file": _file(str(len(seen)))})
+
+    return seen, handler
+
+
+def test_uploads_stream_paths_buffers_and_file_objects(tmp_path):
+    photo = tmp_path / "damage.jpg"
+    photo.write_bytes(b"\xff\xd8" + b"x" * 600_000)
+    seen, handler = _recorder()
+    client = SwiklyClient(token="t", transport=httpx.MockTransport(handler))
+
+    uploaded = client.files.upload_temporary_file(account_id="a", file_path=str(photo))
+    client.files.attach_file_to_reclaim(account_id="a", reclaim_id="r", file=memoryview(b"pdf-bytes"), filename="invoice.pdf")
+    client.files.upload_temporary_file(account_id="a", file=io.BytesIO(b"notes"), filename="notes.txt")
+
+    assert uploaded.file.id == "1"
+    assert seen[0] == ("/v1/accounts/a/files", [("damage.jpg", "image/jpeg", photo.read_bytes())])
+    assert seen[1] == ("/v1/accounts/a/reclaims/r/files", [("invoice.pdf", "application/pdf", b"pdf-bytes")])
+    assert seen[2][1] == [("notes.txt", "text/plain", b"notes")]
+
+
+def test_non_replayable_upload_is_not_retried(monkeypatch):
+    monkeypatch.setattr(client_mod, "_sleep", lambda s: None)
+    seen, handler = _recorder(status=503)
+    client = SwiklyClient(token="t", idempotency="header", transport=httpx.MockTransport(handler))
+
+    class Pipe(io.RawIOBase):
+        def __init__(self):
+            self._data = io.BytesIO(b"streamed")
+
+        def readable(self):
+            return True
+
+        def readinto(self, b):
+            return self._data.readinto(b)
+
+    with pytest.raises(SwiklyAPIError):
+        client.files.upload_temporary_file(account_id="a", file=Pipe(), filename="p.bin")
+    assert len(seen) == 1
+    assert not MultipartUpload(Pipe()).replayable
+
+    with pytest.raises(SwiklyAPIError):
+        client.files.upload_temporary_file(account_id="a", file=b"again")
+    assert len(seen) == 1 + 3  # replayable bodies keep the retry policy
+
+
+def test_async_upload_many_from_async_iterators_and_paths(tmp_path):
+    photo = tmp_path / "scratch.png"
+    photo.write_bytes(b"png" * 1000)
+
+    async def chunks():
+        for part in (b"ab", b"cd"):
+            yield part
+
+    async def main():
+        seen, handler = _recorder()
+        client = AsyncSwiklyClient(token="t", transport=httpx.MockTransport(handler))
+        results = await client.files.aupload_many(
+            [("live.bin", chunks()), str(photo)], account_id="a", reclaim_id="r", concurrency=2
+        )
+        await client.aclose()
+        return seen, results
+
+    seen, results = asyncio.run(main())
+    assert all(r.ok for r in results)
+    assert sorted(parts[0] for _, parts in seen) == [
+        ("live.bin", "application/octet-stream", b"abcd"),
+        ("scratch.png", "image/png", b"png" * 1000),
+    ]
+
+
+def _throttle_once(seen):
+    # The second upload to arrive is rate limited once.
+    def handler(request):
+        body = request.read()
+        seen.append(_parts(request)[0])
+        if len(seen) == 2:
+            return httpx.Response(429, headers={"Retry-After": "1"}, json={"message": "slow down"})
+        return httpx.Response(200, json={"file": _file(str(len(seen)))})
+
+    return handler
+
+
+def test_upload_many_resends_whole_files_after_a_429(monkeypatch):
+    monkeypatch.setattr(batch_mod, "_sleep", lambda s: None)
+    seen = []
+    client = SwiklyClient(token="t", transport=httpx.MockTransport(_throttle_once(seen)))
+    sources = [io.BytesIO(b"a" * 1000), io.BytesIO(b"b" * 1000), io.BytesIO(b"c" * 1000)]
+
+    results = client.files.upload_many([(f"{i}.bin", s) for i, s in enumerate(sources)], account_id="a", concurrency=1)
+
+    assert all(r.ok for r in results)
+    assert len(seen) == 4
+    assert seen[1] == seen[2] == ("1.bin", "application/octet-stream", b"b" * 1000)
+
+
+def test_upload_many_fails_items_whose_source_cannot_be_replayed(monkeypatch):
+    async def no_sleep(seconds):
+        return None
+
+    monkeypatch.setattr(batch_mod, "_asleep", no_sleep)
+
+    async def chunks():
+        yield b"live"
+
+    async def main():
+        seen = []
+        client = AsyncSwiklyClient(token="t", transport=httpx.MockTransport(_throttle_once(seen)))
+        results = await client.files.aupload_many(
+            [io.BytesIO(b"first"), ("live.bin", chunks()), io.BytesIO(b"third")], account_id="a", concurrency=1
+        )
+        await client.aclose()
+        return seen, results
+
+    seen, results = asyncio.run(main())
+    assert [r.ok for r in results] == [True, False, True]
+    assert isinstance(results[1].error, SwiklyUploadNotReplayableError)
+    assert [part[2] for part in seen] == [b"first", b"live", b"third"]
+
+
+def test_create_reclaim_with_files_uploads_then_creates_once():
+    created = []
+
+    def handler(request):
+        if request.url.path.endswith("/files"):
+            name = _parts(request)[0][0]
+            return httpx.Response(200, json={"file": _file(name.split(".")[0])})
+        created.append(json.loads(request.content))
+        req = {"id": "q", "accountId": "a", "link": "l", "description": "d", "createdAt": "2026-01-01"}
+        return httpx.Response(200, json={"request": req})
+
+    client = SwiklyClient(token="t", transport=httpx.MockTransport(handler))
+    resp = client.requests.create_reclaim_with_files(
+        account_id="a", request_id="q", target="deposit", amount=1000, reason="broken window",
+        files=[("f1.jpg", b"1"), ("f2.jpg", b"2"), ("f3.jpg", b"3")],
+    )
+
+    assert resp.request.id == "q"
+    assert created == [{"target": "deposit", "amount": 1000, "reason": "broken window", "files": ["f1", "f2", "f3"]}]
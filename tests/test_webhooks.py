@@ -1,13 +1,159 @@
+import asyncio
+import hashlib
+import hmac
+import io
+
 import pytest
-from swikly.webhooks import verify_swikly_signature
+
+from swikly import InMemoryReplayStore, WebhookProcessor
+from swikly.webhooks import WebhookReplayError, verify_many, verify_swikly_signature
+
 
 def test_verify_signature_roundtrip():
     secret = "abc"
     raw = b'{"event":"requestSecured","request":{"id":"x"}}'
     # Construct header
     ts = 1739352941
-    import hmac, hashlib
     signed = (str(ts) + ".").encode() + raw
     sig = hmac.new(secret.encode(), signed, hashlib.sha256).hexdigest()
     header = f"t={ts},sha256={sig}"
     assert verify_swikly_signature(secret=secret, signature_header=header, raw_body=raw, tolerance_seconds=10**9, now=ts)
+
+
+def _signed(secret, raw, ts=1739352941):
+    sig = hmac.new(secret.encode(), (str(ts) + ".").encode() + raw, hashlib.sha256).hexdigest()
+    return f"t={ts},sha256={sig}"
+
+
+def test_processor_accepts_any_rotating_secret_and_dispatches():
+    raw = b'{"event":"requestSecured","request":{"id":"x","accountId":"a","link":"l","description":"d","createdAt":"c"}}'
+    processor = WebhookProcessor(["old", "new"], tolerance_seconds=10**9)
+    seen = []
+    processor.on("requestSecured")(lambda e: seen.append(("secured", e.request.id)))
+    processor.on()(lambda e: seen.append(("any", e.event)))
+
+    assert processor.verify(_signed("new", raw), raw) == 1
+    event = processor.process(_signed("old", raw), raw)
+
+    assert event.request.id == "x"
+    assert seen == [("secured", "x"), ("any", "requestSecured")]
+
+
+def test_asgi_adapter_rejects_bad_signatures():
+    raw = b'{"event":"requestSecured"}'
+    processor = WebhookProcessor("abc", tolerance_seconds=10**9)
+    handled = []
+
+    @processor.on("requestSecured")
+    async def handler(event):
+        handled.append(event.event)
+
+    app = processor.asgi_app()
+
+    async def call(header):
+        sent = []
+
+        async def receive():
+            return {"type": "http.request", "body": raw, "more_body": False}
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {"type": "http", "method": "POST", "headers": [(b"swikly-signature", header.encode())]}
+        await app(scope, receive, send)
+        return sent[0]["status"]
+
+    assert asyncio.run(call(_signed("abc", raw))) == 200
+    assert asyncio.run(call(_signed("wrong", raw))) == 400
+    assert handled == ["requestSecured"]
+
+
+def test_replay_store_rejects_second_delivery_and_forgets_failed_ones():
+    raw = b'{"event":"requestSecured"}'
+    store = InMemoryReplayStore(window_seconds=600)
+    processor = WebhookProcessor("abc", replay_store=store)
+    calls = []
+
+    @processor.on()
+    def handler(event):
+        calls.append(event.event)
+        if len(calls) == 1:
+            raise RuntimeError("downstream down")
+
+    with pytest.raises(RuntimeError):
+        processor.process(_signed("abc", raw), raw, now=1739352941)
+    processor.process(_signed("abc", raw), raw, now=1739352941)  # Swikly's retry
+    with pytest.raises(WebhookReplayError):
+        processor.process(_signed("abc", raw), raw, now=1739352941)
+
+    assert calls == ["requestSecured", "requestSecured"]
+    assert verify_swikly_signature(secret="abc", signature_header=_signed("abc", raw, ts=1739353000),
+                                   raw_body=raw, now=1739353000, replay_store=store)
+    assert not verify_swikly_signature(secret="abc", signature_header=_signed("abc", raw, ts=1739353000),
+                                       raw_body=raw, now=1739353000, replay_store=store)
+
+
+def test_dedup_key_rejects_a_retry_signed_with_a_new_timestamp():
+    raw = b'{"event":"requestSecured","request":{"id":"x","accountId":"a","link":"l","description":"d","createdAt":"c"}}'
+    now = 1739352941
+    processor = WebhookProcessor("abc", replay_store=InMemoryReplayStore(), dedup_key=lambda e: e.request.id)
+    calls = []
+    processor.on()(lambda event: calls.append(event.event))
+
+    processor.process(_signed("abc", raw, ts=now - 200), raw, now=now - 100)
+    with pytest.raises(WebhookReplayError):
+        processor.process(_signed("abc", raw, ts=now), raw, now=now)
+    with pytest.raises(WebhookReplayError):
+        processor.process(_signed("abc", raw, ts=now + 500), raw, now=now + 500)
+    assert calls == ["requestSecured"]
+
+
+def test_in_memory_replay_store_expires_with_window_and_bounds_size():
+    with pytest.raises(ValueError):
+        InMemoryReplayStore(window_seconds=60)  # shorter than the default 10 minute tolerance
+    with pytest.raises(ValueError):
+        WebhookProcessor("abc", replay_store=InMemoryReplayStore(window_seconds=60, tolerance_seconds=60))
+
+    store = InMemoryReplayStore(window_seconds=60, buckets=4, max_entries=3, tolerance_seconds=60)
+    assert store.add("a", 1000) and not store.add("a", 1000)
+    assert store.add("b", 1000 + 150)  # reuses a's slot once the window moved on
+    assert store.add("a", 1000 + 150)
+    store.add("c", 1000 + 230)
+    store.add("d", 1000 + 260)
+    assert len(store) <= 3
+
+
+@pytest.mark.parametrize("max_workers", [0, 2])
+def test_verify_many_streams_results_in_order(max_workers):
+    raw = b'{"event":"requestSecured"}'
+    deliveries = [
+        (_signed("new", raw), raw),
+        (_signed("old", raw), raw),
+        (_signed("other", raw), raw),
+        ("garbage", raw),
+        (_signed("new", raw, ts=1), raw),
+    ] * 3
+    results = list(verify_many(["new", "old"], deliveries, now=1739352941, max_workers=max_workers))
+    assert results == [True, True, False, False, False] * 3
+
+
+def test_wsgi_adapter_blames_only_the_delivery_for_400s():
+    raw = b'{"event":"requestSecured"}'
+    processor = WebhookProcessor("abc", tolerance_seconds=10**9)
+
+    @processor.on()
+    def handler(event):
+        raise ValueError("bug in application code")
+
+    app = processor.wsgi_app()
+
+    def call(length, header):
+        statuses = []
+        environ = {"REQUEST_METHOD": "POST", "CONTENT_LENGTH": length, "HTTP_SWIKLY_SIGNATURE": header,
+                   "wsgi.input": io.BytesIO(raw)}
+        app(environ, lambda status, headers: statuses.append(status))
+        return statuses[0]
+
+    assert call(str(len(raw)), _signed("abc", raw)) == "500 Internal Server Error"
+    assert call("not-a-number", _signed("abc", raw)) == "400 Bad Request"
+    assert call(str(len(raw)), _signed("wrong", raw)) == "400 Bad Request"